@@ -5,6 +5,7 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from .cache import ExecutionCache, ReproductionSetupCache
 from .engine import ExecutionEngine
 from .config import ExecutionEngineFilesConfig, ExecutionEngineServicesConfig
 
@@ -14,4 +15,7 @@ __all__ = (
     # Engine configurations
     "ExecutionEngineFilesConfig",
     "ExecutionEngineServicesConfig",
+    # Execution results and reproduction setups caches
+    "ExecutionCache",
+    "ReproductionSetupCache",
 )
@@ -0,0 +1,560 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Execution results and reproduction setup caches."""
+
+import os
+import time
+import fcntl
+import pickle
+import shutil
+import sqlite3
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from tempfile import mkdtemp
+from typing import Dict, Iterator, Union
+
+from storm_hasher import StormHasher
+
+from ..helper.cache import FileHashCache
+from ..helper.hasher import hash_files
+from ..reprozip import reprounzip_destroy, reprounzip_reset, reprounzip_setup
+
+EXECUTION_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS executions (
+    command_checksum TEXT NOT NULL,
+    environment_fingerprint TEXT NOT NULL,
+    result BLOB NOT NULL,
+    PRIMARY KEY (command_checksum, environment_fingerprint)
+);
+"""
+"""Execution cache database schema."""
+
+REPRODUCTION_SETUP_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS setups (
+    name TEXT PRIMARY KEY,
+    package_checksum TEXT NOT NULL,
+    unpacker TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+"""
+"""Reproduction setup cache database schema."""
+
+
+class ExecutionCache:
+    """Execution results cache.
+
+    This cache stores the results (compendium package and metadata) of the
+    executed jobs, identified by the command checksum and a fingerprint of
+    the execution environment. Since the input files of a command are only
+    known after its execution (by the tracing), the recorded inputs are used
+    to validate an entry: a cached result is only reused when all its input
+    and output files (and the compendium package) are unchanged.
+
+    Note:
+        The cache is saved in a local SQLite file. Only the file path is pickled,
+        so the cache can be shared with the graph executor workers.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initializer.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite file. The file is created if not exists.
+        """
+        self._path = Path(path)
+
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def __getstate__(self):
+        """Return the state used to pickle the cache (the connection is not pickled)."""
+        return {"_path": self._path}
+
+    def __setstate__(self, state):
+        """Restore the cache from a pickled state."""
+        self.__init__(state["_path"])
+
+    @property
+    def path(self) -> Path:
+        """SQLite file path."""
+        return self._path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection (created on the first use)."""
+        with self._lock:
+            if self._connection is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+
+                self._connection = sqlite3.connect(
+                    str(self._path), check_same_thread=False
+                )
+                self._connection.executescript(EXECUTION_CACHE_SCHEMA)
+
+            return self._connection
+
+    @staticmethod
+    def environment_fingerprint(command, files_config) -> str:
+        """Create the fingerprint of the environment where a command is executed.
+
+        The fingerprint is composed of the command executable (resolved path, size and
+        modification time), the working directory and the files checksum algorithm.
+
+        Args:
+            command (ExecutableCommand): Command to be executed.
+
+            files_config (ExecutionEngineFilesConfig): Execution engine files definitions.
+
+        Returns:
+            str: The environment fingerprint.
+        """
+        executable = shutil.which(command.binary_executor) or command.binary_executor
+
+        executable_stat = None
+        if os.path.isfile(executable):
+            stat = os.stat(executable)
+            executable_stat = (stat.st_size, stat.st_mtime_ns)
+
+        fingerprint = (
+            os.path.realpath(executable),
+            executable_stat,
+            files_config.working_directory,
+            files_config.files_checksum_algorithm,
+        )
+
+        return StormHasher("sha256").hash_command(repr(fingerprint))
+
+    @staticmethod
+    def _is_valid(result: Dict, hash_cache: FileHashCache = None) -> bool:
+        """Check if the files of a cached result are unchanged.
+
+        Args:
+            result (Dict): Cached result.
+
+            hash_cache (FileHashCache): Cache of the files checksum.
+
+        Returns:
+            bool: True if the compendium package and all input and output files have the
+            recorded checksums.
+        """
+        metadata = result["metadata"]
+        files = [
+            result["compendium_package"],
+            *metadata.get("inputs", []),
+            *metadata.get("outputs", []),
+        ]
+
+        if not all(Path(file["key"]).is_file() for file in files):
+            return False
+
+        # the files are grouped by algorithm to be hashed in batches.
+        files_by_algorithm = {}
+        for file in files:
+            files_by_algorithm.setdefault(file["algorithm"], []).append(file)
+
+        for algorithm, algorithm_files in files_by_algorithm.items():
+            current_checksums = hash_files(
+                [file["key"] for file in algorithm_files], algorithm, hash_cache
+            )
+
+            if any(
+                current_checksum["checksum"] != file["checksum"]
+                for current_checksum, file in zip(current_checksums, algorithm_files)
+            ):
+                return False
+
+        return True
+
+    def get(
+        self,
+        command_checksum: str,
+        environment_fingerprint: str,
+        hash_cache: FileHashCache = None,
+    ) -> Dict:
+        """Get a valid cached result.
+
+        Args:
+            command_checksum (str): Checksum of the executed command.
+
+            environment_fingerprint (str): Fingerprint of the execution environment.
+
+            hash_cache (FileHashCache): Cache of the files checksum (used to validate the result files).
+
+        Returns:
+            Dict: The cached result (``execution_id``, ``compendium_package``, ``metadata`` and
+            ``environment_description_data``) or None when there is no valid result.
+        """
+        with self._lock:
+            result = self.connection.execute(
+                "SELECT result FROM executions "
+                "WHERE command_checksum = ? AND environment_fingerprint = ?",
+                (command_checksum, environment_fingerprint),
+            ).fetchone()
+
+        if result:
+            result = pickle.loads(result[0])
+
+            if self._is_valid(result, hash_cache):
+                return result
+        return None
+
+    def put(
+        self, command_checksum: str, environment_fingerprint: str, result: Dict
+    ) -> None:
+        """Save the result of an execution.
+
+        Args:
+            command_checksum (str): Checksum of the executed command.
+
+            environment_fingerprint (str): Fingerprint of the execution environment.
+
+            result (Dict): Execution result (``execution_id``, ``compendium_package``, ``metadata`` and
+            ``environment_description_data``).
+        """
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO executions "
+                "(command_checksum, environment_fingerprint, result) VALUES (?, ?, ?)",
+                (command_checksum, environment_fingerprint, pickle.dumps(result)),
+            )
+
+    def clear(self) -> None:
+        """Remove all cached results."""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM executions")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+class ReproductionSetupCache:
+    """Cache of reprounzip setups.
+
+    The ``reprounzip setup`` of a compendium package (e.g., the build of the docker
+    image) is expensive. This cache keeps the set-up reproduction directories,
+    identified by the package checksum and the unpacker, so the reproductions of an
+    unchanged package reuse them. Before each reuse, the reproduction is reset
+    (``reprounzip reset``) and its original configuration file is restored.
+
+    When the cache is larger than the disk budget, the least recently used setups
+    are removed (``reprounzip destroy``).
+
+    Note:
+        A setup is locked (with a file lock) while used, so it is not removed or shared
+        by other reproductions (including reproductions in other processes). When the
+        setup of a package is locked, a temporary (not cached) setup is used.
+
+    Note:
+        The setup size is the size of its directory. Resources stored by the unpacker
+        outside of this directory (e.g., docker images) are not considered.
+    """
+
+    def __init__(self, path: Union[str, Path], max_size: int = None):
+        """Initializer.
+
+        Args:
+            path (Union[str, Path]): Directory where the setups are stored. The directory is created if not exists.
+
+            max_size (int): Disk budget (in bytes) of the cache. When ``None``, the setups are never evicted.
+        """
+        self._path = Path(path)
+        self._max_size = max_size
+
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def __getstate__(self):
+        """Return the state used to pickle the cache (the connection is not pickled)."""
+        return {"_path": self._path, "_max_size": self._max_size}
+
+    def __setstate__(self, state):
+        """Restore the cache from a pickled state."""
+        self.__init__(state["_path"], state["_max_size"])
+
+    @property
+    def path(self) -> Path:
+        """Cache directory."""
+        return self._path
+
+    @property
+    def max_size(self) -> int:
+        """Disk budget (in bytes) of the cache."""
+        return self._max_size
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection (created on the first use)."""
+        with self._lock:
+            if self._connection is None:
+                self._path.mkdir(parents=True, exist_ok=True)
+
+                self._connection = sqlite3.connect(
+                    str(self._path / "setups.sqlite"),
+                    check_same_thread=False,
+                    timeout=30,
+                )
+                self._connection.executescript(REPRODUCTION_SETUP_CACHE_SCHEMA)
+
+            return self._connection
+
+    @property
+    def size(self) -> int:
+        """Total size (in bytes) of the cached setups."""
+        with self._lock:
+            return self.connection.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM setups"
+            ).fetchone()[0]
+
+    @staticmethod
+    def _directory_size(directory: Path) -> int:
+        """Get the size (in bytes) of the files in a directory."""
+        size = 0
+        for root, _, files in os.walk(directory):
+            for file in files:
+                file_path = os.path.join(root, file)
+
+                if not os.path.islink(file_path):
+                    size += os.path.getsize(file_path)
+        return size
+
+    @staticmethod
+    def _try_lock(lock_file: Path):
+        """Try to lock a setup (without blocking).
+
+        Args:
+            lock_file (Path): Lock file of the setup.
+
+        Returns:
+            The locked file object or None if the setup is already locked.
+        """
+        lock_file_obj = open(lock_file, "a")
+
+        try:
+            fcntl.flock(lock_file_obj, fcntl.LOCK_EX | fcntl.LOCK_NB)
+
+            # the lock file may be removed (with its setup) while it is being locked.
+            if os.fstat(lock_file_obj.fileno()).st_ino != os.stat(lock_file).st_ino:
+                raise OSError("The setup was removed.")
+        except OSError:
+            lock_file_obj.close()
+            return None
+        return lock_file_obj
+
+    @staticmethod
+    def _unlock(lock_file_obj) -> None:
+        """Unlock a setup."""
+        fcntl.flock(lock_file_obj, fcntl.LOCK_UN)
+        lock_file_obj.close()
+
+    @staticmethod
+    @contextmanager
+    def temporary_setup(package_path: str, unpacker: str = "docker") -> Iterator[str]:
+        """Set up a compendium package in a temporary (not cached) directory.
+
+        Args:
+            package_path (str): Path to the `.rpz` file.
+
+            unpacker (str): Used Reprounzip unpacker.
+
+        Returns:
+            Iterator[str]: Context manager that provides the reproduction path. On exit, the reproduction
+            is destroyed (``reprounzip destroy``) and the temporary directory is removed.
+        """
+        temporary_directory = mkdtemp()
+        reproduction_path = os.path.join(temporary_directory, "reproduction")
+
+        try:
+            reprounzip_setup(package_path, reproduction_path, unpacker)
+
+            yield reproduction_path
+        finally:
+            if os.path.exists(reproduction_path):
+                try:
+                    reprounzip_destroy(reproduction_path, unpacker)
+                except Exception:
+                    # the files are removed even if the unpacker fails.
+                    pass
+
+            shutil.rmtree(temporary_directory, ignore_errors=True)
+
+    def _remove(self, name: str, unpacker: str) -> None:
+        """Remove a setup (the setup must be locked)."""
+        setup_directory = self._path / name
+        reproduction_path = setup_directory / "reproduction"
+
+        if reproduction_path.exists():
+            try:
+                reprounzip_destroy(str(reproduction_path), unpacker)
+            except Exception:
+                # the files are removed even if the unpacker fails.
+                pass
+
+        shutil.rmtree(setup_directory, ignore_errors=True)
+
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM setups WHERE name = ?", (name,))
+
+    def _remove_lock_file(self, name: str) -> None:
+        """Remove the lock file of a removed setup (the setup must be locked)."""
+        try:
+            os.remove(self._path / f"{name}.lock")
+        except FileNotFoundError:
+            pass
+
+    def _evict(self) -> None:
+        """Remove the least recently used (and not locked) setups until the cache fits in the disk budget."""
+        if self._max_size is None:
+            return
+
+        with self._lock:
+            setups = self.connection.execute(
+                "SELECT name, unpacker, size FROM setups ORDER BY last_used"
+            ).fetchall()
+
+        cache_size = sum(setup[2] for setup in setups)
+        for name, unpacker, size in setups:
+            if cache_size <= self._max_size:
+                break
+
+            lock_file_obj = self._try_lock(self._path / f"{name}.lock")
+            if lock_file_obj is None:
+                continue  # in use
+
+            try:
+                self._remove(name, unpacker)
+                self._remove_lock_file(name)
+
+                cache_size -= size
+            finally:
+                self._unlock(lock_file_obj)
+
+    def _prepare(
+        self, name: str, package_path: str, package_checksum: str, unpacker: str
+    ) -> str:
+        """Reuse (or create) a setup (the setup must be locked).
+
+        Returns:
+            str: The reproduction path.
+        """
+        setup_directory = self._path / name
+
+        reproduction_path = setup_directory / "reproduction"
+        reproduction_config = reproduction_path / "config.yml"
+        original_config = setup_directory / "config.yml"
+
+        with self._lock:
+            is_cached = self.connection.execute(
+                "SELECT 1 FROM setups WHERE name = ?", (name,)
+            ).fetchone()
+
+        if is_cached and reproduction_path.is_dir() and original_config.is_file():
+            try:
+                reprounzip_reset(str(reproduction_path), unpacker)
+                shutil.copyfile(original_config, reproduction_config)
+
+                return str(reproduction_path)
+            except Exception:
+                # the setup is not valid anymore, so it is created again.
+                pass
+
+        self._remove(name, unpacker)
+        setup_directory.mkdir(parents=True)
+
+        reprounzip_setup(package_path, str(reproduction_path), unpacker)
+        shutil.copyfile(reproduction_config, original_config)
+
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO setups "
+                "(name, package_checksum, unpacker, size, last_used) VALUES (?, ?, ?, ?, ?)",
+                (
+                    name,
+                    package_checksum,
+                    unpacker,
+                    self._directory_size(setup_directory),
+                    time.time(),
+                ),
+            )
+        return str(reproduction_path)
+
+    @contextmanager
+    def setup(
+        self, package_path: str, package_checksum: str, unpacker: str = "docker"
+    ) -> Iterator[str]:
+        """Get a set-up reproduction of a compendium package.
+
+        Args:
+            package_path (str): Path to the `.rpz` file.
+
+            package_checksum (str): Checksum of the `.rpz` file (used to identify the setup).
+
+            unpacker (str): Used Reprounzip unpacker.
+
+        Returns:
+            Iterator[str]: Context manager that provides the reproduction path. The setup is locked
+            while the context is active.
+        """
+        name = f"{unpacker}-{package_checksum}"
+
+        self._path.mkdir(parents=True, exist_ok=True)
+        lock_file_obj = self._try_lock(self._path / f"{name}.lock")
+
+        if lock_file_obj is None:
+            # the setup is in use, so a temporary setup is created.
+            with self.temporary_setup(package_path, unpacker) as reproduction_path:
+                yield reproduction_path
+            return
+
+        try:
+            yield self._prepare(name, package_path, package_checksum, unpacker)
+
+            with self._lock, self.connection as connection:
+                connection.execute(
+                    "UPDATE setups SET last_used = ? WHERE name = ?",
+                    (time.time(), name),
+                )
+        finally:
+            self._unlock(lock_file_obj)
+
+        self._evict()
+
+    def clear(self) -> None:
+        """Remove all (not locked) setups."""
+        with self._lock:
+            setups = self.connection.execute(
+                "SELECT name, unpacker FROM setups"
+            ).fetchall()
+
+        for name, unpacker in setups:
+            lock_file_obj = self._try_lock(self._path / f"{name}.lock")
+
+            if lock_file_obj is not None:
+                try:
+                    self._remove(name, unpacker)
+                    self._remove_lock_file(name)
+                finally:
+                    self._unlock(lock_file_obj)
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__ = (
+    "ExecutionCache",
+    "ReproductionSetupCache",
+)
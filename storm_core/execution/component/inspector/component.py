@@ -33,6 +33,9 @@ class InspectorComponent(ABC):
             states (dict): Dict with the execution engine states.
 
             files_config (ExecutionEngineFilesConfig): Execution engine files definitions.
+
+            bundle_config (ReproZipBundleConfig): ReproZip configuration of the job bundle (shared
+            by the components of the job).
         """
         pass
 
@@ -48,6 +51,9 @@ class InspectorComponent(ABC):
             states (dict): Dict with the execution engine states.
 
             files_config (ExecutionEngineFilesConfig): Execution engine files definitions.
+
+            bundle_config (ReproZipBundleConfig): ReproZip configuration of the job bundle (shared
+            by the components of the job).
         """
         pass
 
@@ -64,15 +70,19 @@ class InspectorFileRemoverComponent(InspectorComponent):
     ):
         """Inspect and change the compendium data files."""
         previous_outputs = states["previous_outputs"]
-        data_directories = files_config.data_objects
+        data_directories = files_config.data_objects_matcher
 
-        execution_compendium_path = job_result.environment_description_data
+        # the bundle configuration shared by the job components (if available).
+        execution_compendium = (
+            kwargs.get("bundle_config") or job_result.environment_description_data
+        )
 
         files_not_packaged = filter_reprozip_config_files(
-            execution_compendium_path,
+            execution_compendium,
             data_directories,
             previous_outputs,
             checksum_algorithm=files_config.files_checksum_algorithm,
+            hash_cache=files_config.files_hash_cache,
         )
         return {"unpacked_files": files_not_packaged}
 
@@ -81,10 +91,12 @@ class InspectorFileRemoverComponent(InspectorComponent):
     ):
         """Inspect and change the compendium environment variables."""
 
-        execution_compendium_path = job_result.environment_description_data
+        execution_compendium = (
+            kwargs.get("bundle_config") or job_result.environment_description_data
+        )
         ignored_environment_variables = files_config.ignored_environment_variables
 
         unpacked_env = reprozip_remove_environment_variables(
-            execution_compendium_path, ignored_environment_variables
+            execution_compendium, ignored_environment_variables
         )
         return {"unpacked_environment_variables": unpacked_env}
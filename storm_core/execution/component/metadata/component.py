@@ -7,7 +7,7 @@
 
 from abc import ABC, abstractmethod
 
-from ....helper.hasher import hash_file
+from ....helper.hasher import hash_files
 from ....reprozip import reprozip_execution_metadata
 
 
@@ -33,6 +33,9 @@ class MetadataComponent(ABC):
             states (dict): Dict with the execution engine states.
 
             files_config (ExecutionEngineFilesConfig): Execution engine files definitions.
+
+            bundle_config (ReproZipBundleConfig): ReproZip configuration of the job bundle (shared
+            by the components of the job).
         """
         pass
 
@@ -47,17 +50,21 @@ class FileChecksumMetadataComponent(MetadataComponent):
     def do_metadata(self, job_result=None, states=None, files_config=None, **kwargs):
         """Extract metadata from the Job Execution related objects and files."""
         hasher_algorithm = files_config.files_checksum_algorithm
+        hash_cache = files_config.files_hash_cache
         working_directory = files_config.working_directory
-        ignored_data_objects = files_config.ignored_data_objects
+        ignored_data_objects = files_config.ignored_data_objects_matcher
 
-        execution_compendium_path = job_result.environment_description_data
+        execution_compendium = (
+            kwargs.get("bundle_config") or job_result.environment_description_data
+        )
 
         package_metadata = reprozip_execution_metadata(
-            execution_compendium_path, working_directory, ignored_data_objects
+            execution_compendium, working_directory, ignored_data_objects
         )
 
         result = {"inputs": [], "outputs": []}
         for file_type in result.keys():
-            for file in package_metadata[file_type]:
-                result[file_type].append(hash_file(file, hasher_algorithm))
+            result[file_type] = hash_files(
+                package_metadata[file_type], hasher_algorithm, hash_cache
+            )
         return result
@@ -8,9 +8,12 @@
 """Execution engine configurations."""
 
 from pathlib import Path
+from types import MappingProxyType
 from typing import List, Union, Dict
 
 from .executor.backend.base import GraphExecutor
+from ..helper.cache import FileHashCache
+from ..helper.matcher import PatternMatcher
 
 
 class ExecutionEngineServicesConfig:
@@ -61,6 +64,7 @@ class ExecutionEngineFilesConfig:
         ignored_data_objects: Dict[str, str] = None,
         ignored_environment_variables: List[str] = None,
         files_checksum_algorithm: str = "md5",
+        files_hash_cache: FileHashCache = None,
     ):
         """Initializer.
 
@@ -104,6 +108,10 @@ class ExecutionEngineFilesConfig:
             files_checksum_algorithm (str): Checksum algorithm used to identify the files (default md5). This
             implementation is provided by the ``Storm Hasher``.
 
+            files_hash_cache (FileHashCache): Persistent cache of the files checksum. When defined, files that
+            were not changed since they were hashed (same stat fingerprint) are not read again. Use ``None``
+            (default) to always read the files.
+
         Note:
             The ``working_directory`` argument is used to filter system files used by the
             scripts to process the data. For example, when the ``working_directory`` is
@@ -130,7 +138,18 @@ class ExecutionEngineFilesConfig:
         self._data_objects = data_objects or {}
         self._ignored_data_objects = ignored_data_objects or {}
 
+        # the patterns are compiled once and reused by all jobs.
+        self._data_objects_matcher = PatternMatcher(
+            data_object["pattern"]
+            for data_object in self._data_objects.values()
+            if data_object.get("action") == "exclude"
+        )
+        self._ignored_data_objects_matcher = PatternMatcher(
+            self._ignored_data_objects.values()
+        )
+
         self._files_checksum_algorithm = files_checksum_algorithm
+        self._files_hash_cache = files_hash_cache
         self._ignored_environment_variables = ignored_environment_variables or []
 
         # creating the defined directories
@@ -150,19 +169,34 @@ class ExecutionEngineFilesConfig:
     @property
     def data_objects(self):
         """Data objects added/excluded to/from the compendia."""
-        return self._data_objects
+        return MappingProxyType(self._data_objects)
+
+    @property
+    def data_objects_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the data objects excluded from the compendia."""
+        return self._data_objects_matcher
 
     @property
     def files_checksum_algorithm(self):
         """Execution engine checksum algorithm."""
         return self._files_checksum_algorithm
 
+    @property
+    def files_hash_cache(self) -> FileHashCache:
+        """Execution engine files checksum cache."""
+        return self._files_hash_cache
+
     @property
     def ignored_data_objects(self):
         """Execution engine ignored data objects."""
-        return self._ignored_data_objects
+        return MappingProxyType(self._ignored_data_objects)
+
+    @property
+    def ignored_data_objects_matcher(self) -> PatternMatcher:
+        """Compiled matcher of the execution engine ignored data objects."""
+        return self._ignored_data_objects_matcher
 
     @property
     def ignored_environment_variables(self):
         """Execution engine ignored environment variables."""
-        return self._ignored_environment_variables
+        return tuple(self._ignored_environment_variables)
@@ -9,8 +9,9 @@ from copy import deepcopy
 from typing import Dict, List, Callable
 
 from ..helper.hasher import hash_file
-from ..reprozip import reprozip_pack_execution
+from ..reprozip import ReproZipBundleConfig, reprozip_pack_execution
 
+from .cache import ExecutionCache, ReproductionSetupCache
 from .plan import ExecutionPlan
 from .component.inspector.inspector import Inspector
 from .component.metadata.builder import MetadataBuilder
@@ -19,6 +20,7 @@ from .component.decorator import pass_component_executor
 from .job import (
     ReproducibleJob,
     JobResult,
+    JobStatus,
 )
 
 from .config import (
@@ -42,6 +44,8 @@ class ExecutionEngine:
         files_config: ExecutionEngineFilesConfig,
         inspector: Inspector = None,
         builder: MetadataBuilder = None,
+        execution_cache: ExecutionCache = None,
+        setup_cache: ReproductionSetupCache = None,
     ):
         """Initializer.
 
@@ -54,6 +58,14 @@ class ExecutionEngine:
 
             builder (MetadataBuilder): Component executor to build the execution metadata from the Job Results metadata
             and the reproducible bundle files.
+
+            execution_cache (ExecutionCache): Cache of execution results. When defined, a job whose command was already
+            executed (in the same environment) with unchanged input and output files is not executed again: the cached
+            compendium package and metadata are reused.
+
+            setup_cache (ReproductionSetupCache): Cache of reprounzip setups. When defined, the reproductions of an
+            unchanged compendium package reuse its setup (e.g., the docker image), instead of unpacking the package
+            again.
         """
         self._files_config = files_config
         self._services_config = services_config
@@ -62,10 +74,13 @@ class ExecutionEngine:
         self._builder = builder
         self._inspector = inspector
 
+        self._execution_cache = execution_cache
+        self._setup_cache = setup_cache
+
     @property
     def files_config(self):
         """Execution engine files configurations."""
-        return deepcopy(self._files_config)  # "read-only"
+        return self._files_config  # "read-only" (only properties are exposed)
 
     @property
     def services_config(self):
@@ -92,23 +107,55 @@ class ExecutionEngine:
             # configuring the job
             job.output_directory = self._files_config.storage_dir
 
+            # checking if the job result is cached
+            if self._execution_cache:
+                environment_fingerprint = ExecutionCache.environment_fingerprint(
+                    job.command, self._files_config
+                )
+
+                cached_result = self._execution_cache.get(
+                    job.command.checksum,
+                    environment_fingerprint,
+                    hash_cache=self._files_config.files_hash_cache,
+                )
+
+                if cached_result:
+                    # the cached execution id is kept, since the compendium
+                    # package is stored in the directory of this execution.
+                    return JobResult(
+                        cached_result["execution_id"],
+                        JobStatus.SUCCESSFULLY,
+                        "Reused from the execution cache!",
+                        cached_result["environment_description_data"],
+                        job.command,
+                        compendium_package=cached_result["compendium_package"],
+                        metadata=cached_result["metadata"],
+                        reused=True,
+                    )
+
             # executing
             job_result = job.submit()
 
+            # the bundle configuration is loaded once and shared by all components.
+            bundle_config = ReproZipBundleConfig(
+                job_result.environment_description_data
+            )
+
             # inspecting the files, environment variables
             # and other things from the execution result.
             inspected_files = self._inspector.run_components(
                 states=states,
                 job_result=job_result,
                 files_config=self._files_config,
+                bundle_config=bundle_config,
             )
 
-            # packing the files
-            package_file = reprozip_pack_execution(
-                job_result.environment_description_data
-            )
+            # packing the files (the bundle configuration changes are saved here)
+            package_file = reprozip_pack_execution(bundle_config)
             package_file = hash_file(
-                package_file, self._files_config.files_checksum_algorithm
+                package_file,
+                self._files_config.files_checksum_algorithm,
+                self._files_config.files_hash_cache,
             )
 
             # generating the full execution metadata
@@ -116,6 +163,7 @@ class ExecutionEngine:
                 states=states,
                 job_result=job_result,
                 files_config=self._files_config,
+                bundle_config=bundle_config,
             )
 
             # adding removed files to the metadata
@@ -126,6 +174,18 @@ class ExecutionEngine:
                 **{"compendium_package": package_file, "metadata": metadata},
             }
 
+            if self._execution_cache and not job_result.has_error:
+                self._execution_cache.put(
+                    job.command.checksum,
+                    environment_fingerprint,
+                    {
+                        "execution_id": job_result.execution_id,
+                        "compendium_package": package_file,
+                        "metadata": metadata,
+                        "environment_description_data": job_result.environment_description_data,
+                    },
+                )
+
             return job_result
 
         return _wrapper
@@ -170,6 +230,7 @@ class ExecutionEngine:
         execution_plan: ExecutionPlan,
         required_data_objects: Dict = None,
         required_environment_variables: List[str] = None,
+        scrub: bool = False,
     ) -> List[JobResult]:
         """Reproduce each of the operations of the execution graph in an isolated environment.
 
@@ -200,6 +261,10 @@ class ExecutionEngine:
             required_environment_variables (List[str]): List of environment variables that should be added on the
             experiment environment before reproduction.
 
+            scrub (bool): Flag indicating if the compendia packages are fully verified before the reproduction. By
+            default, the verification of a package is skipped when it was already verified and its stat fingerprint
+            (device, inode, size and modification time) is unchanged.
+
         Returns:
             None: The reproduction result will be saved on the current directory.
         """
@@ -209,5 +274,8 @@ class ExecutionEngine:
             fnc_options=dict(
                 required_data_objects=required_data_objects or {},
                 required_environment_variables=required_environment_variables or [],
+                files_hash_cache=self._files_config.files_hash_cache,
+                scrub=scrub,
+                setup_cache=self._setup_cache,
             ),
         )
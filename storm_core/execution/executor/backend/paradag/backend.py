@@ -153,11 +153,13 @@ class ParadagBackend(GraphExecutor):
             DAG: DAG object.
         """
         # creating the execution graph
+        jobs = list(execution_plan.jobs())
+
         dag = DAG()
-        dag.add_vertex(*[v.execution_id for v in list(execution_plan.jobs())])
+        dag.add_vertex(*[job.execution_id for job in jobs])
 
         # adding the graph edges
-        for job in execution_plan.jobs():
+        for job in jobs:
             for job_predecessor in execution_plan.job_predecessors(job.execution_id):
                 dag.add_edge(job_predecessor.execution_id, job.execution_id)
 
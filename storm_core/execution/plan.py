@@ -5,6 +5,8 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from typing import Generator, List
+
 from igraph import Graph
 
 
@@ -12,26 +14,89 @@ class ExecutionPlan:
     def __init__(self, jobs: Graph):
         self._jobs = jobs
 
+        # hash index (job name -> vertex index)
+        self._jobs_index = {}
+        if "name" in self._jobs.vs.attributes():
+            self._jobs_index = {
+                name: vertex_index
+                for vertex_index, name in enumerate(self._jobs.vs["name"])
+            }
+
+        # plan structure (topological order, adjacency and waves). Since the plan
+        # graph is not changed after its creation, it is computed only once (on demand).
+        self._topological_order = None
+        self._predecessors = None
+        self._successors = None
+        self._waves = None
+
+    def _build_structure(self) -> None:
+        """Compute the plan structure (topological order, adjacency and waves) once."""
+        if self._topological_order is not None:
+            return
+
+        self._topological_order = self._jobs.topological_sorting()
+        self._predecessors = self._jobs.get_adjlist(mode="in")
+        self._successors = self._jobs.get_adjlist(mode="out")
+
+        # the wave of a job is the length of the longest path from a
+        # job without predecessors (all jobs in a wave are independent).
+        jobs_wave = [0] * self._jobs.vcount()
+        for vertex_index in self._topological_order:
+            jobs_wave[vertex_index] = max(
+                (jobs_wave[p] + 1 for p in self._predecessors[vertex_index]),
+                default=0,
+            )
+
+        self._waves = [[] for _ in range(max(jobs_wave, default=-1) + 1)]
+        for vertex_index in self._topological_order:
+            self._waves[jobs_wave[vertex_index]].append(vertex_index)
+
     def _index_to_job(self, vertex_index):
-        return self.job(self._jobs.vs[vertex_index]["name"])
+        return self._jobs.vs[vertex_index]["job"]
 
     def job(self, execution_id):
-        selected_job = self._jobs.vs.select(name=execution_id)
+        vertex_index = self._jobs_index.get(execution_id)
 
-        if selected_job:
-            return selected_job["job"][-1]
+        if vertex_index is not None:
+            return self._index_to_job(vertex_index)
         return None
 
     def jobs(self):
-        for vertex_index in self._jobs.topological_sorting():
+        self._build_structure()
+
+        for vertex_index in self._topological_order:
             job = self._index_to_job(vertex_index)
 
             yield job
 
     def job_predecessors(self, execution_id):
-        selected_job = self._jobs.vs.select(name=execution_id)
-        if selected_job:
-            selected_job = selected_job[-1]
+        vertex_index = self._jobs_index.get(execution_id)
+        if vertex_index is not None:
+            self._build_structure()
 
-            for job_predecessor_index in self._jobs.predecessors(selected_job):
+            for job_predecessor_index in self._predecessors[vertex_index]:
                 yield self._index_to_job(job_predecessor_index)
+
+    def job_successors(self, execution_id):
+        vertex_index = self._jobs_index.get(execution_id)
+        if vertex_index is not None:
+            self._build_structure()
+
+            for job_successor_index in self._successors[vertex_index]:
+                yield self._index_to_job(job_successor_index)
+
+    def wavefronts(self) -> Generator[List, None, None]:
+        """Iterate over the execution waves of the plan.
+
+        A wave is a group of independent jobs: all predecessors of the jobs of a
+        wave are in the previous waves. So, the jobs of a wave can be scheduled
+        together, as soon as the previous waves are done.
+
+        Returns:
+            Generator[List[Job], None, None]: A generator with the jobs of each wave
+            (in the execution order).
+        """
+        self._build_structure()
+
+        for wave in self._waves:
+            yield [self._index_to_job(vertex_index) for vertex_index in wave]
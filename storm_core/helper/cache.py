@@ -0,0 +1,317 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""File checksum cache."""
+
+import os
+import sqlite3
+import threading
+import time
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+FILE_HASH_CACHE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT NOT NULL,
+    algorithm TEXT NOT NULL,
+    device INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    checksum TEXT NOT NULL,
+    PRIMARY KEY (path, algorithm)
+);
+"""
+"""File hash cache database schema."""
+
+RACY_INTERVAL_NS = 2_000_000_000
+"""Files modified less than this interval (in nanoseconds) before being hashed are not cached."""
+
+
+class BaseFileHashCache(ABC):
+    """Base class of the file checksum caches.
+
+    Each checksum is stored with the stat fingerprint of the file (device, inode,
+    size and modification time) at the moment it was hashed. A cached checksum
+    is only returned while the current fingerprint of the file is the same.
+
+    Note:
+        To avoid caching a checksum of a file that is still being written (and
+        may change without changing its fingerprint, because of the timestamps
+        resolution), files modified too recently are not cached ("racy" files).
+    """
+
+    @staticmethod
+    def fingerprint(file_path: Union[str, Path]) -> Tuple[int, int, int, int]:
+        """Create the stat fingerprint of a file.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+        Returns:
+            Tuple[int, int, int, int]: Device, inode, size and modification time (in nanoseconds) of the file.
+        """
+        stat = os.stat(file_path)
+        return stat.st_dev, stat.st_ino, stat.st_size, stat.st_mtime_ns
+
+    @classmethod
+    def _current_fingerprint(
+        cls, file_path: Union[str, Path]
+    ) -> Tuple[int, int, int, int]:
+        """Get the fingerprint of a file (or None when the file is not available)."""
+        try:
+            return cls.fingerprint(file_path)
+        except OSError:
+            return None
+
+    @classmethod
+    def _is_cacheable(
+        cls, file_path: Union[str, Path], fingerprint: Tuple[int, int, int, int]
+    ) -> bool:
+        """Check if the checksum of a file can be cached.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+            fingerprint (Tuple[int, int, int, int]): Fingerprint of the file taken before the hashing.
+
+        Returns:
+            bool: False when the file was changed during the hashing or was modified too recently.
+        """
+        if cls._current_fingerprint(file_path) != fingerprint:
+            return False
+        return time.time_ns() - fingerprint[3] >= RACY_INTERVAL_NS
+
+    @abstractmethod
+    def get(self, file_path: Union[str, Path], algorithm: str) -> str:
+        """Get the cached checksum of a file.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+            algorithm (str): Algorithm used to generate the checksum.
+
+        Returns:
+            str: The cached checksum or None when there is no valid checksum for the file.
+        """
+        pass
+
+    @abstractmethod
+    def put(
+        self,
+        file_path: Union[str, Path],
+        algorithm: str,
+        checksum: str,
+        fingerprint: Tuple[int, int, int, int],
+    ) -> bool:
+        """Cache the checksum of a file.
+
+        Args:
+            file_path (Union[str, Path]): File path.
+
+            algorithm (str): Algorithm used to generate the checksum.
+
+            checksum (str): File checksum.
+
+            fingerprint (Tuple[int, int, int, int]): Fingerprint of the file taken before the hashing
+            (See ``BaseFileHashCache.fingerprint``).
+
+        Returns:
+            bool: True if the checksum was cached.
+        """
+        pass
+
+
+class InMemoryFileHashCache(BaseFileHashCache):
+    """In-memory cache of file checksums.
+
+    This cache is only valid in the current process. It can be used when
+    no persistent cache is defined, e.g., to avoid verifying the same file
+    many times in a single operation.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self._lock = threading.Lock()
+        self._entries: Dict[Tuple[str, str], Tuple[Tuple[int, int, int, int], str]] = {}
+
+    def __getstate__(self):
+        """Return the state used to pickle the cache (the entries are not pickled)."""
+        return {}
+
+    def __setstate__(self, state):
+        """Restore the cache from a pickled state."""
+        self.__init__()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, file_path: Union[str, Path], algorithm: str) -> str:
+        """Get the cached checksum of a file.
+
+        See:
+            ``BaseFileHashCache.get`` for the arguments description.
+        """
+        with self._lock:
+            entry = self._entries.get((os.path.abspath(file_path), algorithm))
+
+        if entry and entry[0] == self._current_fingerprint(file_path):
+            return entry[1]
+        return None
+
+    def put(
+        self,
+        file_path: Union[str, Path],
+        algorithm: str,
+        checksum: str,
+        fingerprint: Tuple[int, int, int, int],
+    ) -> bool:
+        """Cache the checksum of a file.
+
+        See:
+            ``BaseFileHashCache.put`` for the arguments description.
+        """
+        if not self._is_cacheable(file_path, fingerprint):
+            return False
+
+        with self._lock:
+            self._entries[(os.path.abspath(file_path), algorithm)] = (
+                fingerprint,
+                checksum,
+            )
+        return True
+
+    def clear(self) -> None:
+        """Remove all cached checksums."""
+        with self._lock:
+            self._entries.clear()
+
+
+class FileHashCache(BaseFileHashCache):
+    """Persistent cache of file checksums.
+
+    See:
+        ``BaseFileHashCache`` for the cache validation rules.
+
+    Note:
+        The cache is saved in a local SQLite file. Only the file path is pickled,
+        so the cache can be shared with the graph executor workers.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initializer.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite file. The file is created if not exists.
+        """
+        self._path = Path(path)
+
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def __getstate__(self):
+        """Return the state used to pickle the cache (the connection is not pickled)."""
+        return {"_path": self._path}
+
+    def __setstate__(self, state):
+        """Restore the cache from a pickled state."""
+        self.__init__(state["_path"])
+
+    @property
+    def path(self) -> Path:
+        """SQLite file path."""
+        return self._path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection (created on the first use)."""
+        with self._lock:
+            if self._connection is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+
+                self._connection = sqlite3.connect(
+                    str(self._path), check_same_thread=False, timeout=30
+                )
+                self._connection.executescript(FILE_HASH_CACHE_SCHEMA)
+
+            return self._connection
+
+    def get(self, file_path: Union[str, Path], algorithm: str) -> str:
+        """Get the cached checksum of a file.
+
+        See:
+            ``BaseFileHashCache.get`` for the arguments description.
+        """
+        fingerprint = self._current_fingerprint(file_path)
+        if fingerprint is None:
+            return None
+
+        with self._lock:
+            result = self.connection.execute(
+                "SELECT device, inode, size, mtime_ns, checksum FROM files "
+                "WHERE path = ? AND algorithm = ?",
+                (os.path.abspath(file_path), algorithm),
+            ).fetchone()
+
+        if result and tuple(result[:4]) == fingerprint:
+            return result[4]
+        return None
+
+    def put(
+        self,
+        file_path: Union[str, Path],
+        algorithm: str,
+        checksum: str,
+        fingerprint: Tuple[int, int, int, int],
+    ) -> bool:
+        """Cache the checksum of a file.
+
+        See:
+            ``BaseFileHashCache.put`` for the arguments description.
+        """
+        if not self._is_cacheable(file_path, fingerprint):
+            return False
+
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "INSERT OR REPLACE INTO files "
+                "(path, algorithm, device, inode, size, mtime_ns, checksum) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (os.path.abspath(file_path), algorithm, *fingerprint, checksum),
+            )
+        return True
+
+    def discard(self, file_path: Union[str, Path]) -> None:
+        """Remove the cached checksums of a file (if exists).
+
+        Args:
+            file_path (Union[str, Path]): File path.
+        """
+        with self._lock, self.connection as connection:
+            connection.execute(
+                "DELETE FROM files WHERE path = ?", (os.path.abspath(file_path),)
+            )
+
+    def clear(self) -> None:
+        """Remove all cached checksums."""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM files")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__ = (
+    "BaseFileHashCache",
+    "FileHashCache",
+    "InMemoryFileHashCache",
+)
@@ -5,22 +5,133 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from typing import Union
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable, List, Union
 from pathlib import Path
 
 from storm_hasher import StormHasher
 
+from .cache import BaseFileHashCache
+from .merkle import hash_file_tree, is_merkle_algorithm
 
-def hash_file(file_path: Union[str, Path], algorithm: str = "md5"):
-    hash_digest = StormHasher(algorithm).hash_file(file_path)
+
+def hash_file(
+    file_path: Union[str, Path],
+    algorithm: str = "md5",
+    cache: BaseFileHashCache = None,
+    verify: bool = False,
+    workers: int = None,
+):
+    """Generate the checksum of a file.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        algorithm (str): Checksum algorithm (provided by the ``Storm Hasher``). Tree hash algorithms
+        (e.g., ``merkle-sha256``) are also supported (See ``storm_core.helper.merkle``).
+
+        cache (BaseFileHashCache): Cache of file checksums. When defined, the checksum of an unchanged
+        file (same stat fingerprint) is reused, and the new checksums are saved in the cache.
+
+        verify (bool): Flag indicating if the file must be read even when there is a cached checksum
+        (the cache is updated with the new checksum).
+
+        workers (int): Maximum number of threads used to hash the chunks of the file in the tree hash
+        algorithms (See ``hash_file_tree``).
+
+    Returns:
+        Dict: The file checksum definition (``key``, ``algorithm`` and ``checksum``).
+    """
+    hash_digest = None
+
+    if cache is not None and not verify:
+        hash_digest = cache.get(file_path, algorithm)
+
+    if hash_digest is None:
+        fingerprint = cache.fingerprint(file_path) if cache is not None else None
+        if is_merkle_algorithm(algorithm):
+            hash_digest = hash_file_tree(file_path, algorithm, workers=workers)[
+                "checksum"
+            ]
+        else:
+            hash_digest = StormHasher(algorithm).hash_file(file_path)
+
+        if cache is not None:
+            cache.put(file_path, algorithm, hash_digest, fingerprint)
 
     return {"key": file_path, "algorithm": algorithm, "checksum": hash_digest}
 
 
+def hash_files(
+    file_paths: Iterable[Union[str, Path]],
+    algorithm: str = "md5",
+    cache: BaseFileHashCache = None,
+    verify: bool = False,
+    workers: int = None,
+) -> List:
+    """Generate the checksum of many files concurrently.
+
+    Args:
+        file_paths (Iterable[Union[str, Path]]): Files paths.
+
+        algorithm (str): Checksum algorithm (provided by the ``Storm Hasher``).
+
+        cache (BaseFileHashCache): Cache of file checksums (See ``hash_file``).
+
+        verify (bool): Flag indicating if the files must be read even when there are cached checksums.
+
+        workers (int): Maximum number of threads used to hash the files. When ``None``, the
+        ``ThreadPoolExecutor`` default is used.
+
+    Returns:
+        List[Dict]: The files checksum definitions (See ``hash_file``), in the same order of ``file_paths``.
+
+    Note:
+        The files are hashed in threads, since the ``hashlib`` functions release the GIL
+        while processing large data blocks. When many files are hashed, the chunks of each
+        file (tree hash algorithms) are hashed in the file thread, so the ``workers`` limit
+        is kept (no threads are created by each file).
+    """
+    file_paths = list(file_paths)
+
+    if len(file_paths) <= 1 or workers == 1:
+        return [
+            hash_file(path, algorithm, cache, verify, workers) for path in file_paths
+        ]
+
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        return list(
+            executor.map(
+                lambda path: hash_file(path, algorithm, cache, verify, workers=1),
+                file_paths,
+            )
+        )
+
+
 def validate_checksum(
-    file_path: Union[str, Path], expected_checksum, algorithm: str = "md5"
+    file_path: Union[str, Path],
+    expected_checksum,
+    algorithm: str = "md5",
+    cache: BaseFileHashCache = None,
+    verify: bool = False,
 ):
-    file_hash_digest = hash_file(file_path, algorithm).get("checksum")
+    """Validate the checksum of a file.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        expected_checksum (str): Expected checksum.
+
+        algorithm (str): Checksum algorithm (provided by the ``Storm Hasher``).
+
+        cache (BaseFileHashCache): Cache of file checksums (See ``hash_file``).
+
+        verify (bool): Flag indicating if the file must be read even when there is a cached checksum.
+
+    Raises:
+        RuntimeError: When the file checksum is different from the expected checksum.
+    """
+    file_hash_digest = hash_file(file_path, algorithm, cache, verify).get("checksum")
 
     if expected_checksum != file_hash_digest:
         raise RuntimeError(f"Invalid checksum for {file_path}!")
@@ -28,5 +139,6 @@ def validate_checksum(
 
 __all__ = (
     "hash_file",
+    "hash_files",
     "validate_checksum",
 )
@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import os
+import re
+import fnmatch
+from typing import Iterable, Tuple
+
+
+class PatternMatcher:
+    """Matcher of Unix shell-style patterns (``fnmatch``).
+
+    All patterns are translated once and combined into a single regular
+    expression, so a path is checked against all patterns in one match
+    operation (instead of one ``fnmatch.fnmatch`` call for each pattern).
+
+    Note:
+        The matching rules are the same used by ``fnmatch.fnmatch`` (e.g., the
+        paths and patterns are normalized with ``os.path.normcase``).
+
+    See:
+        https://docs.python.org/3/library/fnmatch.html
+    """
+
+    def __init__(self, patterns: Iterable[str]):
+        """Initializer.
+
+        Args:
+            patterns (Iterable[str]): Unix shell-style patterns.
+        """
+        self._patterns = tuple(dict.fromkeys(patterns))
+
+        self._regex = None
+        if self._patterns:
+            self._regex = re.compile(
+                "|".join(
+                    f"(?:{fnmatch.translate(os.path.normcase(pattern))})"
+                    for pattern in self._patterns
+                )
+            )
+
+    def __len__(self):
+        return len(self._patterns)
+
+    @property
+    def patterns(self) -> Tuple[str]:
+        """Patterns used by the matcher."""
+        return self._patterns
+
+    def match(self, path: str) -> bool:
+        """Check if a path matches any of the patterns.
+
+        Args:
+            path (str): Path to be checked.
+
+        Returns:
+            bool: True if the path matches at least one pattern.
+        """
+        if self._regex is None:
+            return False
+        return self._regex.match(os.path.normcase(path)) is not None
+
+
+__all__ = "PatternMatcher"
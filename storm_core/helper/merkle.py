@@ -0,0 +1,207 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Chunked (Merkle tree) file hashing."""
+
+import os
+import mmap
+import hashlib
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Union
+
+MERKLE_ALGORITHM_PREFIX = "merkle-"
+"""Prefix of the tree hash algorithms names (e.g., ``merkle-sha256``)."""
+
+MERKLE_CHUNK_SIZE = 4 * 1024 * 1024
+"""Default size (in bytes) of the chunks hashed in the tree hash mode."""
+
+_LEAF_PREFIX = b"\x00"
+_NODE_PREFIX = b"\x01"
+
+
+def is_merkle_algorithm(algorithm: str) -> bool:
+    """Check if an algorithm name refers to the tree hash mode.
+
+    Args:
+        algorithm (str): Algorithm name.
+
+    Returns:
+        bool: True if the algorithm is a tree hash algorithm (e.g., ``merkle-sha256``).
+    """
+    return algorithm.startswith(MERKLE_ALGORITHM_PREFIX)
+
+
+def _base_algorithm(algorithm: str) -> str:
+    """Get the ``hashlib`` algorithm used by a tree hash algorithm."""
+    base_algorithm = (
+        algorithm[len(MERKLE_ALGORITHM_PREFIX) :]
+        if is_merkle_algorithm(algorithm)
+        else algorithm
+    )
+
+    if base_algorithm not in hashlib.algorithms_available:
+        raise ValueError(f"Unsupported tree hash algorithm: {algorithm}")
+    return base_algorithm
+
+
+def _hash_chunks(
+    file_path: Union[str, Path], base_algorithm: str, chunk_size: int, workers: int
+) -> List[str]:
+    """Hash the chunks of a file.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        base_algorithm (str): ``hashlib`` algorithm used to hash the chunks.
+
+        chunk_size (int): Size of the chunks (in bytes).
+
+        workers (int): Maximum number of threads used to hash the chunks.
+
+    Returns:
+        List[str]: The digest of each chunk (in the file order).
+
+    Note:
+        The file is memory mapped, and the chunks are hashed directly from the mapped memory
+        (without copies). The ``hashlib`` functions release the GIL, so the chunks are hashed
+        in parallel.
+    """
+    file_size = os.path.getsize(file_path)
+
+    if file_size == 0:
+        return [hashlib.new(base_algorithm, _LEAF_PREFIX).hexdigest()]
+
+    with open(file_path, "rb") as file, mmap.mmap(
+        file.fileno(), 0, access=mmap.ACCESS_READ
+    ) as file_map:
+        file_view = memoryview(file_map)
+
+        def _hash_chunk(offset: int) -> str:
+            chunk_hash = hashlib.new(base_algorithm, _LEAF_PREFIX)
+
+            with file_view[offset : offset + chunk_size] as chunk:
+                chunk_hash.update(chunk)
+            return chunk_hash.hexdigest()
+
+        try:
+            offsets = range(0, file_size, chunk_size)
+
+            if len(offsets) == 1 or workers == 1:
+                return [_hash_chunk(offset) for offset in offsets]
+
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                return list(executor.map(_hash_chunk, offsets))
+        finally:
+            file_view.release()
+
+
+def merkle_root(chunks: List[str], algorithm: str) -> str:
+    """Combine the chunk digests into the tree root digest.
+
+    Args:
+        chunks (List[str]): Digest of each chunk (in the file order).
+
+        algorithm (str): Tree hash algorithm (e.g., ``merkle-sha256``).
+
+    Returns:
+        str: The root digest. The nodes are hashed in pairs, and the last node of a
+        level with an odd number of nodes is promoted to the next level.
+    """
+    base_algorithm = _base_algorithm(algorithm)
+
+    level = [bytes.fromhex(chunk) for chunk in chunks]
+    while len(level) > 1:
+        next_level = [
+            hashlib.new(
+                base_algorithm, _NODE_PREFIX + level[idx] + level[idx + 1]
+            ).digest()
+            for idx in range(0, len(level) - 1, 2)
+        ]
+
+        if len(level) % 2:
+            next_level.append(level[-1])
+        level = next_level
+
+    return level[0].hex()
+
+
+def hash_file_tree(
+    file_path: Union[str, Path],
+    algorithm: str = "merkle-sha256",
+    chunk_size: int = MERKLE_CHUNK_SIZE,
+    workers: int = None,
+) -> Dict:
+    """Generate the tree hash of a file.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        algorithm (str): Tree hash algorithm: ``merkle-`` followed by a ``hashlib`` algorithm name.
+
+        chunk_size (int): Size of the chunks (in bytes). Only files hashed with the same chunk
+        size have comparable root digests.
+
+        workers (int): Maximum number of threads used to hash the chunks. When ``None``, the
+        ``ThreadPoolExecutor`` default is used.
+
+    Returns:
+        Dict: The file tree hash definition, with the ``key``, ``algorithm``, ``checksum`` (root digest),
+        ``chunk_size`` and ``chunks`` (digest of each chunk) fields. The chunk digests can be stored to
+        localize changes in the file (See ``verify_file_chunks``).
+    """
+    chunks = _hash_chunks(file_path, _base_algorithm(algorithm), chunk_size, workers)
+
+    return {
+        "key": file_path,
+        "algorithm": algorithm,
+        "checksum": merkle_root(chunks, algorithm),
+        "chunk_size": chunk_size,
+        "chunks": chunks,
+    }
+
+
+def verify_file_chunks(
+    file_path: Union[str, Path], file_tree: Dict, workers: int = None
+) -> List[int]:
+    """Find the chunks of a file that are different from a stored tree hash.
+
+    Args:
+        file_path (Union[str, Path]): File path.
+
+        file_tree (Dict): Tree hash definition of the file (See ``hash_file_tree``).
+
+        workers (int): Maximum number of threads used to hash the chunks.
+
+    Returns:
+        List[int]: Indices of the changed chunks (including the chunks added to or removed from
+        the end of the file). An empty list indicates the file is unchanged.
+    """
+    current_chunks = _hash_chunks(
+        file_path,
+        _base_algorithm(file_tree["algorithm"]),
+        file_tree["chunk_size"],
+        workers,
+    )
+    stored_chunks = file_tree["chunks"]
+
+    return [
+        idx
+        for idx in range(max(len(current_chunks), len(stored_chunks)))
+        if idx >= len(current_chunks)
+        or idx >= len(stored_chunks)
+        or current_chunks[idx] != stored_chunks[idx]
+    ]
+
+
+__all__ = (
+    "MERKLE_CHUNK_SIZE",
+    "is_merkle_algorithm",
+    "merkle_root",
+    "hash_file_tree",
+    "verify_file_chunks",
+)
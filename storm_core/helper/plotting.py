@@ -59,8 +59,8 @@ def plot_styled_indexed_executions(
     if graph_manager.is_empty:
         return None
 
-    # define label as status
-    _graph = graph_manager.graph
+    # define label as status (in a copy, since the labels are added to the graph)
+    _graph = graph_manager.graph.copy()
 
     for vertex in _graph.vs:
         vertex["label"] = vertex.index
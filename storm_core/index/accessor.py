@@ -5,7 +5,12 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from .search import IndexerQuerySearch, IndexerFacetedSearch, IndexerNeighborhoodSearch
+from .search import (
+    IndexerQuerySearch,
+    IndexerFacetedSearch,
+    IndexerNeighborhoodSearch,
+    IndexerProvenanceSearch,
+)
 
 
 class SearchAccessor:
@@ -37,3 +42,8 @@ class SearchAccessor:
     def neighborhood(self):
         """Neighborhood Query Search operations."""
         return IndexerNeighborhoodSearch(self._execution_indexer)
+
+    @property
+    def provenance(self):
+        """File Provenance Search operations."""
+        return IndexerProvenanceSearch(self._execution_indexer)
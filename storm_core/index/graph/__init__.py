@@ -5,13 +5,36 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
+from .cache import VertexDataCache
+from .checksum import ChecksumTable
+
 from .manager import (
     VertexStatus,
     GraphManager,
 )
 
+from .reachability import ReachabilityIndex
+
+from .view import (
+    GraphView,
+    GraphManagerView,
+    VertexView,
+    VertexSeqView,
+    EdgeView,
+    EdgeSeqView,
+)
+
 
 __all__ = (
     "VertexStatus",
     "GraphManager",
+    "GraphView",
+    "GraphManagerView",
+    "VertexView",
+    "VertexSeqView",
+    "EdgeView",
+    "EdgeSeqView",
+    "ChecksumTable",
+    "ReachabilityIndex",
+    "VertexDataCache",
 )
@@ -0,0 +1,71 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from typing import Any, Callable, Dict, Tuple
+
+
+class VertexDataCache:
+    """Cache of data derived from the execution graph vertices.
+
+    Each entry is bound to the revision of its vertex (See
+    ``GraphManager.vertex_revision``). When the vertex changes,
+    the entry is no longer returned.
+    """
+
+    def __init__(self, vertex_revision: Callable[[str], int]):
+        """Initializer.
+
+        Args:
+            vertex_revision (Callable[[str], int]): Function that returns the current revision of a vertex.
+        """
+        self._vertex_revision = vertex_revision
+        self._entries: Dict[str, Tuple[int, Any]] = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, name: str, default=None):
+        """Get the cached data of a vertex.
+
+        Args:
+            name (str): Vertex name.
+
+            default: Value returned when there is no valid entry for the vertex.
+
+        Returns:
+            object: The cached data (or ``default``).
+        """
+        entry = self._entries.get(name)
+
+        if entry is not None and entry[0] == self._vertex_revision(name):
+            return entry[1]
+        return default
+
+    def set(self, name: str, value) -> None:
+        """Cache the data of a vertex (in its current revision).
+
+        Args:
+            name (str): Vertex name.
+
+            value (object): Data to be cached.
+        """
+        self._entries[name] = (self._vertex_revision(name), value)
+
+    def discard(self, name: str) -> None:
+        """Remove the cached data of a vertex (if exists).
+
+        Args:
+            name (str): Vertex name.
+        """
+        self._entries.pop(name, None)
+
+    def clear(self) -> None:
+        """Remove all cached data."""
+        self._entries.clear()
+
+
+__all__ = "VertexDataCache"
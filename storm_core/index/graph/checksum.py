@@ -0,0 +1,103 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from array import array
+from typing import Dict, Iterable, List
+
+CHECKSUM_ARRAY_TYPECODE = "q"
+"""Typecode of the arrays used to store the interned checksums."""
+
+
+class ChecksumTable:
+    """Checksum interning table.
+
+    Each distinct checksum (a long hex string) is mapped to a small integer
+    identifier, so the vertices of the execution graph can store their files
+    as compact integer arrays. The identifiers are stable: once defined, a
+    checksum keeps its identifier for the whole life of the table.
+    """
+
+    def __init__(self):
+        """Initializer."""
+        self._ids: Dict[str, int] = {}
+        self._checksums: List[str] = []
+
+    def __len__(self):
+        return len(self._checksums)
+
+    def __contains__(self, checksum):
+        return checksum in self._ids
+
+    def intern(self, checksum: str) -> int:
+        """Get the identifier of a checksum (defining it if required).
+
+        Args:
+            checksum (str): Checksum to be interned.
+
+        Returns:
+            int: The checksum identifier.
+        """
+        checksum_id = self._ids.get(checksum)
+
+        if checksum_id is None:
+            checksum_id = len(self._checksums)
+
+            self._ids[checksum] = checksum_id
+            self._checksums.append(checksum)
+
+        return checksum_id
+
+    def intern_many(self, checksums: Iterable[str]) -> array:
+        """Get the identifiers of many checksums (defining them if required).
+
+        Args:
+            checksums (Iterable[str]): Checksums to be interned.
+
+        Returns:
+            array: Array with the checksums identifiers (in the same order).
+        """
+        return array(
+            CHECKSUM_ARRAY_TYPECODE, [self.intern(checksum) for checksum in checksums]
+        )
+
+    def get(self, checksum: str, default=None):
+        """Get the identifier of a checksum without defining it.
+
+        Args:
+            checksum (str): Checksum to be searched.
+
+            default: Value returned when the checksum is not interned.
+
+        Returns:
+            int: The checksum identifier (or ``default``).
+        """
+        return self._ids.get(checksum, default)
+
+    def resolve(self, checksum_id: int) -> str:
+        """Get the checksum of an identifier.
+
+        Args:
+            checksum_id (int): Checksum identifier.
+
+        Returns:
+            str: The checksum.
+        """
+        return self._checksums[checksum_id]
+
+    def resolve_many(self, checksum_ids: Iterable[int]) -> List[str]:
+        """Get the checksums of many identifiers.
+
+        Args:
+            checksum_ids (Iterable[int]): Checksums identifiers.
+
+        Returns:
+            List[str]: The checksums (in the same order).
+        """
+        return [self._checksums[checksum_id] for checksum_id in checksum_ids]
+
+
+__all__ = "ChecksumTable"
@@ -7,17 +7,29 @@
 
 import copy
 import itertools
+from array import array
+from collections import defaultdict, deque
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Union
+from pathlib import Path
+from typing import Dict, Iterable, List, Set, Tuple, Union
 
 from dictdiffer import diff
-from igraph import Graph, VertexSeq
+from igraph import Graph
 
 from storm_hasher import StormHasher
 
-# FixMe: Workaround to enable neighbor deletion in igraph
-# https://igraph.org/python/doc/api/igraph._igraph.GraphBase.html#neighborhood
-MAX_IGRAPH_ORDER = 10000
+from .cache import VertexDataCache
+from .checksum import ChecksumTable
+from .reachability import ReachabilityIndex
+from .storage import GraphStorage
+from .view import GraphView, VertexSeqView
+
+INDEXED_ATTRIBUTES = ("name", "command_checksum", "status")
+"""Vertex attributes with a hash index (attribute value -> vertices) in the Graph Manager."""
+
+FILES_ATTRIBUTES = ("inputs", "outputs", "external_inputs_required")
+"""Vertex attributes with files checksums (stored as arrays of interned checksums identifiers)."""
 
 
 class VertexStatus:
@@ -33,37 +45,217 @@ class GraphManager(object):
     This class is responsible to manage graph to create `Research Pipelines`.
     """
 
-    def __init__(self, graph: Graph = None, checksum_algorithm: str = "sha256"):
-        """Create Execution Graph Manager."""
-        self._graph = graph or Graph(directed=True)
+    def __init__(
+        self,
+        graph: Graph = None,
+        checksum_algorithm: str = "sha256",
+        storage: GraphStorage = None,
+        checksum_table: ChecksumTable = None,
+    ):
+        """Create Execution Graph Manager.
+
+        Args:
+            graph (igraph.Graph): Initial execution graph.
+
+            checksum_algorithm (str): Checksum algorithm used by the manager.
+
+            storage (GraphStorage): Storage used to persist the execution graph. When defined without
+            a ``graph``, the execution graph is loaded from the storage. When both are defined, the
+            storage content is replaced by the ``graph``. All mutations are written to the storage.
+
+            checksum_table (ChecksumTable): Table used to intern the files checksums of the vertices. It
+            is required when the ``graph`` files are already interned (e.g., a graph from another manager).
+
+        Note:
+            The files (``inputs``, ``outputs`` and ``external_inputs_required``) of the vertices are stored
+            as arrays of integer identifiers (See ``ChecksumTable``). Use the ``decode_checksums`` method to
+            get the checksums of a vertex.
+        """
+        self._storage = storage
+        self._checksum_table = checksum_table or ChecksumTable()
+
+        if storage is not None and graph is None:
+            self._graph = storage.load()
+        else:
+            self._graph = graph or Graph(directed=True)
+
         self._hasher = StormHasher(checksum_algorithm)
 
+        self._intern_vertices_files()
+
+        # inverted indexes (file checksum -> vertices names) used
+        # to derive the edges of the execution graph.
+        self._producers = defaultdict(set)
+        self._consumers = defaultdict(set)
+
+        # inverted index (input file path -> vertices names and recorded checksums). The paths
+        # are only available in the vertices metadata (which can be lazily loaded), so this
+        # index is created on demand and then updated with the checksum indexes.
+        self._input_paths = None
+
+        for vertex in self._graph.vs:
+            self._index_vertex_files(vertex)
+
+        # hash indexes (attribute value -> vertices indices) used
+        # to search the vertices by its key attributes.
+        self._attributes_index = {}
+        self._build_attributes_index()
+
+        # reachability index (created on demand and discarded when the graph structure changes).
+        self._reachability = None
+
+        # edges (names of the source and target vertices) not created in the graph yet, registered
+        # for both endpoints. The edges are created together, before the graph structure is used.
+        self._pending_edges = defaultdict(set)
+
+        # batch control: the derived state (outdated vertices and required inputs)
+        # of the changed vertices (names) is only defined when the batch is committed.
+        # The outdated vertices are mapped to their reference dates (``None`` to use
+        # the vertex ``updated_in``).
+        self._batch_depth = 0
+        self._pending_outdated_vertices = {}
+        self._pending_required_inputs_vertices = set()
+
+        # change control: version of the graph and revision (graph version of the
+        # last change) of each vertex. Used by clients to cache data derived from vertices.
+        self._version = 0
+        self._vertices_revision = {}
+        self._vertices_cache = VertexDataCache(self.vertex_revision)
+
+        # storage control: vertices (names) changed since the last write.
+        self._changed_vertices = set()
+        self._deleted_vertices = set()
+        self._linked_vertices = set()
+
+        if storage is not None and graph is not None:
+            storage.clear()
+
+            self._changed_vertices.update(
+                self._graph.vs["name"] if self._graph.vs else []
+            )
+            self._linked_vertices.update(self._changed_vertices)
+            self._persist()
+
+    def __getstate__(self):
+        """Return the state used to pickle the execution graph manager.
+
+        Note:
+            The indexes are derived from the graph. So, they are not persisted
+            and are recreated when the object is loaded. Also, the storage is not
+            persisted (the loaded object is detached from the storage).
+        """
+        self._flush_edges()
+
+        return {
+            "_graph": self._graph,
+            "_hasher": self._hasher,
+            "_checksum_table": self._checksum_table,
+        }
+
+    def __setstate__(self, state):
+        """Restore the execution graph manager from a pickled state."""
+        self.__init__(
+            state["_graph"],
+            state["_hasher"].algorithm,
+            checksum_table=state.get("_checksum_table"),
+        )
+
     def __copy__(self):
-        """Create a copy instance of the execution graph manager."""
-        return GraphManager(self._graph, self._hasher.algorithm)
+        """Create a copy instance of the execution graph manager.
+
+        Note:
+            The graph is copied (the indexes of the copy are built from its own graph), so
+            changes in one manager are not visible in the other one. The checksum table is
+            shared, since it only grows (the interned checksums are kept).
+        """
+        self._flush_edges()
+
+        return GraphManager(
+            self._graph.copy(),
+            self._hasher.algorithm,
+            checksum_table=self._checksum_table,
+        )
 
     def __deepcopy__(self, memodict={}):
         """Create a deepcopy instance of the execution graph manager."""
-        return GraphManager(self.graph, self._hasher.algorithm)
+        self._flush_edges()
+
+        return GraphManager(
+            copy.deepcopy(self._graph),
+            self._hasher.algorithm,
+            checksum_table=copy.deepcopy(self._checksum_table),
+        )
 
     @property
-    def graph(self) -> Graph:
-        """Return the execution graph in a `igraph.Graph` object."""
-        return copy.deepcopy(self._graph)
+    def graph(self) -> GraphView:
+        """Return a read-only view of the execution graph.
+
+        Note:
+            The view shares the graph with the manager. To get a mutable
+            `igraph.Graph` object, use the `GraphView.copy` method.
+        """
+        self._flush_edges()
+
+        return GraphView(self._graph)
+
+    @property
+    def vertices(self) -> VertexSeqView:
+        """Return a read-only view of the vertices of the execution graph.
+
+        Note:
+            The vertices are shared with the manager, so its attributes can not be changed.
+        """
+        self._flush_edges()
+
+        return VertexSeqView(self._graph.vs)
 
     @property
-    def vertices(self) -> VertexSeq:
-        """Return the vertices of the execution graph in a `igraph.VertexSeq` object."""
-        return self.graph.vs
+    def version(self) -> int:
+        """Return the version of the execution graph (incremented on every change)."""
+        return self._version
+
+    @property
+    def vertices_cache(self) -> VertexDataCache:
+        """Return the cache of data derived from the vertices (e.g., materialized compendia).
+
+        Note:
+            The cache is not persisted with the manager.
+        """
+        return self._vertices_cache
+
+    def vertex_revision(self, name: str) -> int:
+        """Return the revision of a vertex.
+
+        The revision is the graph version of the last change of the vertex attributes. So,
+        data derived from a vertex (e.g., an ``ExecutionCompendium``) can be reused while
+        the vertex revision is the same.
+
+        Args:
+            name (str): Vertex name.
+
+        Returns:
+            int: The vertex revision (0 when the vertex was not changed by the manager).
+        """
+        return self._vertices_revision.get(name, 0)
+
+    @property
+    def reachability(self) -> ReachabilityIndex:
+        """Return the reachability index of the execution graph.
+
+        Note:
+            The index is created on the first use and reused until vertices
+            or edges are changed (updates that keep the vertex edges, e.g., of
+            metadata or of files consumed by the same vertices, keep the index).
+        """
+        if self._reachability is None:
+            self._flush_edges()
+            self._reachability = ReachabilityIndex(self._graph)
+        return self._reachability
 
     @property
     def is_outdated(self) -> bool:
         """Return a flag indicating whether or not there are `outdated` vertices."""
-        return (
-            len(self._graph.vs.select(status=VertexStatus.Outdated)) > 0
-            if self._graph
-            else False
-        )
+        return len(self._attributes_index["status"].get(VertexStatus.Outdated, ())) > 0
 
     @property
     def is_empty(self) -> bool:
@@ -73,21 +265,121 @@ class GraphManager(object):
     @property
     def inputs(self) -> List:
         """Return vertices inputs."""
-        return (
-            list(itertools.chain(*self._graph.vs["inputs"]))
-            if not self.is_empty
-            else []
-        )
+        return self.decode_checksums(self._consumers.keys())
 
     @property
     def outputs(self) -> List:
         """Return vertices outputs."""
-        return (
-            list(itertools.chain(*self._graph.vs["outputs"]))
-            if not self.is_empty
-            else []
+        return self.decode_checksums(self._producers.keys())
+
+    def outdated_vertices(self) -> VertexSeqView:
+        """Return the `outdated` vertices in topological order.
+
+        Note:
+            The vertices are selected using the status index, without traversing the whole graph.
+        """
+        outdated_vertices = self._attributes_index["status"].get(
+            VertexStatus.Outdated, ()
+        )
+
+        return VertexSeqView(
+            self._graph.vs.select(self.reachability.topological_sort(outdated_vertices))
         )
 
+    def _files_vertices(
+        self, index: Dict[int, Set[str]], checksums: Iterable[str]
+    ) -> Dict[str, VertexSeqView]:
+        """Get the vertices registered for the given files in a checksum index.
+
+        Args:
+            index (Dict[int, Set[str]]): Checksum index (producers or consumers).
+
+            checksums (Iterable[str]): Files checksums.
+
+        Returns:
+            Dict[str, VertexSeqView]: The vertices of each file checksum.
+        """
+        self._flush_edges()
+
+        files_vertices = {}
+
+        for checksum in checksums:
+            vertices_names = index.get(self._checksum_table.get(checksum), ())
+
+            files_vertices[checksum] = VertexSeqView(
+                self._graph.vs.select(sorted(self._vertices_by_names(vertices_names)))
+            )
+        return files_vertices
+
+    def file_producers(self, checksums: Iterable[str]) -> Dict[str, VertexSeqView]:
+        """Return the vertices that produce (as output) the given files.
+
+        Args:
+            checksums (Iterable[str]): Files checksums.
+
+        Returns:
+            Dict[str, VertexSeqView]: The producer vertices of each file checksum (empty when
+            the file is not produced by the indexed executions).
+        """
+        return self._files_vertices(self._producers, checksums)
+
+    def file_consumers(self, checksums: Iterable[str]) -> Dict[str, VertexSeqView]:
+        """Return the vertices that consume (as input) the given files.
+
+        Args:
+            checksums (Iterable[str]): Files checksums.
+
+        Returns:
+            Dict[str, VertexSeqView]: The consumer vertices of each file checksum (empty when
+            the file is not used by the indexed executions).
+        """
+        return self._files_vertices(self._consumers, checksums)
+
+    def path_consumers(
+        self, paths: Iterable[Union[str, Path]]
+    ) -> Dict[Path, List[Tuple[int, str, str]]]:
+        """Return the vertices that used the given files (by path) as input.
+
+        Args:
+            paths (Iterable[Union[str, Path]]): Files paths.
+
+        Returns:
+            Dict[Path, List[Tuple[int, str, str]]]: For each file (resolved) path, the index of the consumer vertices
+            with the file checksum and algorithm recorded in the vertex inputs (the algorithm is None when not recorded).
+
+        Note:
+            In the first use, the inputs metadata of all vertices is read to create the path index. Then, the
+            index is updated together with the vertices.
+        """
+        if self._input_paths is None:
+            self._input_paths = defaultdict(dict)
+
+            for vertex in self._graph.vs:
+                self._index_vertex_input_paths(vertex)
+
+        name_index = self._attributes_index["name"]
+
+        paths_consumers = {}
+        for path in paths:
+            path = Path(path).resolve()
+
+            paths_consumers[path] = [
+                (max(name_index[name]), *file_checksum)
+                for name, file_checksum in self._input_paths.get(path, {}).items()
+            ]
+        return paths_consumers
+
+    def decode_checksums(self, checksum_ids: Iterable[int]) -> List[str]:
+        """Get the files checksums from its interned identifiers.
+
+        Args:
+            checksum_ids (Iterable[int]): Checksums identifiers (e.g., the ``inputs`` of a vertex).
+
+        Returns:
+            List[str]: The files checksums (in the same order).
+        """
+        return self._checksum_table.resolve_many(checksum_ids)
+
     def search_vertex(self, **kwargs):
         """Search graph vertices.
 
@@ -95,12 +387,30 @@ class GraphManager(object):
             kwargs: Attributes and values to be search.
 
         Returns:
-            VertexSeq: Sequence of found vertex.
+            VertexSeqView: Read-only sequence of found vertex (an empty list when the graph is empty).
+        """
+        self._flush_edges()
+
+        search_result = self._search_vertex(**kwargs)
+        if not self._graph.vs:
+            return search_result
+        return VertexSeqView(search_result)
+
+    def _search_vertex(self, **kwargs):
+        """Search graph vertices (without creating the pending edges).
+
+        See:
+            ``GraphManager.search_vertex`` for the arguments description.
         """
         search_result = []
 
         if self._graph.vs:
-            search_result = self._graph.vs.select(**kwargs)
+            selected_vertices = self._search_attributes_index(**kwargs)
+
+            if selected_vertices is not None:
+                search_result = self._graph.vs.select(sorted(selected_vertices))
+            else:
+                search_result = self._graph.vs.select(**kwargs)
         return search_result
 
     def to_frame(self, dim="vertex") -> "pandas.core.frame.DataFrame":
@@ -116,68 +426,601 @@ class GraphManager(object):
         if dim not in ("vertex", "edge"):
             raise RuntimeError("`dim` must be `vertex` or `edge`.")
 
+        self._flush_edges()
+
         # introspecting to retrieve operation
         frame_op = getattr(self._graph, f"get_{dim}_dataframe")
-        return frame_op()
+        frame = frame_op()
+
+        if dim == "vertex":
+            for attribute in FILES_ATTRIBUTES:
+                if attribute in frame:
+                    frame[attribute] = frame[attribute].map(self.decode_checksums)
+        return frame
+
+    def _intern_vertices_files(self) -> None:
+        """Intern the files checksums of the vertices not interned yet (e.g., loaded from a storage).
+
+        Returns:
+            None: The graph instance is inplace updated.
+        """
+        for vertex in self._graph.vs:
+            vertex_attributes = vertex.attributes()
 
-    def _define_vertices_required_inputs(self) -> None:
+            for attribute in FILES_ATTRIBUTES:
+                files = vertex_attributes.get(attribute) or []
+
+                if not isinstance(files, array):
+                    vertex[attribute] = self._checksum_table.intern_many(files)
+
+    def _define_vertices_required_inputs(self, vertices: Iterable[int] = None) -> None:
         """Define the vertices required input files.
 
         A file is considered required when it is not generated by one of the nodes preceding the analyzed node.
         Necessary files are also considered to be those that are not in the execution compendium.
+
+        Args:
+            vertices (Iterable[int]): Indices of the vertices to be (re)defined. Since the required inputs of a
+            vertex only depend on its predecessors, after a mutation only the mutated vertex and its direct
+            successors need to be defined. If not defined, all vertices are (re)defined (e.g., to check the
+            graph consistency).
+
+        Returns:
+            None: The graph instance is inplace updated.
         """
-        for vertex in self._graph.vs:
+        vertices = (
+            self._graph.vs
+            if vertices is None
+            else self._graph.vs.select(list(vertices))
+        )
+
+        for vertex in vertices:
             # retrieving all possible inputs for the current vertex.
-            possible_inputs = list(
+            possible_inputs = set(
                 itertools.chain(*[x["outputs"] for x in vertex.neighbors(mode="in")])
             )
 
             # checking which inputs are already defined.
             difference = set(vertex["inputs"]).difference(possible_inputs)
 
-            # update vertex
-            vertex["external_inputs_required"] = list(difference)
+            # update vertex (only if the required inputs changed)
+            if set(vertex["external_inputs_required"]) != difference:
+                vertex["external_inputs_required"] = array(
+                    vertex["inputs"].typecode, sorted(difference)
+                )
+                self._mark_vertex_changed(vertex["name"])
 
-    def _define_who_vertex_is_outdated(self, vertex, reference_date) -> None:
-        """Define who vertex is outdated.
+    def _build_attributes_index(self) -> None:
+        """Create the hash indexes of the vertices key attributes.
+
+        Returns:
+            None: The indexes are inplace created.
+        """
+        self._attributes_index = {
+            attribute: defaultdict(set) for attribute in INDEXED_ATTRIBUTES
+        }
+
+        for vertex in self._graph.vs:
+            self._index_vertex_attributes(vertex)
+
+    def _index_vertex_attributes(self, vertex) -> None:
+        """Register the vertex key attributes in the hash indexes.
 
-        A vertex is considered out of date if its last update date is less than the `reference_date`.
         Args:
-            vertex (igraph.Vertex): The vertex where the verification starts.
+            vertex (igraph.Vertex): The vertex to be indexed.
+        """
+        for attribute in INDEXED_ATTRIBUTES:
+            self._attributes_index[attribute][vertex[attribute]].add(vertex.index)
+
+    def _search_attributes_index(self, **kwargs):
+        """Search vertices using the hash indexes.
 
-            reference_date (datetime): The reference date that will be used to determine if vertex is outdated.
+        Args:
+            kwargs: Attributes and values to be search.
+
+        Returns:
+            Union[Set[int], None]: Indices of the found vertices. If the search
+            can not be solved with the hash indexes (e.g., igraph predicates as
+            ``name_in``), returns None.
+        """
+        if not kwargs or not all(
+            attribute in self._attributes_index for attribute in kwargs
+        ):
+            return None
+
+        try:
+            return set.intersection(
+                *[
+                    self._attributes_index[attribute].get(value, set())
+                    for attribute, value in kwargs.items()
+                ]
+            )
+        except TypeError:  # unhashable values
+            return None
+
+    def _vertex_by_name(self, name: str):
+        """Get a vertex by its name using the hash index.
+
+        Args:
+            name (str): Vertex name.
+
+        Returns:
+            igraph.Vertex: The vertex with the given name.
+        """
+        return self._graph.vs[max(self._attributes_index["name"][name])]
+
+    def _vertices_by_names(self, names: Iterable[str]) -> List[int]:
+        """Get the indices of the existing vertices with the given names.
+
+        Args:
+            names (Iterable[str]): Vertices names.
+
+        Returns:
+            List[int]: Indices of the vertices found (names not found are ignored).
+        """
+        name_index = self._attributes_index["name"]
+
+        return [max(name_index[name]) for name in names if name_index.get(name)]
+
+    def _define_derived_state(
+        self,
+        outdated_vertices: Iterable[int],
+        required_inputs_vertices: Iterable[int],
+        detached_vertices: Iterable[int] = (),
+        reference_date: datetime = None,
+    ) -> None:
+        """Define the derived state of the changed vertices.
+
+        The derived state is composed of the `outdated` status of the changed vertices descendants and
+        the required inputs of the changed vertices (and its successors). When a batch is
+        open, the definition is postponed until the batch is committed.
+
+        Args:
+            outdated_vertices (Iterable[int]): Indices of the vertices whose descendants must be checked.
+
+            required_inputs_vertices (Iterable[int]): Indices of the vertices whose required inputs must be defined.
+
+            detached_vertices (Iterable[int]): Indices of the former successors of the changed vertices (e.g., the
+            consumers of outputs that are no longer generated). They (and its descendants) are checked using the
+            ``reference_date``, since they are not reachable from the changed vertices anymore.
+
+            reference_date (datetime): Reference date used to check the ``detached_vertices``.
+
+        Returns:
+            None: The graph instance is inplace updated.
+        """
+        for name in self._graph.vs.select(list(outdated_vertices))["name"]:
+            self._pending_outdated_vertices.setdefault(name, None)
+
+        for name in self._graph.vs.select(list(detached_vertices))["name"]:
+            pending_date = self._pending_outdated_vertices.get(name)
+
+            if pending_date is None or pending_date < reference_date:
+                self._pending_outdated_vertices[name] = reference_date
+
+        self._pending_required_inputs_vertices.update(
+            self._graph.vs.select(list(required_inputs_vertices))["name"]
+        )
+
+        if not self._batch_depth:
+            self._commit()
+
+    def _commit(self) -> None:
+        """Define the postponed derived state of the changed vertices.
+
+        Returns:
+            None: The graph instance is inplace updated.
+        """
+        self._flush_edges()
+
+        outdated_vertices = self._vertices_by_names(self._pending_outdated_vertices)
+        reference_dates = {
+            vertex_index: self._pending_outdated_vertices[name]
+            for vertex_index, name in zip(
+                outdated_vertices, self._graph.vs.select(outdated_vertices)["name"]
+            )
+            if self._pending_outdated_vertices[name] is not None
+        }
+        required_inputs_vertices = self._vertices_by_names(
+            self._pending_required_inputs_vertices
+        )
+
+        self._pending_outdated_vertices.clear()
+        self._pending_required_inputs_vertices.clear()
+
+        self._mark_descendants_outdated(
+            outdated_vertices, reference_dates=reference_dates
+        )
+        self._define_vertices_required_inputs(required_inputs_vertices)
+
+        self._persist()
+
+    def _persist(self) -> None:
+        """Write the graph mutations into the storage (if defined).
+
+        Returns:
+            None: The changed vertices and edges are written in the storage.
+        """
+        if self._storage is None or self._batch_depth:
+            return
+
+        self._flush_edges()
+
+        if not (
+            self._changed_vertices or self._deleted_vertices or self._linked_vertices
+        ):
+            return
+
+        changed_vertices = self._graph.vs.select(
+            self._vertices_by_names(self._changed_vertices)
+        )
+        linked_vertices = self._graph.vs.select(
+            self._vertices_by_names(self._linked_vertices)
+        )
+
+        edges = set()
+        for linked_vertex in linked_vertices:
+            for edge in self._graph.es.select(
+                self._graph.incident(linked_vertex, mode="all")
+            ):
+                edges.add(
+                    (
+                        self._graph.vs[edge.source]["name"],
+                        self._graph.vs[edge.target]["name"],
+                    )
+                )
+
+        # the interned checksums are only valid in the manager.
+        vertices = []
+        for vertex in changed_vertices:
+            attributes = vertex.attributes()
+
+            for attribute in FILES_ATTRIBUTES:
+                attributes[attribute] = self.decode_checksums(attributes[attribute])
+            vertices.append(attributes)
+
+        self._storage.write(
+            vertices,
+            list(self._deleted_vertices),
+            linked_vertices["name"],
+            sorted(edges),
+        )
+
+        self._changed_vertices.clear()
+        self._deleted_vertices.clear()
+        self._linked_vertices.clear()
+
+    def _mark_vertex_changed(self, name: str) -> None:
+        """Register the change of a vertex (to be written in the storage).
+
+        Args:
+            name (str): Name of the changed vertex.
+        """
+        self._version += 1
+        self._vertices_revision[name] = self._version
+
+        self._changed_vertices.add(name)
+
+    def _mark_vertex_deleted(self, name: str) -> None:
+        """Register the deletion of a vertex (to be written in the storage).
+
+        Args:
+            name (str): Name of the deleted vertex.
+        """
+        self._version += 1
+        self._vertices_revision.pop(name, None)
+        self._vertices_cache.discard(name)
+
+        self._deleted_vertices.add(name)
+        self._changed_vertices.discard(name)
+        self._linked_vertices.discard(name)
+
+    def _set_vertex_status(self, vertex, status: str) -> None:
+        """Define the status of a vertex, keeping the status index updated.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be updated.
+
+            status (str): The new status (See ``VertexStatus``).
+        """
+        status_index = self._attributes_index["status"]
+
+        status_index[vertex["status"]].discard(vertex.index)
+        status_index[status].add(vertex.index)
+
+        vertex["status"] = status
+        self._mark_vertex_changed(vertex["name"])
+
+    def _index_vertex_files(self, vertex) -> None:
+        """Register the vertex input and output files in the checksum indexes.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be indexed.
+        """
+        for checksum in vertex["inputs"]:
+            self._consumers[checksum].add(vertex["name"])
+
+        for checksum in vertex["outputs"]:
+            self._producers[checksum].add(vertex["name"])
+
+        if self._input_paths is not None:
+            self._index_vertex_input_paths(vertex)
+
+    def _index_vertex_input_paths(self, vertex) -> None:
+        """Register the vertex input files (from the metadata) in the path index.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be indexed.
+        """
+        for vertex_input in vertex["metadata"].get("inputs", []):
+            self._input_paths[Path(vertex_input["key"]).resolve()][vertex["name"]] = (
+                vertex_input["checksum"],
+                vertex_input.get("algorithm"),
+            )
+
+    def _deindex_vertex_files(self, vertex) -> None:
+        """Remove the vertex input and output files from the checksum indexes.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be removed from the indexes.
+        """
+        for index, checksums in (
+            (self._consumers, vertex["inputs"]),
+            (self._producers, vertex["outputs"]),
+        ):
+            for checksum in checksums:
+                index[checksum].discard(vertex["name"])
+
+                if not index[checksum]:
+                    del index[checksum]
+
+        if self._input_paths is not None:
+            for vertex_input in vertex["metadata"].get("inputs", []):
+                path = Path(vertex_input["key"]).resolve()
+
+                self._input_paths[path].pop(vertex["name"], None)
+                if not self._input_paths[path]:
+                    del self._input_paths[path]
+
+    def _vertex_neighbors(self, vertex) -> Tuple[Set[str], Set[str]]:
+        """Find the neighbors of a vertex using the checksum indexes.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be analyzed.
+
+        Returns:
+            Tuple[Set[str], Set[str]]: Names of the vertices that produce the vertex inputs (predecessors) and
+            of the vertices that consume the vertex outputs (successors).
+        """
+        vertex_name = vertex["name"]
+
+        predecessors = set(
+            itertools.chain(
+                *[self._producers.get(checksum, ()) for checksum in vertex["inputs"]]
+            )
+        )
+        successors = set(
+            itertools.chain(
+                *[self._consumers.get(checksum, ()) for checksum in vertex["outputs"]]
+            )
+        )
+
+        predecessors.discard(vertex_name)
+        successors.discard(vertex_name)
+
+        return predecessors, successors
+
+    def _link_vertex(self, vertex) -> Set[str]:
+        """Recreate the edges of a vertex in the execution graph.
+
+        An edge ``(v1, v2)`` exists when at least one of the ``v1`` outputs is used
+        as input by ``v2``. Only the edges involving the given vertex are changed.
+
+        Args:
+            vertex (igraph.Vertex): The vertex to be linked.
+
+        Returns:
+            Set[str]: Names of the vertex successors.
+
+        Note:
+            The new edges are registered as pending and created together (with a single
+            ``add_edges`` call) when the graph structure is used (See ``GraphManager._flush_edges``).
+            So, a batch creates all its edges at once. When the vertex edges are not changed, the
+            graph structure (and the reachability index) is kept.
+        """
+        vertex_name = vertex["name"]
+
+        # 1. Find who produces the vertex inputs and who consumes the vertex outputs
+        predecessors, successors = self._vertex_neighbors(vertex)
+
+        edges = {
+            *[(predecessor, vertex_name) for predecessor in predecessors],
+            *[(vertex_name, successor) for successor in successors],
+        }
+
+        # 2. Compare with the current vertex edges (created and pending)
+        incident_edges = self._graph.incident(vertex, mode="all")
+        current_edges = {
+            (self._graph.vs[source]["name"], self._graph.vs[target]["name"])
+            for source, target in (
+                self._graph.es[edge].tuple for edge in incident_edges
+            )
+        }
+        current_edges.update(self._pending_edges.get(vertex_name, ()))
+
+        if edges == current_edges:
+            return successors
+
+        self._linked_vertices.add(vertex_name)
+        self._reachability = None
+        self._version += 1
+
+        # 3. Remove the current vertex edges
+        if incident_edges:
+            self._graph.delete_edges(incident_edges)
+
+        for edge in self._pending_edges.pop(vertex_name, ()):
+            neighbor = edge[1] if edge[0] == vertex_name else edge[0]
+            self._pending_edges[neighbor].discard(edge)
+
+        # 4. Register the new edges
+        for edge in edges:
+            self._pending_edges[edge[0]].add(edge)
+            self._pending_edges[edge[1]].add(edge)
+
+        return successors
+
+    def _flush_edges(self) -> None:
+        """Create the pending edges in the graph.
 
         Returns:
             None: The graph instance is inplace updated.
         """
-        if vertex["updated_in"] < reference_date:
-            vertex["status"] = VertexStatus.Outdated
+        if not self._pending_edges:
+            return
+
+        edges = set(itertools.chain(*self._pending_edges.values()))
+        self._pending_edges.clear()
+
+        self._graph.add_edges(
+            [
+                (self._vertex_by_name(source).index, self._vertex_by_name(target).index)
+                for source, target in sorted(edges)
+            ]
+        )
+
+    @contextmanager
+    def batch(self):
+        """Group many mutations in a single batch.
+
+        Inside a batch, the vertices are added, updated and deleted as usual, but the
+        derived state of the graph (e.g., the `outdated` vertices and the required inputs)
+        is defined only once, when the batch is committed (at the end of the ``with`` block).
+
+        Example:
+            >>> with graph_manager.batch():
+            ...     for execution in executions:
+            ...         graph_manager.add_vertex(**execution)
+
+        Note:
+            Batches can be nested. Only the outermost batch commits the changes.
+        """
+        self._batch_depth += 1
+
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+
+            if not self._batch_depth:
+                self._commit()
+
+    def mark_descendants_outdated(
+        self, vertices: Iterable, reference_date: datetime = None
+    ) -> None:
+        """Mark the descendants of the given vertices as `outdated`.
+
+        See:
+            ``GraphManager._mark_descendants_outdated`` for the arguments description.
+        """
+        self._mark_descendants_outdated(vertices, reference_date)
+        self._persist()
+
+    def _mark_descendants_outdated(
+        self,
+        vertices: Iterable,
+        reference_date: datetime = None,
+        reference_dates: Dict[int, datetime] = None,
+    ) -> None:
+        """Mark the descendants of the given vertices as `outdated`.
+
+        A vertex is considered out of date if its last update date is less than the reference date
+        of one of its ancestors in ``vertices``. All descendants are visited only once, in a single
+        breadth-first traversal, so the operation is linear in the size of the graph.
 
-        # only use the "outgoing" edges to define the neighbors
-        for vertex_neighbor in vertex.neighbors(mode="out"):
-            self._define_who_vertex_is_outdated(vertex_neighbor, reference_date)
+        Args:
+            vertices (Iterable[Union[int, igraph.Vertex]]): The vertices (or its indices) where the
+            verification starts (e.g., the changed vertices).
 
-    def _rebuild_graph(self) -> None:
-        """Recreate the edges of the execution graph.
+            reference_date (datetime): The reference date used to determine if a vertex is outdated. If not
+            defined, the ``updated_in`` date of each vertex in ``vertices`` is used.
+
+            reference_dates (Dict[int, datetime]): Reference dates of specific vertices (by index), used when
+            ``reference_date`` is not defined.
 
         Returns:
             None: The graph instance is inplace updated.
+
+        Note:
+            The vertices with the most recent reference dates are visited first. Then, when a vertex is
+            reached again from an older vertex, it (and its descendants) can be skipped.
         """
-        if len(self._graph.vs) > 1:  # If there is more than one node in the graph
-            # rebuild the graph
+        self._flush_edges()
+
+        roots = [
+            self._graph.vs[vertex] if isinstance(vertex, int) else vertex
+            for vertex in vertices
+        ]
+        reference_dates = reference_dates or {}
+
+        roots = sorted(
+            [
+                (
+                    reference_date
+                    or reference_dates.get(root.index)
+                    or root["updated_in"],
+                    root.index,
+                )
+                for root in roots
+            ],
+            reverse=True,
+        )
 
-            # 1. Remove all edges
-            self._graph.delete_edges()
+        visited = set()
+        for root_reference_date, root_index in roots:
+            if root_index in visited:
+                continue
 
-            # 2. Rebuild edges
-            for vertex_l1 in self._graph.vs:
-                reference_outputs = set(vertex_l1["outputs"])
+            visited.add(root_index)
+            vertices_to_visit = deque([root_index])
 
-                for vertex_l2 in self._graph.vs:
+            while vertices_to_visit:
+                vertex = self._graph.vs[vertices_to_visit.popleft()]
 
-                    if vertex_l1 != vertex_l2:
-                        if not set(vertex_l2["inputs"]).isdisjoint(reference_outputs):
-                            self._graph.add_edge(vertex_l1, vertex_l2)
+                if vertex["updated_in"] < root_reference_date:
+                    self._set_vertex_status(vertex, VertexStatus.Outdated)
+
+                # only use the "outgoing" edges to define the neighbors
+                for vertex_neighbor in self._graph.successors(vertex):
+                    if vertex_neighbor not in visited:
+                        visited.add(vertex_neighbor)
+                        vertices_to_visit.append(vertex_neighbor)
+
+    def mark_vertices_updated(
+        self, names: Iterable[str], update_date: bool = False
+    ) -> None:
+        """Mark vertices as `updated` (by default, without changing their update date).
+
+        This method is used when the outdated vertices are verified as up-to-date without
+        being re-executed (e.g., their inputs were regenerated with identical content).
+
+        Args:
+            names (Iterable[str]): Names of the vertices.
+
+            update_date (bool): Flag indicating if the update date of the vertices is set to the current
+            date (e.g., when the vertices were verified after the re-execution of their predecessors). The
+            descendants of the vertices are not marked as outdated.
+
+        Returns:
+            None: The graph instance is inplace updated.
+        """
+        for vertex in self._graph.vs.select(self._vertices_by_names(names)):
+            self._set_vertex_status(vertex, VertexStatus.Updated)
+
+            if update_date:
+                vertex["updated_in"] = datetime.now()
+
+        self._persist()
 
     def add_vertex(
         self,
@@ -223,10 +1066,9 @@ class GraphManager(object):
         Note:
             If the command is already in the graph, it is only updated.
         """
-        actual_vertex = self.search_vertex(command_checksum=command_checksum)
+        actual_vertex = self._search_vertex(command_checksum=command_checksum)
 
         if actual_vertex:
-            vertex = actual_vertex[0]
             self.update_vertex(
                 name,
                 environment_package,
@@ -240,12 +1082,12 @@ class GraphManager(object):
         else:
             vertex = self._graph.add_vertex(
                 name=name,
-                inputs=inputs,
-                outputs=outputs,
+                inputs=self._checksum_table.intern_many(inputs),
+                outputs=self._checksum_table.intern_many(outputs),
                 command=command,
                 metadata=metadata,
                 updated_in=datetime.now(),
-                external_inputs_required=[],
+                external_inputs_required=self._checksum_table.intern_many([]),
                 status=VertexStatus.Updated,
                 command_config=command_config,
                 command_checksum=command_checksum,
@@ -253,11 +1095,17 @@ class GraphManager(object):
                 environment_package_checksum=environment_package_checksum,
                 environment_package_checksum_algorithm=environment_package_checksum_algorithm,
             )
+            self._reachability = None
 
-        self._rebuild_graph()
-        self._define_who_vertex_is_outdated(vertex, vertex["updated_in"])
+            self._index_vertex_files(vertex)
+            self._index_vertex_attributes(vertex)
+            successors = self._link_vertex(vertex)
 
-        self._define_vertices_required_inputs()
+            self._mark_vertex_changed(name)
+
+            self._define_derived_state(
+                [vertex.index], [vertex.index, *self._vertices_by_names(successors)]
+            )
 
     def update_vertex(
         self,
@@ -298,15 +1146,23 @@ class GraphManager(object):
             The determination of the execution already added to the graph is done based on the `command`.
             The update considers only the change of `inputs`, `outputs`, and `repropack`.
         """
-        selected_vertex = self.search_vertex(command_checksum=command_checksum)
+        selected_vertex = self._search_vertex(command_checksum=command_checksum)
         if len(selected_vertex) == 1:  # bingo!
             vertex = selected_vertex[0]
 
             # define what attribute to update
             variables = {
                 # "name": name,
-                "inputs": inputs,
-                "outputs": outputs,
+                "inputs": (
+                    self._checksum_table.intern_many(inputs)
+                    if inputs is not None
+                    else None
+                ),
+                "outputs": (
+                    self._checksum_table.intern_many(outputs)
+                    if outputs is not None
+                    else None
+                ),
                 "metadata": metadata,
                 "environment_package": environment_package,
                 "environment_package_checksum": environment_package_checksum,
@@ -326,7 +1182,12 @@ class GraphManager(object):
                 diff(vertex_attributes, variables, ignore=invalid_variables)
             )
 
+            # successors affected by the update (the old and the new ones).
+            former_successors = successors = self._vertex_neighbors(vertex)[1]
+
             if differences:  # only update attributes if there are differences
+                self._deindex_vertex_files(vertex)
+
                 vertex.update_attributes(
                     {
                         k: variables[k]
@@ -335,11 +1196,26 @@ class GraphManager(object):
                     }
                 )
 
-            vertex["status"] = VertexStatus.Updated
+                # the files may have changed, so the vertex edges are recreated.
+                self._index_vertex_files(vertex)
+                successors = self._link_vertex(vertex)
+
+            self._set_vertex_status(vertex, VertexStatus.Updated)
             vertex["updated_in"] = datetime.now()
 
-            self._define_who_vertex_is_outdated(vertex, vertex["updated_in"])
-            self._define_vertices_required_inputs()
+            self._mark_vertex_changed(vertex["name"])
+
+            # the former successors consumed the previous outputs of the vertex, so they are
+            # outdated even when they are no longer linked to it.
+            self._define_derived_state(
+                [vertex.index],
+                [
+                    vertex.index,
+                    *self._vertices_by_names(former_successors | successors),
+                ],
+                self._vertices_by_names(former_successors - successors),
+                vertex["updated_in"],
+            )
 
     def delete_vertex(self, name: str, include_neighbors: bool = True) -> None:
         """Delete a vertex from the execution graph.
@@ -354,27 +1230,36 @@ class GraphManager(object):
             None: The vertex is deleted inplace.
         """
 
-        # delete strategies
-        def _delete_vertex_only(vtx):
-            """Remove a specific vertex from the execution graph."""
-            self._graph.delete_vertices(vtx)
-
-        def _delete_neighborhood(vtx):
-            """Remove all vertices subsequent to the one being removed."""
-            neighborhood = self._graph.neighborhood(
-                vtx, mode="out", order=MAX_IGRAPH_ORDER
-            )
-
-            # deleting all vertices (including `vertex`)
-            self._graph.delete_vertices(neighborhood)
+        self._flush_edges()
 
-        selected_vertex = self.search_vertex(name=name)
+        selected_vertex = self._search_vertex(name=name)
         if len(selected_vertex) == 1:
             vertex = selected_vertex[0]
 
+            # delete strategies
+            vertices_to_delete = [vertex.index]
             if include_neighbors:
-                _delete_neighborhood(vertex)
-            else:
-                _delete_vertex_only(vertex)
-            self._rebuild_graph()
-        self._define_vertices_required_inputs()
+                # all vertices subsequent to the one being removed (including `vertex`)
+                vertices_to_delete = self.reachability.descendants([vertex.index])
+
+            # remaining successors of the removed vertices (affected by the deletion).
+            affected_vertices = set(
+                itertools.chain(
+                    *[self._graph.successors(v) for v in vertices_to_delete]
+                )
+            ).difference(vertices_to_delete)
+            affected_vertices = self._graph.vs.select(list(affected_vertices))["name"]
+
+            for vertex_to_delete in self._graph.vs.select(vertices_to_delete):
+                self._deindex_vertex_files(vertex_to_delete)
+
+                self._mark_vertex_deleted(vertex_to_delete["name"])
+
+            # the edges of the removed vertices are removed together with them.
+            self._graph.delete_vertices(vertices_to_delete)
+            self._reachability = None
+
+            # the vertices indices are changed by the deletion.
+            self._build_attributes_index()
+
+            self._define_derived_state([], self._vertices_by_names(affected_vertices))
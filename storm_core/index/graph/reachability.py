@@ -0,0 +1,286 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from collections import deque
+from typing import Dict, Iterable, List
+
+from igraph import Graph
+
+
+class ReachabilityIndex:
+    """Reachability index of an execution graph.
+
+    This index answers "all downstream" (descendants) and "all upstream"
+    (ancestors) queries for many vertices at once, without limits on the
+    path length. The adjacency lists and the topological rank of the vertices
+    are computed once (linear in the graph size, with the igraph routines).
+
+    The union of the reachable vertices (``reachable``) is found with a single
+    multi-source breadth-first traversal. The reachable vertices of each one
+    of many vertices (``reachable_sets``) are found with the same traversal,
+    and then with a transitive closure of the traversed subgraph, memoized
+    during the query (in a DAG, each vertex closure is computed once from the
+    closures of its neighbors and released when no longer required).
+
+    Note:
+        The index is a snapshot of the graph structure. It must be recreated
+        when vertices or edges are changed (See ``GraphManager.reachability``).
+    """
+
+    def __init__(self, graph: Graph):
+        """Initializer.
+
+        Args:
+            graph (igraph.Graph): Graph to be indexed.
+        """
+        self._vcount = graph.vcount()
+
+        self._adjacency = {
+            "out": graph.get_adjlist(mode="out"),
+            "in": graph.get_adjlist(mode="in"),
+        }
+
+        self._is_dag = graph.is_dag()
+        self._rank = list(range(self._vcount))
+
+        if self._is_dag:
+            for rank, vertex_index in enumerate(graph.topological_sorting(mode="out")):
+                self._rank[vertex_index] = rank
+
+        # lazy structures (weak components)
+        self._components = None
+
+    def _traverse(
+        self,
+        vertices: List[int],
+        adjacency: List[List[int]],
+        max_rank: int = None,
+    ) -> List[int]:
+        """Multi-source breadth-first traversal.
+
+        Args:
+            vertices (List[int]): Source vertices.
+
+            adjacency (List[List[int]]): Adjacency list used in the traversal.
+
+            max_rank (int): When defined, the vertices with a greater topological rank are
+            not visited (DAG only, used to prune the ``out`` traversals).
+
+        Returns:
+            List[int]: The visited vertices (in the visit order).
+        """
+        visited = set(vertices)
+        visit_order = list(dict.fromkeys(vertices))
+        vertices_to_visit = deque(visit_order)
+
+        while vertices_to_visit:
+            for neighbor_index in adjacency[vertices_to_visit.popleft()]:
+                if max_rank is not None and self._rank[neighbor_index] > max_rank:
+                    continue
+
+                if neighbor_index not in visited:
+                    visited.add(neighbor_index)
+                    visit_order.append(neighbor_index)
+                    vertices_to_visit.append(neighbor_index)
+
+        return visit_order
+
+    def _weak_components(self) -> List[int]:
+        """Get the weakly connected component of each vertex."""
+        if self._components is None:
+            undirected_adjacency = [
+                [*self._adjacency["out"][v], *self._adjacency["in"][v]]
+                for v in range(self._vcount)
+            ]
+
+            self._components = [None] * self._vcount
+            for vertex_index in range(self._vcount):
+                if self._components[vertex_index] is None:
+                    for component_vertex in self._traverse(
+                        [vertex_index], undirected_adjacency
+                    ):
+                        self._components[component_vertex] = vertex_index
+
+        return self._components
+
+    def reachable(self, vertices: Iterable[int], mode: str = "out") -> List[int]:
+        """Get all vertices reachable from the given vertices (including them).
+
+        Args:
+            vertices (Iterable[int]): Indices of the source vertices.
+
+            mode (str): Direction of the paths: ``out`` (descendants), ``in`` (ancestors) or
+            ``all`` (vertices connected by paths ignoring the edges direction).
+
+        Returns:
+            List[int]: Indices of the reachable vertices. For ``out``, the vertices are in topological
+            order; for ``in``, in reverse topological order (so, a single source vertex is always the
+            first one). For ``all``, the source vertices are the first ones.
+        """
+        vertices = list(vertices)
+
+        if mode == "all":
+            components = self._weak_components()
+            vertices_components = {components[v] for v in vertices}
+
+            return list(
+                dict.fromkeys(
+                    [
+                        *vertices,
+                        *[
+                            v
+                            for v in range(self._vcount)
+                            if components[v] in vertices_components
+                        ],
+                    ]
+                )
+            )
+
+        if mode not in self._adjacency:
+            raise ValueError("`mode` must be `out`, `in` or `all`.")
+
+        reachable_vertices = self._traverse(vertices, self._adjacency[mode])
+
+        if not self._is_dag:
+            return reachable_vertices
+
+        return sorted(
+            reachable_vertices,
+            key=self._rank.__getitem__,
+            reverse=(mode == "in"),
+        )
+
+    @staticmethod
+    def _bitset_positions(bitset: int) -> List[int]:
+        """Get the positions of the bits defined in a bitset (in ascending order)."""
+        return [
+            position
+            for position, bit in enumerate(reversed(bin(bitset)[2:]))
+            if bit == "1"
+        ]
+
+    def reachable_sets(
+        self, vertices: Iterable[int], mode: str = "out"
+    ) -> Dict[int, List[int]]:
+        """Get the vertices reachable from each one of the given vertices (including it).
+
+        Args:
+            vertices (Iterable[int]): Indices of the source vertices.
+
+            mode (str): Direction of the paths (See ``ReachabilityIndex.reachable``).
+
+        Returns:
+            Dict[int, List[int]]: The reachable vertices of each source vertex (in the same order
+            used by ``ReachabilityIndex.reachable`` for a single vertex).
+
+        Note:
+            In a DAG, the reachable subgraph of all source vertices is traversed only once. The closure
+            of each traversed vertex is a bitset (Python ``int``) over the traversed vertices, combined
+            from the closures of its neighbors (in reverse topological order). A closure is released as
+            soon as all its traversed neighbors used it, so only the closures of the source vertices are
+            kept until the end of the query.
+        """
+        vertices = list(dict.fromkeys(vertices))
+
+        if mode == "all" or not self._is_dag or len(vertices) == 1:
+            return {vertex: self.reachable([vertex], mode) for vertex in vertices}
+
+        if mode not in self._adjacency:
+            raise ValueError("`mode` must be `out`, `in` or `all`.")
+
+        adjacency = self._adjacency[mode]
+
+        # traversed subgraph (in the results order: the neighbors are after the vertex).
+        subgraph = sorted(
+            self._traverse(vertices, adjacency),
+            key=self._rank.__getitem__,
+            reverse=(mode == "in"),
+        )
+        position = {vertex: idx for idx, vertex in enumerate(subgraph)}
+
+        # number of traversed vertices that still require the closure of each vertex.
+        pending_uses = dict.fromkeys(subgraph, 0)
+        for vertex in subgraph:
+            for neighbor in adjacency[vertex]:
+                pending_uses[neighbor] += 1
+
+        sources = set(vertices)
+        closures, reachable_sets = {}, {}
+
+        for vertex in reversed(subgraph):
+            closure = 1 << position[vertex]
+
+            for neighbor in adjacency[vertex]:
+                closure |= closures[neighbor]
+
+                pending_uses[neighbor] -= 1
+                if not pending_uses[neighbor]:
+                    del closures[neighbor]
+
+            if vertex in sources:
+                reachable_sets[vertex] = [
+                    subgraph[idx] for idx in self._bitset_positions(closure)
+                ]
+
+            if pending_uses[vertex]:
+                closures[vertex] = closure
+
+        return {vertex: reachable_sets[vertex] for vertex in vertices}
+
+    def descendants(self, vertices: Iterable[int]) -> List[int]:
+        """Get all descendants of the given vertices (including them).
+
+        See:
+            ``ReachabilityIndex.reachable`` for the arguments description.
+        """
+        return self.reachable(vertices, mode="out")
+
+    def ancestors(self, vertices: Iterable[int]) -> List[int]:
+        """Get all ancestors of the given vertices (including them).
+
+        See:
+            ``ReachabilityIndex.reachable`` for the arguments description.
+        """
+        return self.reachable(vertices, mode="in")
+
+    def topological_sort(self, vertices: Iterable[int]) -> List[int]:
+        """Sort vertices in topological order.
+
+        Args:
+            vertices (Iterable[int]): Indices of the vertices to be sorted.
+
+        Returns:
+            List[int]: The sorted vertices. For graphs with cycles, the vertices are sorted by index.
+        """
+        return sorted(vertices, key=self._rank.__getitem__)
+
+    def is_reachable(self, source: int, target: int) -> bool:
+        """Check if there is a path from ``source`` to ``target``.
+
+        Args:
+            source (int): Index of the source vertex.
+
+            target (int): Index of the target vertex.
+
+        Returns:
+            bool: True if ``target`` is a descendant of ``source`` (or the same vertex).
+        """
+        if source == target:
+            return True
+
+        if self._is_dag:
+            # in a DAG, the paths only reach vertices with greater ranks.
+            if self._rank[target] < self._rank[source]:
+                return False
+
+            return target in self._traverse(
+                [source], self._adjacency["out"], max_rank=self._rank[target]
+            )
+        return target in self._traverse([source], self._adjacency["out"])
+
+
+__all__ = "ReachabilityIndex"
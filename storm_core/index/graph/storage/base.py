@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+from abc import ABC, abstractmethod
+from typing import Dict, List, Tuple
+
+from igraph import Graph
+
+
+class GraphStorage(ABC):
+    """Base class for the Graph Manager storages.
+
+    A graph storage is an entity responsible for persisting the
+    execution graph managed by a ``GraphManager``. Every Graph Storage
+    must have the following properties:
+
+        1. Load the persisted execution graph;
+        2. Write the graph mutations incrementally (only the changed
+           vertices and edges are written).
+    """
+
+    @abstractmethod
+    def load(self) -> Graph:
+        """Load the persisted execution graph.
+
+        Returns:
+            igraph.Graph: The execution graph (vertices, with its attributes, and edges).
+
+        Note:
+            Implementations may load the vertices ``metadata`` attribute on demand, using
+            a read-only ``Mapping`` object.
+        """
+        pass
+
+    @abstractmethod
+    def write(
+        self,
+        vertices: List[Dict],
+        deleted_vertices: List[str],
+        linked_vertices: List[str],
+        edges: List[Tuple[str, str]],
+    ) -> None:
+        """Write the mutations of the execution graph.
+
+        Args:
+            vertices (List[Dict]): Attributes of the added/changed vertices.
+
+            deleted_vertices (List[str]): Names of the deleted vertices. The deleted vertices
+            must be removed before the changed ones are written.
+
+            linked_vertices (List[str]): Names of the vertices whose edges were changed. All
+            stored edges involving these vertices are replaced by ``edges``.
+
+            edges (List[Tuple[str, str]]): Current edges (source name, target name) of the
+            ``linked_vertices``.
+
+        Returns:
+            None: The mutations are persisted.
+        """
+        pass
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove all persisted vertices and edges."""
+        pass
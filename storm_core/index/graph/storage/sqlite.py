@@ -0,0 +1,276 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+try:
+    import dill
+except ImportError:
+    raise ModuleNotFoundError(
+        "To use the SQLite Graph Storage, please, install the dill library: "
+        "`pip install dill` or `poetry add dill`"
+    )
+
+import copy
+import sqlite3
+import threading
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, List, Tuple, Union
+
+from igraph import Graph
+
+from .base import GraphStorage
+
+SQLITE_GRAPH_STORAGE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS vertices (
+    name TEXT PRIMARY KEY,
+    attributes BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS metadata (
+    name TEXT PRIMARY KEY REFERENCES vertices(name) ON DELETE CASCADE,
+    value BLOB NOT NULL
+);
+
+CREATE TABLE IF NOT EXISTS edges (
+    source TEXT NOT NULL,
+    target TEXT NOT NULL,
+    PRIMARY KEY (source, target)
+);
+
+CREATE INDEX IF NOT EXISTS edges_target ON edges(target);
+"""
+"""SQLite Graph Storage database schema."""
+
+
+class LazyVertexMetadata(Mapping):
+    """Read-only vertex metadata loaded on demand.
+
+    The metadata is only read from the storage in the first
+    access. Copies (and pickles) of this object are plain
+    ``dict`` objects.
+    """
+
+    def __init__(self, storage: "SQLiteGraphStorage", name: str):
+        """Initializer.
+
+        Args:
+            storage (SQLiteGraphStorage): Storage where the metadata is saved.
+
+            name (str): Name of the vertex owner of the metadata.
+        """
+        self._name = name
+        self._storage = storage
+
+        self._metadata = None
+
+    @property
+    def is_loaded(self) -> bool:
+        """Flag indicating if the metadata was already loaded."""
+        return self._metadata is not None
+
+    def _data(self) -> Dict:
+        """Load (if required) and return the metadata."""
+        if self._metadata is None:
+            self._metadata = self._storage.load_metadata(self._name)
+        return self._metadata
+
+    def __getitem__(self, key):
+        return self._data()[key]
+
+    def __iter__(self):
+        return iter(self._data())
+
+    def __len__(self):
+        return len(self._data())
+
+    def __repr__(self):
+        return repr(self._data()) if self.is_loaded else "LazyVertexMetadata(...)"
+
+    def __deepcopy__(self, memodict={}):
+        return copy.deepcopy(self._data(), memodict)
+
+    def __reduce__(self):
+        return dict, (dict(self._data()),)
+
+
+class SQLiteGraphStorage(GraphStorage):
+    """SQLite based Graph Storage.
+
+    This storage keeps the vertices, edges and vertices metadata of
+    the execution graph in a local SQLite file. When loaded, the graph
+    topology (vertices and edges) is read eagerly, while the vertices
+    metadata is read on demand (See ``LazyVertexMetadata``).
+
+    Note:
+        The vertices attributes are serialized with the ``dill`` library, since
+        they may contain functions (e.g., the command split function).
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        """Initializer.
+
+        Args:
+            path (Union[str, Path]): Path to the SQLite file. The file is created if not exists.
+        """
+        self._path = Path(path)
+
+        self._lock = threading.RLock()
+        self._connection = None
+
+    def __getstate__(self):
+        """Return the state used to pickle the storage (the connection is not pickled)."""
+        return {"_path": self._path}
+
+    def __setstate__(self, state):
+        """Restore the storage from a pickled state."""
+        self.__init__(state["_path"])
+
+    @property
+    def path(self) -> Path:
+        """SQLite file path."""
+        return self._path
+
+    @property
+    def connection(self) -> sqlite3.Connection:
+        """SQLite connection (created on the first use)."""
+        with self._lock:
+            if self._connection is None:
+                self._path.parent.mkdir(parents=True, exist_ok=True)
+
+                self._connection = sqlite3.connect(
+                    str(self._path), check_same_thread=False
+                )
+                self._connection.execute("PRAGMA foreign_keys = ON")
+                self._connection.executescript(SQLITE_GRAPH_STORAGE_SCHEMA)
+
+            return self._connection
+
+    def load(self) -> Graph:
+        """Load the persisted execution graph.
+
+        Returns:
+            igraph.Graph: The execution graph. The ``metadata`` attribute of the vertices is
+            a ``LazyVertexMetadata`` object.
+        """
+        with self._lock:
+            vertices = self.connection.execute(
+                "SELECT name, attributes FROM vertices ORDER BY rowid"
+            ).fetchall()
+            edges = self.connection.execute(
+                "SELECT source, target FROM edges"
+            ).fetchall()
+
+        graph = Graph(directed=True)
+        graph.add_vertices(len(vertices))
+
+        if vertices:
+            vertices_attributes = [dill.loads(attributes) for _, attributes in vertices]
+
+            attribute_names = set().union(*vertices_attributes)
+            for attribute_name in attribute_names:
+                graph.vs[attribute_name] = [
+                    attributes.get(attribute_name) for attributes in vertices_attributes
+                ]
+
+            graph.vs["metadata"] = [
+                LazyVertexMetadata(self, name) for name, _ in vertices
+            ]
+
+            vertices_index = {name: idx for idx, (name, _) in enumerate(vertices)}
+            graph.add_edges(
+                [
+                    (vertices_index[source], vertices_index[target])
+                    for source, target in edges
+                ]
+            )
+
+        return graph
+
+    def load_metadata(self, name: str) -> Dict:
+        """Load the metadata of a vertex.
+
+        Args:
+            name (str): Vertex name.
+
+        Returns:
+            Dict: The vertex metadata (empty if not found).
+        """
+        with self._lock:
+            metadata = self.connection.execute(
+                "SELECT value FROM metadata WHERE name = ?", (name,)
+            ).fetchone()
+
+        return dill.loads(metadata[0]) if metadata else {}
+
+    def write(
+        self,
+        vertices: List[Dict],
+        deleted_vertices: List[str],
+        linked_vertices: List[str],
+        edges: List[Tuple[str, str]],
+    ) -> None:
+        """Write the mutations of the execution graph (in a single transaction).
+
+        See:
+            ``GraphStorage.write`` for the arguments description.
+        """
+        vertices_records, metadata_records = [], []
+
+        for vertex in vertices:
+            attributes = {k: v for k, v in vertex.items() if k != "metadata"}
+            vertices_records.append((vertex["name"], dill.dumps(attributes)))
+
+            # not loaded metadata are not changed.
+            metadata = vertex.get("metadata")
+            if not isinstance(metadata, LazyVertexMetadata) or metadata.is_loaded:
+                metadata_records.append(
+                    (vertex["name"], dill.dumps(dict(metadata or {})))
+                )
+
+        with self._lock, self.connection as connection:
+            connection.executemany(
+                "DELETE FROM vertices WHERE name = ?",
+                [(name,) for name in deleted_vertices],
+            )
+            connection.executemany(
+                "DELETE FROM edges WHERE source = ? OR target = ?",
+                [(name, name) for name in [*deleted_vertices, *linked_vertices]],
+            )
+
+            connection.executemany(
+                "INSERT INTO vertices (name, attributes) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET attributes = excluded.attributes",
+                vertices_records,
+            )
+            connection.executemany(
+                "INSERT INTO metadata (name, value) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET value = excluded.value",
+                metadata_records,
+            )
+            connection.executemany(
+                "INSERT OR IGNORE INTO edges (source, target) VALUES (?, ?)", edges
+            )
+
+    def clear(self) -> None:
+        """Remove all persisted vertices and edges."""
+        with self._lock, self.connection as connection:
+            connection.execute("DELETE FROM edges")
+            connection.execute("DELETE FROM metadata")
+            connection.execute("DELETE FROM vertices")
+
+    def close(self) -> None:
+        """Close the SQLite connection."""
+        with self._lock:
+            if self._connection is not None:
+                self._connection.close()
+                self._connection = None
+
+
+__all__ = (
+    "LazyVertexMetadata",
+    "SQLiteGraphStorage",
+)
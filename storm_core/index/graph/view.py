@@ -0,0 +1,319 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+import copy
+import functools
+from array import array
+
+from igraph import Edge, EdgeSeq, Graph, Vertex, VertexSeq
+
+
+def _copy_value(value):
+    """Copy an attribute value when it is mutable (the viewed value is shared with the graph)."""
+    if isinstance(value, array):
+        return copy.copy(value)
+
+    if isinstance(value, (dict, list, set)):  # e.g., the metadata (with nested values)
+        return copy.deepcopy(value)
+    return value
+
+
+def _read_only(value, graph: Graph):
+    """Wrap the objects of a viewed graph (returned by its operations) in read-only views.
+
+    Args:
+        value (object): Value returned by an operation of the viewed graph (or of its vertices and edges).
+
+        graph (igraph.Graph): Viewed graph. Objects of other graphs (e.g., created by ``subgraph``)
+        are independent, so they are returned as is.
+
+    Returns:
+        object: The read-only view of the value (or the value itself when it is not a graph object).
+    """
+    if value is graph:
+        return GraphView(graph)
+
+    for graph_type, view_type in (
+        (Vertex, VertexView),
+        (VertexSeq, VertexSeqView),
+        (Edge, EdgeView),
+        (EdgeSeq, EdgeSeqView),
+    ):
+        if isinstance(value, graph_type):
+            return view_type(value) if value.graph is graph else value
+
+    if isinstance(value, list) and value and isinstance(value[0], (Vertex, Edge)):
+        return [_read_only(item, graph) for item in value]
+    return value
+
+
+def _read_only_method(method, graph: Graph):
+    """Wrap a method of a viewed object, so its results are also read-only views."""
+
+    @functools.wraps(method)
+    def _method(*args, **kwargs):
+        return _read_only(method(*args, **kwargs), graph)
+
+    return _method
+
+
+class _ElementsView:
+    """Base read-only view of the vertices and edges (and of its sequences) of a graph.
+
+    The attributes can be read, while the attribute writes (e.g., ``vertex["status"] = ...``
+    or ``vs["name"] = [...]``) and the deletions are blocked. Mutable attribute values
+    (e.g., the ``inputs`` arrays) are returned as copies.
+    """
+
+    mutating_methods = frozenset()
+    """Methods of the viewed object not available in the view."""
+
+    def __init__(self, target):
+        """Initializer.
+
+        Args:
+            target (Union[igraph.Vertex, igraph.VertexSeq, igraph.Edge, igraph.EdgeSeq]): Object to be viewed.
+        """
+        object.__setattr__(self, "_target", target)
+
+    def __getattr__(self, name):
+        """Forward the read operations to the viewed object."""
+        if name == "_target":  # not initialized yet (e.g., on unpickling)
+            raise AttributeError(name)
+
+        if name in self.mutating_methods:
+            raise AttributeError(
+                f"`{name}` is not available in a read-only graph view. "
+                "Use `GraphView.copy()` to create a mutable graph."
+            )
+
+        value = getattr(self._target, name)
+        if callable(value):
+            return _read_only_method(value, self._target.graph)
+        return _read_only(value, self._target.graph)
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"`{name}` can not be defined in a read-only graph view.")
+
+    def __setitem__(self, key, value):
+        raise TypeError("Attributes can not be changed in a read-only graph view.")
+
+    def __delitem__(self, key):
+        raise TypeError("Attributes can not be deleted in a read-only graph view.")
+
+    def __eq__(self, other):
+        if isinstance(other, _ElementsView):
+            other = other._target
+        return self._target == other
+
+    def __hash__(self):
+        return hash(self._target)
+
+    def __repr__(self):
+        return repr(self._target)
+
+
+class _ElementView(_ElementsView):
+    """Read-only view of a vertex or an edge."""
+
+    mutating_methods = frozenset({"delete", "update_attributes"})
+
+    def __index__(self):
+        """Return the index of the viewed element (so, the view can be used as an igraph index)."""
+        return self._target.index
+
+    def __getitem__(self, attribute):
+        """Return an attribute value."""
+        return _copy_value(self._target[attribute])
+
+    def attributes(self):
+        """Return the attributes (and its values) of the viewed element."""
+        return {
+            attribute: _copy_value(value)
+            for attribute, value in self._target.attributes().items()
+        }
+
+
+class _SequenceView(_ElementsView):
+    """Read-only view of a vertex or an edge sequence."""
+
+    mutating_methods = frozenset({"delete", "set_attribute_values"})
+
+    def __len__(self):
+        return len(self._target)
+
+    def __iter__(self):
+        graph = self._target.graph
+        return (_read_only(element, graph) for element in self._target)
+
+    def __getitem__(self, key):
+        """Return an element (by index), a sub-sequence (by slice) or the values of an attribute (by name)."""
+        if isinstance(key, str):
+            return self.get_attribute_values(key)
+        return _read_only(self._target[key], self._target.graph)
+
+    def get_attribute_values(self, attribute):
+        """Return the values of an attribute for all elements of the sequence."""
+        return [
+            _copy_value(value) for value in self._target.get_attribute_values(attribute)
+        ]
+
+
+class VertexView(_ElementView):
+    """Read-only view of an ``igraph.Vertex``."""
+
+
+class VertexSeqView(_SequenceView):
+    """Read-only view of an ``igraph.VertexSeq``."""
+
+
+class EdgeView(_ElementView):
+    """Read-only view of an ``igraph.Edge``."""
+
+
+class EdgeSeqView(_SequenceView):
+    """Read-only view of an ``igraph.EdgeSeq``."""
+
+
+class GraphView:
+    """Read-only view of an execution graph.
+
+    The view shares the ``igraph.Graph`` object with its owner, so
+    reading it does not copy the vertices and their attributes. All
+    read operations of ``igraph.Graph`` are available, while the
+    operations that change the graph structure are blocked. The vertices
+    and edges (e.g., ``vs`` and ``es``) are also returned as read-only
+    views, so its attributes can not be changed.
+
+    Note:
+        The view is "live": changes made by the owner of the graph
+        (e.g., the ``GraphManager``) are visible through it. When a
+        mutable (and independent) graph is required, use the ``copy``
+        method.
+    """
+
+    mutating_methods = frozenset(
+        {
+            "add_edge",
+            "add_edges",
+            "add_vertex",
+            "add_vertices",
+            "contract_vertices",
+            "delete_edges",
+            "delete_vertices",
+            "rewire",
+            "rewire_edges",
+            "simplify",
+            "to_directed",
+            "to_undirected",
+        }
+    )
+    """Methods of ``igraph.Graph`` not available in the view."""
+
+    def __init__(self, graph: Graph):
+        """Initializer.
+
+        Args:
+            graph (igraph.Graph): Graph to be viewed.
+        """
+        self._graph = graph
+
+    def __getattr__(self, name):
+        """Forward the read operations to the viewed graph."""
+        if name == "_graph":  # not initialized yet (e.g., on unpickling)
+            raise AttributeError(name)
+
+        if name in self.mutating_methods:
+            raise AttributeError(
+                f"`{name}` is not available in a read-only graph view. "
+                "Use `copy()` to create a mutable graph."
+            )
+
+        value = getattr(self._graph, name)
+        if callable(value):
+            return _read_only_method(value, self._graph)
+        return _read_only(value, self._graph)
+
+    def __getitem__(self, attribute):
+        """Return a graph attribute."""
+        return _copy_value(self._graph[attribute])
+
+    @property
+    def vs(self) -> VertexSeqView:
+        """Return the vertices of the viewed graph."""
+        return VertexSeqView(self._graph.vs)
+
+    @property
+    def es(self) -> EdgeSeqView:
+        """Return the edges of the viewed graph."""
+        return EdgeSeqView(self._graph.es)
+
+    def __bool__(self):
+        """Return a flag indicating if the viewed graph has vertices."""
+        return self._graph.vcount() > 0
+
+    def copy(self) -> Graph:
+        """Create a mutable copy of the viewed graph.
+
+        Returns:
+            igraph.Graph: Independent copy of the graph (including the attributes).
+        """
+        return copy.deepcopy(self._graph)
+
+
+class GraphManagerView:
+    """Read-only view of a ``GraphManager``.
+
+    All query operations of the ``GraphManager`` are available. The
+    operations that change the execution graph are blocked.
+    """
+
+    mutating_methods = frozenset(
+        {
+            "add_vertex",
+            "update_vertex",
+            "delete_vertex",
+            "batch",
+            "mark_descendants_outdated",
+            "mark_vertices_updated",
+        }
+    )
+    """Methods of ``GraphManager`` not available in the view."""
+
+    def __init__(self, graph_manager):
+        """Initializer.
+
+        Args:
+            graph_manager (GraphManager): Graph Manager to be viewed.
+        """
+        self._graph_manager = graph_manager
+
+    def __getattr__(self, name):
+        """Forward the read operations to the viewed graph manager."""
+        if name in self.mutating_methods or name.startswith("_"):
+            raise AttributeError(
+                f"`{name}` is not available in a read-only graph manager view."
+            )
+        return getattr(self._graph_manager, name)
+
+    def __copy__(self):
+        """Create a copy instance of the viewed graph manager (with its own graph)."""
+        return copy.copy(self._graph_manager)
+
+    def __deepcopy__(self, memodict={}):
+        """Create a deepcopy instance of the viewed graph manager."""
+        return copy.deepcopy(self._graph_manager, memodict)
+
+
+__all__ = (
+    "GraphView",
+    "GraphManagerView",
+    "VertexView",
+    "VertexSeqView",
+    "EdgeView",
+    "EdgeSeqView",
+)
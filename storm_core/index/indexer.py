@@ -5,10 +5,9 @@
 # storm-core is free software; you can redistribute it and/or modify it
 # under the terms of the MIT License; see LICENSE file for more details.
 
-from copy import deepcopy
-from typing import Tuple
+from typing import Iterable, List
 
-from .graph import GraphManager
+from .graph import GraphManager, GraphManagerView
 from .accessor import SearchAccessor
 from .model import ExecutionCompendium
 
@@ -19,7 +18,7 @@ class ExecutionIndexer:
 
     @property
     def graph_manager(self):
-        return deepcopy(self._graph_manager)
+        return GraphManagerView(self._graph_manager)
 
     @property
     def search(self):
@@ -35,9 +34,7 @@ class ExecutionIndexer:
 
         return inputs_checksum, outputs_checksum
 
-    def _add_execution(
-        self, execution_compendium: ExecutionCompendium
-    ) -> Tuple[ExecutionCompendium, str]:
+    def _add_execution(self, execution_compendium: ExecutionCompendium) -> None:
         # preparing input and outputs (checksum)
         inputs_checksum, outputs_checksum = self._extract_package_io(
             execution_compendium
@@ -62,21 +59,13 @@ class ExecutionIndexer:
             # Files
             inputs_checksum,
             outputs_checksum,
-            # Metadata
+            # Metadata (a copy, see ``ExecutionCompendium.metadata``)
             execution_compendium.metadata,
         )
 
-        return list(
-            self.search.query.query(
-                command_checksum=execution_compendium.command.checksum
-            )
-        )[0][
-            0
-        ]  # should exists!
-
     def _edit_indexed_execution(
         self, execution_compendium: ExecutionCompendium
-    ) -> Tuple[ExecutionCompendium, str]:
+    ) -> None:
         # preparing input and outputs (checksum)
         inputs_checksum, outputs_checksum = self._extract_package_io(
             execution_compendium
@@ -90,13 +79,16 @@ class ExecutionIndexer:
             execution_compendium.compendium_package["algorithm"],
             # Command
             execution_compendium.command.checksum,
-            # Metadata
+            # Metadata (a copy, see ``ExecutionCompendium.metadata``)
             execution_compendium.metadata,
             # Files
             inputs_checksum,
             outputs_checksum,
         )
 
+    def _indexed_execution(
+        self, execution_compendium: ExecutionCompendium
+    ) -> ExecutionCompendium:
         return list(
             self.search.query.query(
                 command_checksum=execution_compendium.command.checksum
@@ -105,22 +97,62 @@ class ExecutionIndexer:
             0
         ]  # should exists!
 
-    def index_execution(
-        self, execution_compendium: ExecutionCompendium
-    ) -> Tuple[ExecutionCompendium, str]:
-
-        res = None
-        selected_vertex = list(
-            self.search.query.query(
-                command_checksum=execution_compendium.command.checksum
-            )
+    def _index_execution(self, execution_compendium: ExecutionCompendium) -> None:
+        selected_vertex = self._graph_manager.search_vertex(
+            command_checksum=execution_compendium.command.checksum
         )
 
         if selected_vertex:
-            res = self._edit_indexed_execution(execution_compendium)
+            self._edit_indexed_execution(execution_compendium)
         else:
-            res = self._add_execution(execution_compendium)
-        return res
+            self._add_execution(execution_compendium)
+
+    def index_execution(
+        self, execution_compendium: ExecutionCompendium
+    ) -> ExecutionCompendium:
+        self._index_execution(execution_compendium)
+
+        return self._indexed_execution(execution_compendium)
+
+    def index_executions(
+        self, execution_compendia: Iterable[ExecutionCompendium]
+    ) -> List[ExecutionCompendium]:
+        """Index many execution compendia at once.
+
+        All compendia are added (or updated) in a single ``GraphManager`` batch, so
+        the derived state of the graph (e.g., `outdated` compendia) is defined only once.
+
+        Args:
+            execution_compendia (Iterable[ExecutionCompendium]): Execution compendia to index.
+
+        Returns:
+            List[ExecutionCompendium]: The indexed execution compendia (in the same order).
+        """
+        execution_compendia = list(execution_compendia)
+
+        with self._graph_manager.batch():
+            for execution_compendium in execution_compendia:
+                self._index_execution(execution_compendium)
+
+        return [
+            self._indexed_execution(execution_compendium)
+            for execution_compendium in execution_compendia
+        ]
+
+    def confirm_executions(
+        self, execution_compendium_names: Iterable[str], update_date: bool = False
+    ) -> None:
+        """Mark outdated execution compendia as up-to-date without re-indexing them.
+
+        Args:
+            execution_compendium_names (Iterable[str]): Names of the execution compendia.
+
+            update_date (bool): Flag indicating if the update date of the execution compendia is set
+            to the current date (See ``GraphManager.mark_vertices_updated``).
+        """
+        self._graph_manager.mark_vertices_updated(
+            execution_compendium_names, update_date
+        )
 
     def deindex_execution(
         self, execution_compendium_name: str, remove_related_compendia: bool = False
@@ -6,7 +6,8 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from copy import deepcopy
-from typing import List
+from functools import cached_property
+from typing import Dict, List
 
 from storm_core.execution.command import ExecutableCommand
 
@@ -24,18 +25,19 @@ class ExecutionCompendium:
 
     @property
     def command(self):
-        return deepcopy(self._command)
+        return self._command
 
     @property
     def inputs(self) -> List:
-        return self._metadata.get("inputs", [])
+        return deepcopy(self._metadata.get("inputs", []))
 
     @property
     def outputs(self) -> List:
-        return self._metadata.get("outputs", [])
+        return deepcopy(self._metadata.get("outputs", []))
 
     @property
-    def metadata(self):
+    def metadata(self) -> Dict:
+        # the compendia may be shared (e.g., cached by the graph manager), so copies are returned.
         return deepcopy(self._metadata)
 
     @property
@@ -43,41 +45,96 @@ class ExecutionCompendium:
         return self._compendium_package
 
 
+class LazyExecutionCompendium(ExecutionCompendium):
+    """Execution Compendium materialized on demand from an indexed vertex.
+
+    The command, metadata and compendium package are only created
+    from the vertex attributes when accessed (e.g., the command
+    checksum is not recalculated when only the name is used).
+    """
+
+    def __init__(self, compendium_vertex_attributes: Dict, graph_manager):
+        """Initializer.
+
+        Args:
+            compendium_vertex_attributes (Dict): Attributes of the indexed execution compendium vertex.
+
+            graph_manager (GraphManager): Graph Manager where the compendium is indexed.
+        """
+        self._name = compendium_vertex_attributes["name"]
+
+        self._graph_manager = graph_manager
+        self._vertex_attributes = compendium_vertex_attributes
+
+    def __reduce__(self):
+        """Pickle the compendium as a (materialized) ``ExecutionCompendium``."""
+        return ExecutionCompendium, (
+            self._name,
+            self._command,
+            self._compendium_package,
+            self._metadata,
+        )
+
+    @cached_property
+    def _command(self):
+        split_fnc = self._vertex_attributes["command_config"]["split_fnc"]
+        checksum_algorithm = self._vertex_attributes["command_config"][
+            "checksum_algorithm"
+        ]
+
+        return ExecutableCommand(
+            self._vertex_attributes["command"], split_fnc, checksum_algorithm
+        )
+
+    @cached_property
+    def _metadata(self):
+        # the metadata is copied, so it is not shared with the graph vertex.
+        return {
+            **deepcopy(self._vertex_attributes["metadata"]),
+            "external_inputs_required": self._graph_manager.decode_checksums(
+                self._vertex_attributes["external_inputs_required"]
+            ),
+        }
+
+    @cached_property
+    def _compendium_package(self):
+        return {
+            "key": self._vertex_attributes["environment_package"],
+            "checksum": self._vertex_attributes["environment_package_checksum"],
+            "algorithm": self._vertex_attributes[
+                "environment_package_checksum_algorithm"
+            ],
+        }
+
+
 class ExecutionCompendiumFactory:
     """A simple yet powerful ExecutionCompendium factory class."""
 
     @staticmethod
-    def create_compendium(compendium_vertex) -> ExecutionCompendium:
+    def create_compendium(compendium_vertex, graph_manager) -> ExecutionCompendium:
         """Factory method to create a ExecutionCompendium class based on an
         Indexed Execution Compendium.
 
         Args:
             compendium_vertex (igraph.Vertex): Indexed execution compendium.
 
+            graph_manager (GraphManager): Graph Manager where the compendium is indexed.
+
         Returns:
             ExecutionCompendium: ExecutionCompendium object.
+
+        Note:
+            The compendia are materialized on demand (See ``LazyExecutionCompendium``) and
+            cached in the graph manager until the compendium vertex is changed.
         """
         name = compendium_vertex["name"]
-        metadata = compendium_vertex["metadata"]
-        metadata = {
-            **metadata,
-            "external_inputs_required": compendium_vertex["external_inputs_required"],
-        }
-
-        # compendium definition
-        compendium_package = {
-            "key": compendium_vertex["environment_package"],
-            "checksum": compendium_vertex["environment_package_checksum"],
-            "algorithm": compendium_vertex["environment_package_checksum_algorithm"],
-        }
+        compendia_cache = graph_manager.vertices_cache
 
-        # creating the executable command
-        command = compendium_vertex["command"]
-        split_fnc = compendium_vertex["command_config"]["split_fnc"]
-        checksum_algorithm = compendium_vertex["command_config"]["checksum_algorithm"]
+        execution_compendium = compendia_cache.get(name)
+        if execution_compendium is None:
+            execution_compendium = LazyExecutionCompendium(
+                compendium_vertex.attributes(), graph_manager
+            )
+            compendia_cache.set(name, execution_compendium)
 
-        executable_command = ExecutableCommand(command, split_fnc, checksum_algorithm)
-
-        return ExecutionCompendium(
-            name, executable_command, compendium_package, metadata
-        )
+        return execution_compendium
@@ -6,11 +6,13 @@
 # under the terms of the MIT License; see LICENSE file for more details.
 
 from abc import ABC
-from typing import List, Tuple, Optional, Generator
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Tuple, Optional, Generator, Union
 
-from .graph import VertexStatus
-from .graph.manager import MAX_IGRAPH_ORDER
 from .model import ExecutionCompendium, ExecutionCompendiumFactory
+from ..helper.cache import BaseFileHashCache
+from ..helper.hasher import hash_files
 
 
 class IndexerSearch(ABC):
@@ -55,14 +57,13 @@ class IndexerQuerySearch(IndexerSearch):
             about these predicates, please, check the official igraph documentation:
             <https://igraph.org/python/api/latest/igraph.VertexSeq.html#select>.
         """
-        compendia_vertex = (
-            self._execution_indexer.graph_manager.search_vertex(**kwargs) or []
-        )
+        graph_manager = self._execution_indexer.graph_manager
+        compendia_vertex = graph_manager.search_vertex(**kwargs) or []
 
         for compendium_vertex in compendia_vertex:
             # creating the execution compendium object.
             execution_compendium = ExecutionCompendiumFactory.create_compendium(
-                compendium_vertex
+                compendium_vertex, graph_manager
             )
 
             # yielding with the current status.
@@ -98,24 +99,35 @@ class IndexerNeighborhoodSearch(IndexerSearch):
             about these predicates, please, check the official igraph documentation:
             <https://igraph.org/python/api/latest/igraph.VertexSeq.html#select>.
         """
-        compendia_vertex = (
-            self._execution_indexer.graph_manager.search_vertex(**kwargs) or []
+        graph_manager = self._execution_indexer.graph_manager
+        compendia_vertex = graph_manager.search_vertex(**kwargs) or []
+
+        # read-only view (shared with the graph manager).
+        _graph = graph_manager.graph
+
+        # searching the neighborhood of all matched vertices (in a single query).
+        neighborhoods = (
+            graph_manager.reachability.reachable_sets(
+                [compendium_vertex.index for compendium_vertex in compendia_vertex],
+                mode=neighborhood_mode,
+            )
+            if compendia_vertex
+            else {}
         )
 
         for compendium_vertex in compendia_vertex:
             # creating the execution compendium object.
             execution_compendium = ExecutionCompendiumFactory.create_compendium(
-                compendium_vertex
+                compendium_vertex, graph_manager
             )
 
-            # searching the neighborhood
-            neighborhood = self._execution_indexer.graph_manager.graph.neighborhood(
-                compendium_vertex, mode=neighborhood_mode, order=MAX_IGRAPH_ORDER
-            )
+            neighborhood = neighborhoods[compendium_vertex.index]
 
             # creating the execution compendium objects
             execution_compendium_neighborhood = [
-                ExecutionCompendiumFactory.create_compendium(nh)
+                ExecutionCompendiumFactory.create_compendium(
+                    _graph.vs[nh], graph_manager
+                )
                 for nh in (neighborhood or [])
             ]
 
@@ -139,15 +151,185 @@ class IndexerFacetedSearch(IndexerSearch):
             Generator[Tuple[ExecutionCompendium, str], None, None]: A generator with the outdated execution compendia objects.
             The objects are returned in topological order.
         """
-        _graph = self._execution_indexer.graph_manager.graph
-        for vertex_index in _graph.topological_sorting(mode="out"):
+        graph_manager = self._execution_indexer.graph_manager
+
+        for vertex in graph_manager.outdated_vertices():
+            yield ExecutionCompendiumFactory.create_compendium(
+                vertex, graph_manager
+            ), vertex["status"]
+
+    def _changed_files_consumers(
+        self,
+        files: Iterable[Union[str, Path]],
+        checksum_algorithm: str,
+        hash_cache: BaseFileHashCache = None,
+    ) -> List[int]:
+        """Find the vertices that used a different version of the given files.
+
+        Args:
+            files (Iterable[Union[str, Path]]): Paths of the (possibly) changed files.
+
+            checksum_algorithm (str): Checksum algorithm used when the input file has no algorithm defined.
+
+            hash_cache (BaseFileHashCache): Cache used to avoid hashing unchanged files again.
+
+        Returns:
+            List[int]: Indices of the vertices whose recorded input checksum differs from the current file checksum.
+
+        Note:
+            The consumers of the files are found with the path index of the ``GraphManager``, so only the given
+            files are hashed (each file once per algorithm).
+        """
+        paths_consumers = self._execution_indexer.graph_manager.path_consumers(files)
+
+        # current checksum of the files (None for removed files).
+        files_by_algorithm = defaultdict(set)
+        for path, path_consumers in paths_consumers.items():
+            for _, _, algorithm in path_consumers:
+                files_by_algorithm[algorithm or checksum_algorithm].add(path)
+
+        files_checksum = {}
+        for algorithm, paths in files_by_algorithm.items():
+            existing_paths = sorted(path for path in paths if path.is_file())
+
+            files_checksum.update({(path, algorithm): None for path in paths})
+            files_checksum.update(
+                {
+                    (path, algorithm): file_hash["checksum"]
+                    for path, file_hash in zip(
+                        existing_paths,
+                        hash_files(existing_paths, algorithm, hash_cache),
+                    )
+                }
+            )
+
+        consumers = set()
+        for path, path_consumers in paths_consumers.items():
+            for vertex_index, checksum, algorithm in path_consumers:
+                algorithm = algorithm or checksum_algorithm
+
+                if files_checksum[(path, algorithm)] != checksum:
+                    consumers.add(vertex_index)
+
+        return sorted(consumers)
+
+    def impacted_compendia(
+        self,
+        checksums: Iterable[str] = None,
+        files: Iterable[Union[str, Path]] = None,
+        checksum_algorithm: str = "md5",
+        hash_cache: BaseFileHashCache = None,
+    ) -> Generator[Tuple[ExecutionCompendium, str], None, None]:
+        """Retrieve the execution compendia impacted by changed input files.
+
+        The impacted compendia are the ones that use the changed files and all their
+        descendants. These are the compendia that must be re-executed when the files
+        change. The graph is not changed by this query.
+
+        Args:
+            checksums (Iterable[str]): Checksums (as indexed) of the changed files.
+
+            files (Iterable[Union[str, Path]]): Paths of the changed files. The files are hashed and
+            compared with the checksums recorded in the compendia inputs.
+
+            checksum_algorithm (str): Checksum algorithm used to hash the ``files`` when the recorded
+            input has no algorithm defined.
+
+            hash_cache (BaseFileHashCache): Cache of file checksums used to hash the ``files`` (e.g., the
+            ``ExecutionEngineFilesConfig.files_hash_cache``).
+
+        Returns:
+            Generator[Tuple[ExecutionCompendium, str], None, None]: A generator with the impacted execution
+            compendia objects. The objects are returned in topological order.
+        """
+        graph_manager = self._execution_indexer.graph_manager
+
+        # compendia that directly use the changed files.
+        consumers = []
+
+        if checksums:
+            for vertices in graph_manager.file_consumers(checksums).values():
+                consumers.extend(vertices.indices)
+
+        if files:
+            consumers.extend(
+                self._changed_files_consumers(files, checksum_algorithm, hash_cache)
+            )
+
+        if not consumers:
+            return
+
+        _graph = graph_manager.graph
+        for vertex_index in graph_manager.reachability.descendants(consumers):
             vertex = _graph.vs[vertex_index]
 
-            if vertex["status"] == VertexStatus.Outdated:
-                selected_vertex = next(
-                    self._execution_indexer.search.query.query(name=vertex["name"])
+            yield ExecutionCompendiumFactory.create_compendium(
+                vertex, graph_manager
+            ), vertex["status"]
+
+
+class IndexerProvenanceSearch(IndexerSearch):
+    """Indexer file provenance search.
+
+    This class provides queries to find which execution compendia
+    produced (``producers``) or used (``consumers``) a file, identified
+    by its checksum. The queries are solved with the checksum indexes of
+    the ``GraphManager``.
+    """
+
+    def query(
+        self, checksums: Iterable[str], mode: str = "producers"
+    ) -> Dict[str, List[Tuple[ExecutionCompendium, str]]]:
+        """Query method to search the provenance of many files at once.
+
+        Args:
+            checksums (Iterable[str]): Files checksums.
+
+            mode (str): Provenance relation: ``producers`` (compendia that generated the files) or
+            ``consumers`` (compendia that used the files as inputs).
+
+        Returns:
+            Dict[str, List[Tuple[ExecutionCompendium, str]]]: The execution compendia (and its status) of
+            each file checksum.
+        """
+        if mode not in ("producers", "consumers"):
+            raise ValueError("`mode` must be `producers` or `consumers`.")
+
+        graph_manager = self._execution_indexer.graph_manager
+        files_vertices = getattr(graph_manager, f"file_{mode}")(checksums)
+
+        return {
+            checksum: [
+                (
+                    ExecutionCompendiumFactory.create_compendium(vertex, graph_manager),
+                    vertex["status"],
                 )
-                yield selected_vertex
+                for vertex in vertices
+            ]
+            for checksum, vertices in files_vertices.items()
+        }
+
+    def producers(self, checksum: str) -> List[Tuple[ExecutionCompendium, str]]:
+        """Retrieve the execution compendia that produced a file.
+
+        Args:
+            checksum (str): File checksum.
+
+        Returns:
+            List[Tuple[ExecutionCompendium, str]]: The execution compendia (and its status).
+        """
+        return self.query([checksum], mode="producers")[checksum]
+
+    def consumers(self, checksum: str) -> List[Tuple[ExecutionCompendium, str]]:
+        """Retrieve the execution compendia that used a file as input.
+
+        Args:
+            checksum (str): File checksum.
+
+        Returns:
+            List[Tuple[ExecutionCompendium, str]]: The execution compendia (and its status).
+        """
+        return self.query([checksum], mode="consumers")[checksum]
 
 
 __all__ = (
@@ -155,4 +337,5 @@ __all__ = (
     "IndexerQuerySearch",
     "IndexerNeighborhoodSearch",
     "IndexerFacetedSearch",
+    "IndexerProvenanceSearch",
 )
@@ -8,7 +8,9 @@
 import os
 import shutil
 from pathlib import Path
-from typing import List, Dict
+from typing import List, Dict, Set
+
+from igraph import Graph
 
 from .mutator import GraphMutator
 from ..execution.plan import ExecutionPlan
@@ -24,10 +26,7 @@ class ReproducibleOperations:
 
     def _check_outdated_executions(self):
         # checking if the graph is outdated
-        outdated_executions = list(
-            self._execution_indexer.search.faceted.outdated_compendia()
-        )
-        if outdated_executions:
+        if self._execution_indexer.graph_manager.is_outdated:
             raise RuntimeError(
                 "There are Execution Compendia that are out of date. Update them before performing a new run."
             )
@@ -59,6 +58,71 @@ class ReproducibleOperations:
                     / execution_file
                 )
 
+    def _index_job_results(self, execution_job_results) -> List[ExecutionCompendium]:
+        """Index the results of executed jobs.
+
+        The results reused from the execution cache (with the same compendium package already
+        indexed) are not re-indexed. Its indexed compendia are only confirmed as up-to-date,
+        keeping their update date, so the descendants are not marked as outdated.
+
+        Args:
+            execution_job_results (List[JobResult]): Results of the executed jobs.
+
+        Returns:
+            List[ExecutionCompendium]: List with the indexed ExecutionCompendium (in the results order).
+        """
+        graph_manager = self._execution_indexer.graph_manager
+        execution_job_results = list(execution_job_results)
+
+        compendia_to_index, reused_compendia = [], {}
+        for job_result in execution_job_results:
+            compendium_package = job_result.execution_results["compendium_package"]
+
+            if job_result.execution_results.get("reused"):
+                indexed_vertex = graph_manager.search_vertex(
+                    command_checksum=job_result.command.checksum
+                )
+
+                if (
+                    indexed_vertex
+                    and indexed_vertex[0]["environment_package_checksum"]
+                    == compendium_package["checksum"]
+                ):
+                    reused_compendia[job_result.execution_id] = indexed_vertex[0][
+                        "name"
+                    ]
+                    continue
+
+            compendia_to_index.append(
+                ExecutionCompendium(
+                    name=job_result.execution_id,
+                    command=job_result.command,
+                    metadata=job_result.execution_results["metadata"],
+                    compendium_package=compendium_package,
+                )
+            )
+
+        self._execution_indexer.confirm_executions(reused_compendia.values())
+
+        indexed_compendia = iter(
+            self._execution_indexer.index_executions(compendia_to_index)
+        )
+
+        execution_result = []
+        for job_result in execution_job_results:
+            if job_result.execution_id in reused_compendia:
+                execution_result.append(
+                    next(
+                        self._execution_indexer.search.query.query(
+                            name=reused_compendia[job_result.execution_id]
+                        )
+                    )[0]
+                )
+            else:
+                execution_result.append(next(indexed_compendia))
+
+        return execution_result
+
     def run(self, execution_plan: ExecutionPlan) -> List[ExecutionCompendium]:
         """Execute an experiment in a reproducible way.
 
@@ -95,49 +159,26 @@ class ReproducibleOperations:
         )
 
         # indexing the new done above.
-        results = [
-            self._execution_indexer.index_execution(
-                ExecutionCompendium(
-                    name=ec.execution_id,
-                    command=ec.command,
-                    metadata=ec.execution_results["metadata"],
-                    compendium_package=ec.execution_results["compendium_package"],
-                )
-            )
-            for ec in execution_job_results
-        ]
+        results = self._index_job_results(execution_job_results)
 
         # removing outdated/invalid directories
         self._remove_unused_execution_files()
 
         return results
 
-    def update(self):
-        """Re-execute the Execution Compendia outdated.
-
-        This command identifies and re-executes all outdated Execution Compendia, which is useful when multiple runs need
-        to be updated because of changing results from other scripts. An execution is considered outdated when any of its
-        predecessors have a run performed after its creation.
+    def _execute_outdated_compendia(
+        self, outdated_compendia: List[ExecutionCompendium]
+    ) -> List[ExecutionCompendium]:
+        """Re-execute and re-index the given outdated Execution Compendia.
 
-        For example, below we have three associated executions:
-
-             *(Execution 1) -> *(Execution 2) -> *(Execution 3)
-
-        All are up-to-date. If the `Execution 2` is executed again, all its subsequent ones will
-        be out of date since they depend on the result generated by this Execution. Following this rule, in this
-        example, the `Execution 3` is outdated.
+        Args:
+            outdated_compendia (List[ExecutionCompendium]): Outdated execution compendia (in topological order).
 
         Returns:
             List[ExecutionCompendium]: List with the ExecutionCompendium updated by the execution.
         """
         _graph = self._execution_indexer.graph_manager.graph
 
-        # preparing the outdated compendia that will be executed
-        outdated_executions = list(
-            self._execution_indexer.search.faceted.outdated_compendia()
-        )
-        outdated_compendia = [execution[0] for execution in outdated_executions]
-
         # mutating graph to execution plan
         execution_plan = (
             GraphMutator.mutate_graph_to_execution_plan_by_outdated_compendia(
@@ -155,17 +196,143 @@ class ReproducibleOperations:
                 execution_plan, states={"previous_outputs": previous_output_checksum}
             )
 
-            execution_result = [
-                self._execution_indexer.index_execution(
-                    ExecutionCompendium(
-                        command=ec.command,
-                        name=ec.execution_id,
-                        metadata=ec.execution_results["metadata"],
-                        compendium_package=ec.execution_results["compendium_package"],
+            execution_result = self._index_job_results(execution_job_results)
+
+        return execution_result
+
+    def _vertex_outputs(self, name: str) -> Set[str]:
+        """Get the output checksums of an indexed Execution Compendium."""
+        graph_manager = self._execution_indexer.graph_manager
+        vertex = graph_manager.search_vertex(name=name)[0]
+
+        return set(graph_manager.decode_checksums(vertex["outputs"]))
+
+    def _update_with_early_cutoff(
+        self, outdated_compendia: List[ExecutionCompendium]
+    ) -> List[ExecutionCompendium]:
+        """Re-execute the outdated Execution Compendia wave by wave, with early cutoff.
+
+        An outdated compendium is re-executed when it is directly out of date (one of its predecessors
+        was updated after it or none of its predecessors is outdated) or when a re-executed predecessor
+        produced different outputs. The other outdated compendia are marked as updated without being
+        re-executed (with the date of their wave, so they are not directly out of date in later updates).
+
+        Args:
+            outdated_compendia (List[ExecutionCompendium]): Outdated execution compendia (in topological order).
+
+        Returns:
+            List[ExecutionCompendium]: List with the ExecutionCompendium updated by the execution.
+        """
+        graph_manager = self._execution_indexer.graph_manager
+        _graph = graph_manager.graph
+
+        compendia = {compendium.name: compendium for compendium in outdated_compendia}
+
+        # defining the outdated predecessors and the directly outdated compendia (before any execution).
+        predecessors = {}
+        compendia_to_execute = set()
+
+        for name in compendia:
+            vertex = graph_manager.search_vertex(name=name)[0]
+            vertex_predecessors = _graph.vs.select(_graph.predecessors(vertex))
+
+            predecessors[name] = {
+                predecessor["name"]
+                for predecessor in vertex_predecessors
+                if predecessor["name"] in compendia
+            }
+
+            if not predecessors[name] or any(
+                predecessor["name"] not in compendia
+                and predecessor["updated_in"] > vertex["updated_in"]
+                for predecessor in vertex_predecessors
+            ):
+                compendia_to_execute.add(name)
+
+        execution_result = []
+        changed_compendia = set()
+
+        # waves: compendia whose outdated predecessors are in the previous waves.
+        compendia_index = {name: idx for idx, name in enumerate(compendia)}
+        compendia_plan = ExecutionPlan(
+            Graph(
+                n=len(compendia),
+                edges=[
+                    (compendia_index[predecessor], compendia_index[name])
+                    for name in compendia
+                    for predecessor in predecessors[name]
+                ],
+                directed=True,
+                vertex_attrs={"name": list(compendia), "job": list(compendia)},
+            )
+        )
+
+        for wave in compendia_plan.wavefronts():
+            wave_to_execute, wave_to_skip = [], []
+            for name in wave:
+                if name in compendia_to_execute or predecessors[name].intersection(
+                    changed_compendia
+                ):
+                    wave_to_execute.append(name)
+                else:
+                    wave_to_skip.append(name)
+
+            # the skipped compendia inputs are identical to the ones used in their last execution. They are
+            # confirmed before the next waves, so they are not newer than their re-executed descendants.
+            self._execution_indexer.confirm_executions(wave_to_skip, update_date=True)
+
+            if wave_to_execute:
+                previous_outputs = {
+                    name: self._vertex_outputs(name) for name in wave_to_execute
+                }
+
+                execution_result.extend(
+                    self._execute_outdated_compendia(
+                        [compendia[name] for name in wave_to_execute]
                     )
                 )
-                for ec in execution_job_results
-            ]
+
+                changed_compendia.update(
+                    name
+                    for name in wave_to_execute
+                    if self._vertex_outputs(name) != previous_outputs[name]
+                )
+
+        return execution_result
+
+    def update(self, early_cutoff: bool = False):
+        """Re-execute the Execution Compendia outdated.
+
+        This command identifies and re-executes all outdated Execution Compendia, which is useful when multiple runs need
+        to be updated because of changing results from other scripts. An execution is considered outdated when any of its
+        predecessors have a run performed after its creation.
+
+        For example, below we have three associated executions:
+
+             *(Execution 1) -> *(Execution 2) -> *(Execution 3)
+
+        All are up-to-date. If the `Execution 2` is executed again, all its subsequent ones will
+        be out of date since they depend on the result generated by this Execution. Following this rule, in this
+        example, the `Execution 3` is outdated.
+
+        Args:
+            early_cutoff (bool): Flag indicating if the outdated compendia are re-executed wave by wave. In this mode,
+            when a re-executed compendium produces the same outputs (checksums) as before, its outdated descendants
+            are marked as updated instead of being re-executed (if they are not outdated by other reasons).
+
+        Returns:
+            List[ExecutionCompendium]: List with the ExecutionCompendium updated by the execution.
+        """
+        # preparing the outdated compendia that will be executed
+        outdated_compendia = [
+            execution[0]
+            for execution in self._execution_indexer.search.faceted.outdated_compendia()
+        ]
+
+        if early_cutoff:
+            execution_result = self._update_with_early_cutoff(outdated_compendia)
+        else:
+            execution_result = self._execute_outdated_compendia(outdated_compendia)
 
         # removing outdated/invalid directories
         self._remove_unused_execution_files()
@@ -177,6 +344,7 @@ class ReproducibleOperations:
         reproducible_storage: str,
         required_data_objects: Dict = None,
         required_environment_variables: List[str] = None,
+        scrub: bool = False,
     ):
         """"""
         self._check_outdated_executions()
@@ -193,4 +361,5 @@ class ReproducibleOperations:
             execution_plan,
             required_data_objects or {},
             required_environment_variables or [],
+            scrub,
         )
@@ -9,10 +9,9 @@
 
 import os
 from functools import reduce
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Union
 
 import plumbum
-import fnmatch
 
 from reprozip.pack import pack
 from reprozip.tracer import trace
@@ -23,7 +22,9 @@ from reprounzip.common import load_config as load_config_file
 from rpaths import Path
 from ruamel.yaml import YAML
 
-from .helper.hasher import hash_file
+from .helper.cache import FileHashCache
+from .helper.hasher import hash_files
+from .helper.matcher import PatternMatcher
 
 
 def _filter_none_values(values: List) -> List:
@@ -68,10 +69,128 @@ def _save_reprozip_config_file(reprozip_bundle_directory: str, config_obj: Dict)
     return config_file
 
 
+class ReproZipBundleConfig:
+    """ReproZip configuration file (`config.yml`) of a bundle, loaded in memory.
+
+    The configuration file is parsed once (in the first access) and shared by the
+    functions that read or change it (e.g., the Inspector and the Metadata Builder
+    components of a job). The changes are only written to the configuration file
+    when ``save`` is called.
+
+    Note:
+        The functions of this module accept a ``ReproZipBundleConfig`` where a bundle
+        directory is expected. In this case, the changes are kept in memory, and
+        ``reprozip_pack_execution`` and ``reprounzip_run_docker_container`` save
+        the configuration before using the bundle.
+    """
+
+    def __init__(self, reprozip_bundle_directory: str):
+        """Initializer.
+
+        Args:
+            reprozip_bundle_directory (str): The directory where the ReproZip execution files is saved.
+        """
+        self._reprozip_bundle_directory = reprozip_bundle_directory
+
+        self._config = None
+        self._changed = False
+
+    @property
+    def directory(self) -> str:
+        """The directory where the ReproZip execution files is saved."""
+        return self._reprozip_bundle_directory
+
+    @property
+    def config(self) -> Dict:
+        """The ReproZip execution metadata (`config.yml`) dict object."""
+        if self._config is None:
+            self._config = _load_reprozip_config_file(self._reprozip_bundle_directory)
+        return self._config
+
+    @property
+    def changed(self) -> bool:
+        """Flag indicating if the configuration has changes not saved."""
+        return self._changed
+
+    def mark_changed(self) -> None:
+        """Mark the configuration as changed."""
+        self._changed = True
+
+    def save(self) -> str:
+        """Save the configuration changes in the configuration file.
+
+        Returns:
+            str: The configuration file path.
+        """
+        if self._changed:
+            _save_reprozip_config_file(self._reprozip_bundle_directory, self.config)
+            self._changed = False
+
+        return os.path.join(self._reprozip_bundle_directory, "config.yml")
+
+
+def _bundle_config(
+    reprozip_bundle: Union[str, ReproZipBundleConfig],
+) -> Tuple[ReproZipBundleConfig, bool]:
+    """Get the configuration object of a ReproZip bundle.
+
+    Args:
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution
+        files is saved or its configuration object.
+
+    Returns:
+        Tuple[ReproZipBundleConfig, bool]: The configuration object and a flag indicating if the
+        configuration must be saved by the caller (i.e., it was created from a directory).
+    """
+    if isinstance(reprozip_bundle, ReproZipBundleConfig):
+        return reprozip_bundle, False
+    return ReproZipBundleConfig(reprozip_bundle), True
+
+
+def _datasources_matcher(
+    datasources: Union[Dict[str, Dict], PatternMatcher],
+) -> PatternMatcher:
+    """Create the matcher of the `exclude` datasources patterns.
+
+    Args:
+        datasources (Union[Dict[str, Dict], PatternMatcher]): The datasources definitions (See
+        ``filter_reprozip_config_files``). If a ``PatternMatcher`` is used, it is returned as-is.
+
+    Returns:
+        PatternMatcher: Matcher of the patterns whose action is `exclude`.
+    """
+    if isinstance(datasources, PatternMatcher):
+        return datasources
+
+    return PatternMatcher(
+        datasource["pattern"]
+        for datasource in datasources.values()
+        if datasource.get("action") == "exclude"
+    )
+
+
+def _ignored_objects_matcher(
+    ignored_objects: Union[Dict[str, str], PatternMatcher],
+) -> PatternMatcher:
+    """Create the matcher of the ignored objects patterns.
+
+    Args:
+        ignored_objects (Union[Dict[str, str], PatternMatcher]): Files/Directories patterns that must be ignored. If
+        a ``PatternMatcher`` is used, it is returned as-is.
+
+    Returns:
+        PatternMatcher: Matcher of the ignored objects patterns.
+    """
+    if isinstance(ignored_objects, PatternMatcher):
+        return ignored_objects
+    return PatternMatcher(ignored_objects.values())
+
+
 def _exclude_execution_input_files_by_already_generated_files(
     reprozip_execution_config: Dict,
     already_generated_files: List[str],
     checksum_algorithm: str,
+    hash_cache: FileHashCache = None,
 ) -> Tuple[Dict, List]:
     """Remove files/directories from the configuration file based on already generated files.
 
@@ -88,6 +207,8 @@ def _exclude_execution_input_files_by_already_generated_files(
 
         checksum_algorithm (str): Algorithm used to generate the files checksum.
 
+        hash_cache (FileHashCache): Cache of the files checksum.
+
     Returns:
         Dict: The ReproZip execution metadata (`config.yml`) dict object filtered by already generated files.
 
@@ -98,19 +219,33 @@ def _exclude_execution_input_files_by_already_generated_files(
     Note:
         The filtering is done in the `other_files` section of the ReproZip configuration file. Thus, the reference to
         which input data should be used is still kept in the file.
+
+    Note:
+        Each regular file of the `other_files` section is hashed only once. Entries that are not regular
+        files (e.g., directories, missing files) are skipped without hashing.
     """
-    excluded_files = []
-    for already_generated_file in already_generated_files:
-        for idx, other_file in enumerate(reprozip_execution_config["other_files"]):
+    already_generated_files = set(already_generated_files)
+
+    # only regular files can be generated by previous steps.
+    candidate_files = list(
+        dict.fromkeys(
+            other_file
+            for other_file in reprozip_execution_config["other_files"]
+            if other_file and os.path.isfile(other_file)
+        )
+    )
 
-            if (
-                other_file
-                and os.path.isfile(other_file)
-                and already_generated_file
-                == hash_file(other_file, checksum_algorithm).get("checksum")
-            ):
-                excluded_files.append(reprozip_execution_config["other_files"][idx])
-                reprozip_execution_config["other_files"][idx] = None
+    # each file is hashed (at most) once, and compared with all generated files.
+    files_checksum = {
+        file_checksum["key"]: file_checksum["checksum"]
+        for file_checksum in hash_files(candidate_files, checksum_algorithm, hash_cache)
+    }
+
+    excluded_files = []
+    for idx, other_file in enumerate(reprozip_execution_config["other_files"]):
+        if files_checksum.get(other_file) in already_generated_files:
+            excluded_files.append(other_file)
+            reprozip_execution_config["other_files"][idx] = None
 
     # remove all "None" values
     reprozip_execution_config["other_files"] = _filter_none_values(
@@ -120,7 +255,8 @@ def _exclude_execution_input_files_by_already_generated_files(
 
 
 def _exclude_execution_input_files_from_bundle_by_datasources(
-    reprozip_execution_config: Dict, datasources: Dict[str, str]
+    reprozip_execution_config: Dict,
+    datasources: Union[Dict[str, Dict], PatternMatcher],
 ) -> Tuple[Dict, List]:
     """Remove files/directories from the configuration file based on `datasources` definitions.
 
@@ -144,6 +280,9 @@ def _exclude_execution_input_files_from_bundle_by_datasources(
                 }
             }
 
+        The definitions can also be a ``PatternMatcher`` with the `exclude` patterns (e.g., the
+        ``ExecutionEngineFilesConfig.data_objects_matcher``), which avoids compiling the patterns.
+
     Returns:
         Dict: The ReproZip execution metadata (`config.yml`) dict object filtered by the `datasources` definitions.
 
@@ -155,15 +294,13 @@ def _exclude_execution_input_files_from_bundle_by_datasources(
     See:
         https://docs.python.org/pt-br/3/library/fnmatch.html
     """
-    excluded_files = []
-    for datasource_key in datasources.keys():
-        datasource = datasources[datasource_key]
+    datasources_matcher = _datasources_matcher(datasources)
 
-        for idx, other_file in enumerate(reprozip_execution_config["other_files"]):
-            if other_file and fnmatch.fnmatch(other_file, datasource["pattern"]):
-                if datasource["action"] == "exclude":
-                    excluded_files.append(reprozip_execution_config["other_files"][idx])
-                    reprozip_execution_config["other_files"][idx] = None
+    excluded_files = []
+    for idx, other_file in enumerate(reprozip_execution_config["other_files"]):
+        if other_file and datasources_matcher.match(other_file):
+            excluded_files.append(other_file)
+            reprozip_execution_config["other_files"][idx] = None
 
     # remove all "None" values
     reprozip_execution_config["other_files"] = _filter_none_values(
@@ -173,7 +310,9 @@ def _exclude_execution_input_files_from_bundle_by_datasources(
 
 
 def _extract_execution_input(
-    reprozip_execution_config: Dict, working_directory: str, ignored_objects: Dict
+    reprozip_execution_config: Dict,
+    working_directory: str,
+    ignored_objects: Union[Dict[str, str], PatternMatcher],
 ) -> List[Dict]:
     """Extract the execution input by working directory.
 
@@ -183,7 +322,8 @@ def _extract_execution_input(
 
         working_directory (str): The working directory used to filter the execution input.
 
-        ignored_objects (Dict): Files/Directories that must be ignored when defining input data.
+        ignored_objects (Union[Dict[str, str], PatternMatcher]): Files/Directories that must be ignored when defining
+        input data.
 
     Returns:
         List[Dict]: The execution input files filtered by working directory.
@@ -193,18 +333,14 @@ def _extract_execution_input(
         This heuristic is used to prevent invalid files (e.g., binaries, system libraries) from being used as "input data".
     """
 
-    def _is_ignored(file_path: str, ignored_objects: Dict):
-        for ignored_object_key in ignored_objects.keys():
-            if fnmatch.fnmatch(file_path, ignored_objects[ignored_object_key]):
-                return True
-        return False
-
     if not reprozip_execution_config["inputs_outputs"]:
         return []
 
+    ignored_objects_matcher = _ignored_objects_matcher(ignored_objects)
+
     inputs = []
     for input_output_file in reprozip_execution_config["inputs_outputs"]:
-        is_ignored = _is_ignored(input_output_file["path"], ignored_objects)
+        is_ignored = ignored_objects_matcher.match(input_output_file["path"])
 
         if working_directory in input_output_file["path"] and not is_ignored:
             # verify if file is a input (written by nobody - ReproZip heuristic)
@@ -236,16 +372,19 @@ def _extract_execution_output(reprozip_execution_config: Dict) -> List[Dict]:
     return outputs
 
 
-def _check_empty_environment_variable(reprozip_bundle_directory: str) -> None:
+def _check_empty_environment_variable(
+    reprozip_bundle: Union[str, ReproZipBundleConfig],
+) -> None:
     """Check for empty environment variables on reprozip experiment configuration.
 
     Args:
-        reprozip_bundle_directory: The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object.
 
     Raises:
         RuntimeError: When on the reprozip configuration file a environment variable is empty.
     """
-    reprozip_execution_config = _load_reprozip_config_file(reprozip_bundle_directory)
+    reprozip_execution_config = _bundle_config(reprozip_bundle)[0].config
     for idx, run in enumerate(reprozip_execution_config["runs"]):
 
         run_environment_variables = reprozip_execution_config["runs"][idx]["environ"]
@@ -262,10 +401,11 @@ def _check_empty_environment_variable(reprozip_bundle_directory: str) -> None:
 
 
 def filter_reprozip_config_files(
-    reprozip_bundle_directory: str,
-    datasources: dict,
+    reprozip_bundle: Union[str, ReproZipBundleConfig],
+    datasources: Union[Dict[str, Dict], PatternMatcher],
     already_generated_files: List[str],
     checksum_algorithm: str,
+    hash_cache: FileHashCache = None,
 ) -> Dict[str, List]:
     """Delete configuration file contents from the execution performed by ReproZip.
 
@@ -277,7 +417,8 @@ def filter_reprozip_config_files(
         - 2. File is contained in the directory, pattern or file declared as `exclude`.
 
     Args:
-        reprozip_bundle_directory: The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object.
 
         datasources (List[Dict[str, str]]): The datasources definitions. This definition is a dictionary in
         which each key is the name of a datasource. The content associated with each key is a dictionary
@@ -292,10 +433,14 @@ def filter_reprozip_config_files(
                 }
             }
 
+        A ``PatternMatcher`` with the `exclude` patterns is also accepted.
+
         already_generated_files (List[str]): Files that already is generated by previous graph execution steps.
 
         checksum_algorithm (str): Algorithm used to generate the files checksum.
 
+        hash_cache (FileHashCache): Cache of the files checksum (used to avoid reading unchanged files).
+
     Returns:
         Dict: A dictionary with the reference of the files is removed, separated by the used filter method. Each key in
         the dictionary represents the method used to remove the file (`graph` or `datasource`). For the graph method,
@@ -303,7 +448,8 @@ def filter_reprozip_config_files(
         to this, it removes files listed in the data sources in the data source method.
 
     Note:
-        The filter modifications is saved in the ReproZip execution metadata (`config.yml`) file.
+        The filter modifications is saved in the ReproZip execution metadata (`config.yml`) file. When a
+        ``ReproZipBundleConfig`` is used, the modifications are only kept in memory (See ``ReproZipBundleConfig.save``).
 
     Note:
         The file checksum, generated with the algorithm defined in the ``checksum_algorithm`` argument,
@@ -312,7 +458,8 @@ def filter_reprozip_config_files(
     See:
         https://docs.python.org/pt-br/3/library/fnmatch.html
     """
-    reprozip_execution_config = _load_reprozip_config_file(reprozip_bundle_directory)
+    bundle_config, save_config = _bundle_config(reprozip_bundle)
+    reprozip_execution_config = bundle_config.config
 
     # exclude files that are already generated into the execution graph.
     excluded_files_from_graph = []
@@ -321,7 +468,10 @@ def filter_reprozip_config_files(
             reprozip_execution_config,
             excluded_files_from_graph,
         ) = _exclude_execution_input_files_by_already_generated_files(
-            reprozip_execution_config, already_generated_files, checksum_algorithm
+            reprozip_execution_config,
+            already_generated_files,
+            checksum_algorithm,
+            hash_cache,
         )
 
     # exclude files that are defined as datasources.
@@ -335,7 +485,11 @@ def filter_reprozip_config_files(
         )
 
     # write the new config file
-    _save_reprozip_config_file(reprozip_bundle_directory, reprozip_execution_config)
+    if excluded_files_from_graph or excluded_files_from_datasources:
+        bundle_config.mark_changed()
+
+    if save_config:
+        bundle_config.save()
 
     return {
         "graph": excluded_files_from_graph,
@@ -344,16 +498,20 @@ def filter_reprozip_config_files(
 
 
 def reprozip_execution_metadata(
-    reprozip_bundle_directory: str, working_directory: str, ignored_objects: Dict
+    reprozip_bundle: Union[str, ReproZipBundleConfig],
+    working_directory: str,
+    ignored_objects: Union[Dict[str, str], PatternMatcher],
 ):
     """Extract the execution metadata from a ReproZip pack.
 
     Args:
-        reprozip_bundle_directory: The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object.
 
         working_directory (List[str]): The working directories used to filter the execution input.
 
-        ignored_objects (Dict): Dict with the Files/Directories references that must be ignored when defining input data.
+        ignored_objects (Union[Dict[str, str], PatternMatcher]): Dict (or compiled matcher) with the Files/Directories
+        references that must be ignored when defining input data.
 
     Returns:
         Dict: The execution metadata with the following fields:
@@ -372,7 +530,7 @@ def reprozip_execution_metadata(
         """
         return list(map(lambda obj: obj["path"], input_output_config))
 
-    reprozip_execution_config = _load_reprozip_config_file(reprozip_bundle_directory)
+    reprozip_execution_config = _bundle_config(reprozip_bundle)[0].config
 
     # extract input/output.
     inputs = _extract_path(
@@ -390,19 +548,21 @@ def reprozip_execution_metadata(
 
 
 def reprozip_remove_environment_variables(
-    reprozip_bundle_directory: str, environment_variables: List[str]
+    reprozip_bundle: Union[str, ReproZipBundleConfig], environment_variables: List[str]
 ) -> List[str]:
     """Remove environment variables from a reprozip execution environment.
 
     Args:
-        reprozip_bundle_directory (str): The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object.
 
         environment_variables (List[str]): List of environment variables that should be removed from the
                                            experiment environment.
     Returns:
         None: The environment variables will be removed from the reprozip configuration file in-place.
     """
-    reprozip_execution_config = _load_reprozip_config_file(reprozip_bundle_directory)
+    bundle_config, save_config = _bundle_config(reprozip_bundle)
+    reprozip_execution_config = bundle_config.config
 
     # go through runs
     for idx, run in enumerate(reprozip_execution_config["runs"]):
@@ -413,8 +573,10 @@ def reprozip_remove_environment_variables(
                 reprozip_execution_config["runs"][idx]["environ"][
                     environment_variable
                 ] = None
+                bundle_config.mark_changed()
 
-    _save_reprozip_config_file(reprozip_bundle_directory, reprozip_execution_config)
+    if save_config:
+        bundle_config.save()
 
     return environment_variables
 
@@ -452,18 +614,24 @@ def reprozip_execute_script(
     return execution_compendium_directory
 
 
-def reprozip_pack_execution(reprozip_bundle_directory: str) -> str:
+def reprozip_pack_execution(reprozip_bundle: Union[str, ReproZipBundleConfig]) -> str:
     """Create a ReproZip package for an experiment.
 
-    Retrieves the execution information stored in `reprozip_bundle_directory` and generates the package. If needed the files
+    Retrieves the execution information stored in `reprozip_bundle` and generates the package. If needed the files
     can be filtered using the `storm_core.repropzip.filter_reprozip_config_files` function.
 
     Args:
-        reprozip_bundle_directory (str): The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object. The configuration changes are saved before the packing.
 
     Returns:
         str: Directory where the reprozip package is saved.
     """
+    bundle_config = _bundle_config(reprozip_bundle)[0]
+    bundle_config.save()
+
+    reprozip_bundle_directory = bundle_config.directory
+
     reprozip_bundle_file = os.path.join(reprozip_bundle_directory, "pack.rpz")
     pack(Path(reprozip_bundle_file), Path(reprozip_bundle_directory), True)
 
@@ -471,12 +639,13 @@ def reprozip_pack_execution(reprozip_bundle_directory: str) -> str:
 
 
 def reprounzip_add_environment_variables(
-    reprozip_bundle_directory: str, environment_variables: List[str]
+    reprozip_bundle: Union[str, ReproZipBundleConfig], environment_variables: List[str]
 ):
     """Add environment variables to a reprounzip environment.
 
     Args:
-        reprozip_bundle_directory (str): The directory where the ReproZip execution files is saved.
+        reprozip_bundle (Union[str, ReproZipBundleConfig]): The directory where the ReproZip execution files is
+        saved or its configuration object.
 
         environment_variables (List[str]): List of environment variables that should be added on the
                                            experiment environment before reproduction.
@@ -484,7 +653,8 @@ def reprounzip_add_environment_variables(
     Returns:
         None: The environment variables will be added to reprozip configuration file in-place.
     """
-    reprozip_execution_config = _load_reprozip_config_file(reprozip_bundle_directory)
+    bundle_config, save_config = _bundle_config(reprozip_bundle)
+    reprozip_execution_config = bundle_config.config
 
     # prepare the environment variables
     reprozip_environment_variables = []
@@ -515,7 +685,10 @@ def reprounzip_add_environment_variables(
             env_name, env_value = environment_variable
 
             reprozip_execution_config["runs"][idx]["environ"][env_name] = env_value
-    _save_reprozip_config_file(reprozip_bundle_directory, reprozip_execution_config)
+    bundle_config.mark_changed()
+
+    if save_config:
+        bundle_config.save()
 
 
 def reprounzip_setup(
@@ -539,6 +712,32 @@ def reprounzip_setup(
     )()
 
 
+def reprounzip_reset(reproduction_path: str, unpacker: str = "docker"):
+    """Reset a reprounzip experiment to the state after the setup.
+
+    Args:
+        reproduction_path (str): Path where the reprounzip experiment is stored.
+
+        unpacker (str): Used Reprounip unpacker.
+    See:
+        https://docs.reprozip.org/en/1.0.x/unpacking.html
+    """
+    (plumbum.cmd.reprounzip[unpacker, "reset", reproduction_path])()
+
+
+def reprounzip_destroy(reproduction_path: str, unpacker: str = "docker"):
+    """Remove a reprounzip experiment (and the resources created by the unpacker, e.g., docker images).
+
+    Args:
+        reproduction_path (str): Path where the reprounzip experiment is stored.
+
+        unpacker (str): Used Reprounip unpacker.
+    See:
+        https://docs.reprozip.org/en/1.0.x/unpacking.html
+    """
+    (plumbum.cmd.reprounzip[unpacker, "destroy", reproduction_path])()
+
+
 def reprounzip_download_all(reproduction_path: str, unpacker: str = "docker"):
     """Download all reprounzip experiment result on the current directory.
 
@@ -581,19 +780,86 @@ def reprounzip_download_file(
     )()
 
 
+def reprounzip_download_files(
+    reproduction_path: str,
+    filenames: List[str],
+    output_directory: str,
+    unpacker: str = "docker",
+) -> List[str]:
+    """Download many files from a reprozip experiment in a single reprounzip invocation.
+
+    Args:
+        reproduction_path (str): Path where the reprounzip experiment is stored.
+
+        filenames (List[str]): Files that will be downloaded from reprozip experiment.
+
+        output_directory (str): Base directory where the files will be downloaded. Inside this directory, a file with
+        the same name of each file in `filenames` is created (existing files are replaced).
+
+        unpacker (str): Reprounip unpacker.
+
+    Returns:
+        List[str]: The files that are not available in the experiment (e.g., temporary files removed by the
+        experiment scripts).
+
+    Note:
+        If the download fails (e.g., reprounzip stops in a missing file), the files are not
+        downloaded again: the files not available in the ``output_directory`` are reported as missing.
+    See:
+        https://docs.reprozip.org/en/1.0.x/unpacking.html
+    """
+    output_files = {
+        filename: os.path.join(output_directory, filename) for filename in filenames
+    }
+
+    if not output_files:
+        return []
+
+    # removing the files of previous downloads, so the missing files can be identified.
+    for output_file in output_files.values():
+        if os.path.isfile(output_file):
+            os.remove(output_file)
+
+    try:
+        (
+            plumbum.cmd.reprounzip[
+                unpacker,
+                "download",
+                reproduction_path,
+                [
+                    f"{filename}:{output_file}"
+                    for filename, output_file in output_files.items()
+                ],
+            ]
+        )()
+    except plumbum.ProcessExecutionError:
+        pass  # the missing files are identified below (in the output directory).
+
+    return [
+        filename
+        for filename, output_file in output_files.items()
+        if not os.path.exists(output_file)
+    ]
+
+
 def reprounzip_run_docker_container(
-    reproduction_path: str, volume_options: List[str] = None
+    reproduction: Union[str, ReproZipBundleConfig], volume_options: List[str] = None
 ):
     """Execute a reprounzip experiment.
 
     Args:
-        reproduction_path (str): Path where the reprounzip experiment is stored.
+        reproduction (Union[str, ReproZipBundleConfig]): Path where the reprounzip experiment is stored or
+        its configuration object. The configuration changes are saved before the execution.
 
         volume_options (List[str]): Volume definition in the docker supported format (/path/on/my/machine:/path/container:ro)
     See:
         https://docs.reprozip.org/en/1.0.x/unpacking.html
     """
-    _check_empty_environment_variable(reproduction_path)
+    bundle_config = _bundle_config(reproduction)[0]
+    _check_empty_environment_variable(bundle_config)
+
+    bundle_config.save()
+    reproduction_path = bundle_config.directory
 
     volume_command, volume_definition = None, None
     if volume_options:
@@ -634,14 +900,18 @@ def reprozip_get_output_files(reproduction_path: str):
 
 
 __all__ = (
+    "ReproZipBundleConfig",
     "filter_reprozip_config_files",
     "reprozip_execute_script",
     "reprozip_pack_execution",
     "reprozip_execution_metadata",
     "reprozip_remove_environment_variables",
     "reprounzip_setup",
+    "reprounzip_reset",
+    "reprounzip_destroy",
     "reprounzip_download_all",
     "reprounzip_download_file",
+    "reprounzip_download_files",
     "reprozip_get_output_files",
     "reprounzip_run_docker_container",
     "reprounzip_add_environment_variables",
@@ -0,0 +1,192 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Execution cache tests."""
+
+import pickle
+from unittest import mock
+
+import pytest
+
+from storm_core.execution.cache import ExecutionCache
+from storm_core.execution.command import ExecutableCommand
+from storm_core.execution.config import ExecutionEngineFilesConfig
+from storm_core.execution.engine import ExecutionEngine
+from storm_core.execution.job.base import JobResult, JobStatus
+from storm_core.helper.hasher import hash_files
+from storm_core.index.graph import GraphManager
+from storm_core.index.indexer import ExecutionIndexer
+from storm_core.index.model import ExecutionCompendium
+from storm_core.op.operation import ReproducibleOperations
+
+
+@pytest.fixture
+def files_config(tmp_path):
+    return ExecutionEngineFilesConfig(tmp_path / "workdir", tmp_path / "storage")
+
+
+@pytest.fixture
+def command():
+    return ExecutableCommand("python script.py")
+
+
+@pytest.fixture
+def cached_result(tmp_path):
+    """Execution result with an input file, an output file and a compendium package."""
+    files = {}
+    for name, content in [("input", "1"), ("output", "2"), ("package.rpz", "3")]:
+        files[name] = tmp_path / name
+        files[name].write_text(content)
+
+    def _file(name):
+        return hash_files([str(files[name])], "md5")[0]
+
+    return {
+        "execution_id": "execution",
+        "compendium_package": _file("package.rpz"),
+        "metadata": {"inputs": [_file("input")], "outputs": [_file("output")]},
+        "environment_description_data": str(tmp_path / "reprozip"),
+    }
+
+
+@pytest.fixture
+def execution_cache(tmp_path, command, files_config, cached_result):
+    execution_cache = ExecutionCache(tmp_path / "cache.sqlite")
+
+    execution_cache.put(
+        command.checksum,
+        ExecutionCache.environment_fingerprint(command, files_config),
+        cached_result,
+    )
+    return execution_cache
+
+
+def test_cache_hit_requires_the_same_command_and_environment(
+    execution_cache, command, files_config, cached_result
+):
+    """A cached result is only returned for the same command checksum and environment."""
+    fingerprint = ExecutionCache.environment_fingerprint(command, files_config)
+
+    assert execution_cache.get(command.checksum, fingerprint) == cached_result
+    assert execution_cache.get(command.checksum, "other-environment") is None
+    assert (
+        execution_cache.get(ExecutableCommand("python other.py").checksum, fingerprint)
+        is None
+    )
+
+    # the pickled cache (e.g., sent to a worker) uses the same database.
+    execution_cache = pickle.loads(pickle.dumps(execution_cache))
+    assert execution_cache.get(command.checksum, fingerprint) == cached_result
+
+
+@pytest.mark.parametrize("changed_file", ["input", "output", "package.rpz"])
+@pytest.mark.parametrize("removed", [False, True])
+def test_changed_file_invalidates_the_cached_result(
+    tmp_path, execution_cache, command, files_config, changed_file, removed
+):
+    """A cached result is not returned when one of its files is changed (or removed)."""
+    fingerprint = ExecutionCache.environment_fingerprint(command, files_config)
+
+    if removed:
+        (tmp_path / changed_file).unlink()
+    else:
+        (tmp_path / changed_file).write_text("changed")
+
+    assert execution_cache.get(command.checksum, fingerprint) is None
+
+
+def test_engine_reuses_the_cached_result(
+    tmp_path, execution_cache, command, files_config, cached_result
+):
+    """The engine returns the cached result (marked as reused) without running the job."""
+    engine = ExecutionEngine(
+        None,
+        files_config,
+        inspector=None,
+        builder=None,
+        execution_cache=execution_cache,
+    )
+    job = mock.Mock(command=command)
+
+    job_result = engine._operator_run({})(job)
+
+    job.submit.assert_not_called()
+    assert job_result.execution_id == cached_result["execution_id"]
+    assert not job_result.has_error
+    assert job_result.execution_results == {
+        "compendium_package": cached_result["compendium_package"],
+        "metadata": cached_result["metadata"],
+        "reused": True,
+    }
+
+    # after a change, the job is executed.
+    (tmp_path / "input").write_text("changed")
+    job.submit.side_effect = RuntimeError("executed")
+
+    with pytest.raises(RuntimeError, match="executed"):
+        engine._operator_run({})(job)
+
+
+def _metadata(inputs, outputs):
+    return {
+        "inputs": [
+            {"key": f"/data/{checksum}", "checksum": checksum} for checksum in inputs
+        ],
+        "outputs": [
+            {"key": f"/data/{checksum}", "checksum": checksum} for checksum in outputs
+        ],
+    }
+
+
+def _job_result(name, inputs, outputs, reused):
+    """Result of a job (the name is also used in the command and package checksum)."""
+    return JobResult(
+        name,
+        JobStatus.SUCCESSFULLY,
+        "",
+        None,
+        ExecutableCommand(f"python {name}.py"),
+        compendium_package={
+            "key": f"/storage/{name}/package.rpz",
+            "checksum": f"{name}-package",
+            "algorithm": "md5",
+        },
+        metadata=_metadata(inputs, outputs),
+        **({"reused": True} if reused else {}),
+    )
+
+
+def test_reused_results_are_confirmed_instead_of_indexed():
+    """The reused results of indexed compendia are confirmed (the descendants stay updated)."""
+    graph_manager = GraphManager()
+    execution_indexer = ExecutionIndexer(graph_manager)
+    operations = ReproducibleOperations(None, execution_indexer)
+
+    operations._index_job_results(
+        [
+            _job_result("a", ["raw"], ["A"], False),
+            _job_result("b", ["A"], ["B"], False),
+        ]
+    )
+    updated_in = graph_manager.search_vertex(name="a")[0]["updated_in"]
+
+    with mock.patch.object(
+        execution_indexer, "index_executions", wraps=execution_indexer.index_executions
+    ) as index_executions:
+        results = operations._index_job_results(
+            [
+                _job_result("a", ["raw"], ["A"], True),
+                _job_result("c", ["B"], ["C"], False),
+            ]
+        )
+
+    # only the new result is indexed (the order of the results is kept).
+    assert [compendium.name for compendium in index_executions.call_args[0][0]] == ["c"]
+    assert [compendium.name for compendium in results] == ["a", "c"]
+
+    assert graph_manager.search_vertex(name="a")[0]["updated_in"] == updated_in
+    assert not graph_manager.is_outdated
@@ -0,0 +1,149 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""File checksum cache tests."""
+
+import os
+import pickle
+import time
+
+import pytest
+
+from storm_core.helper.cache import (
+    RACY_INTERVAL_NS,
+    FileHashCache,
+    InMemoryFileHashCache,
+)
+from storm_core.helper.hasher import hash_file
+
+OLD_MTIME_NS = time.time_ns() - 100 * RACY_INTERVAL_NS
+"""Modification time of the files (out of the racy interval)."""
+
+
+def _write(path, content, mtime_ns=OLD_MTIME_NS):
+    """Write a file defining its modification time."""
+    path.write_bytes(content)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+    return path
+
+
+@pytest.fixture(params=["in-memory", "sqlite"])
+def hash_cache(request, tmp_path):
+    if request.param == "in-memory":
+        return InMemoryFileHashCache()
+    return FileHashCache(tmp_path / "cache" / "files.sqlite")
+
+
+@pytest.fixture
+def cached_file(tmp_path, hash_cache):
+    """File (modified out of the racy interval) with its checksum cached."""
+    file_path = _write(tmp_path / "file.bin", b"content")
+    hash_file(file_path, "md5", hash_cache)
+
+    return file_path
+
+
+def test_unchanged_file_uses_the_cached_checksum(hash_cache, cached_file):
+    """The checksum is cached by file and algorithm."""
+    checksum = hash_cache.get(cached_file, "md5")
+
+    assert checksum == hash_file(cached_file, "md5")["checksum"]
+    assert hash_cache.get(cached_file, "sha256") is None
+    assert hash_cache.get(cached_file.parent / "other.bin", "md5") is None
+
+
+def test_changed_mtime_invalidates_the_checksum(hash_cache, cached_file):
+    """A file with the same content (and size), but another modification time, is hashed again."""
+    os.utime(cached_file, ns=(OLD_MTIME_NS + 1, OLD_MTIME_NS + 1))
+
+    assert hash_cache.get(cached_file, "md5") is None
+
+
+def test_changed_size_invalidates_the_checksum(hash_cache, cached_file):
+    """A file with another size (and the same modification time) is hashed again."""
+    _write(cached_file, b"changed content")
+
+    assert hash_cache.get(cached_file, "md5") is None
+    assert hash_file(cached_file, "md5", hash_cache) == hash_file(cached_file, "md5")
+
+
+def test_replaced_file_invalidates_the_checksum(hash_cache, cached_file):
+    """A file replaced by another one (other inode) with the same size and modification time."""
+    replacement = _write(cached_file.parent / "replacement.bin", b"CONTENT")
+    os.replace(replacement, cached_file)
+
+    assert hash_cache.get(cached_file, "md5") is None
+
+
+def test_removed_file_invalidates_the_checksum(hash_cache, cached_file):
+    """Removed files have no cached checksum."""
+    cached_file.unlink()
+
+    assert hash_cache.get(cached_file, "md5") is None
+
+
+def test_racy_files_are_hashed_again(hash_cache, tmp_path):
+    """Files modified in the racy interval are not cached (changes keeping the fingerprint are found)."""
+    recent_mtime_ns = time.time_ns()
+    racy_file = _write(tmp_path / "racy.bin", b"content", recent_mtime_ns)
+
+    first_checksum = hash_file(racy_file, "md5", hash_cache)["checksum"]
+    assert hash_cache.get(racy_file, "md5") is None
+
+    # same size and modification time (e.g., changed in the timestamps resolution).
+    _write(racy_file, b"CONTENT", recent_mtime_ns)
+
+    second_checksum = hash_file(racy_file, "md5", hash_cache)["checksum"]
+    assert second_checksum != first_checksum
+    assert second_checksum == hash_file(racy_file, "md5")["checksum"]
+
+
+def test_file_changed_while_hashed_is_not_cached(hash_cache, tmp_path):
+    """The checksum is not cached when the fingerprint taken before the hashing is no longer valid."""
+    file_path = _write(tmp_path / "file.bin", b"content")
+    fingerprint = hash_cache.fingerprint(file_path)
+
+    _write(file_path, b"changed content")
+
+    assert not hash_cache.put(file_path, "md5", "checksum", fingerprint)
+    assert hash_cache.get(file_path, "md5") is None
+
+
+def test_verify_reads_the_cached_file(hash_cache, cached_file):
+    """With ``verify``, the file is read again (and the cache is updated)."""
+    _write(cached_file, b"CONTENT")  # same size and modification time
+
+    stale_checksum = hash_cache.get(cached_file, "md5")
+    checksum = hash_file(cached_file, "md5", hash_cache, verify=True)["checksum"]
+
+    assert checksum != stale_checksum
+    assert hash_cache.get(cached_file, "md5") == checksum
+
+
+def test_persistent_cache_is_shared_by_pickle(tmp_path):
+    """The pickled persistent cache (e.g., sent to a worker) uses the same database."""
+    cached_file = _write(tmp_path / "file.bin", b"content")
+
+    hash_cache = FileHashCache(tmp_path / "cache.sqlite")
+    hash_file(cached_file, "md5", hash_cache)
+
+    assert pickle.loads(pickle.dumps(hash_cache)).get(cached_file, "md5") is not None
+
+    hash_cache.discard(cached_file)
+    assert hash_cache.get(cached_file, "md5") is None
+
+
+def test_in_memory_cache_is_not_pickled(tmp_path):
+    """The entries of the in-memory cache are only valid in the current process."""
+    cached_file = _write(tmp_path / "file.bin", b"content")
+
+    hash_cache = InMemoryFileHashCache()
+    hash_file(cached_file, "md5", hash_cache)
+
+    assert len(hash_cache) == 1
+    assert len(pickle.loads(pickle.dumps(hash_cache))) == 0
@@ -0,0 +1,393 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Execution Graph Manager tests."""
+
+import copy
+import random
+
+import pytest
+
+from storm_core.index.graph.manager import GraphManager, VertexStatus
+from storm_core.index.graph.view import GraphManagerView
+
+
+def _add_vertex(graph_manager, name, inputs, outputs):
+    """Add a vertex (the vertex name is also used as command)."""
+    graph_manager.add_vertex(
+        name,
+        f"{name}.rpz",
+        f"{name}-package-checksum",
+        "sha256",
+        f"run {name}",
+        f"{name}-command-checksum",
+        {},
+        inputs,
+        outputs,
+        {},
+    )
+
+
+def _status(graph_manager, name):
+    return graph_manager.search_vertex(name=name)[0]["status"]
+
+
+@pytest.fixture
+def graph_manager():
+    """Graph manager with the ``a -> b -> c`` chain."""
+    graph_manager = GraphManager()
+
+    _add_vertex(graph_manager, "a", ["raw"], ["A"])
+    _add_vertex(graph_manager, "b", ["A"], ["B"])
+    _add_vertex(graph_manager, "c", ["B"], ["C"])
+
+    return graph_manager
+
+
+def test_relinked_vertex_outdates_former_successors(graph_manager):
+    """The consumers of outputs that are no longer generated are outdated."""
+    _add_vertex(graph_manager, "b", ["A"], ["B2"])
+
+    assert _status(graph_manager, "b") == VertexStatus.Updated
+    assert _status(graph_manager, "c") == VertexStatus.Outdated
+    assert graph_manager.is_outdated
+
+
+def _edges(graph_manager):
+    graph = graph_manager.graph
+    return {
+        (graph.vs[source]["name"], graph.vs[target]["name"])
+        for source, target in graph.get_edgelist()
+    }
+
+
+def test_batch_creates_the_same_edges():
+    """The edges created in a batch are the same created by single insertions."""
+    executions = [
+        ("a", ["raw"], ["A"]),
+        ("b", ["A"], ["B"]),
+        ("c", ["B", "A"], ["C"]),
+        ("b", ["A"], ["B2"]),  # relinked inside the batch
+        ("d", ["B2", "C"], ["D"]),
+    ]
+
+    graph_manager = GraphManager()
+    for execution in executions:
+        _add_vertex(graph_manager, *execution)
+
+    batch_graph_manager = GraphManager()
+    with batch_graph_manager.batch():
+        for execution in executions:
+            _add_vertex(batch_graph_manager, *execution)
+
+    assert _edges(batch_graph_manager) == _edges(graph_manager)
+    assert _edges(graph_manager) == {("a", "b"), ("a", "c"), ("b", "d"), ("c", "d")}
+
+
+def test_reachability_index_is_kept_when_the_edges_are_not_changed(graph_manager):
+    """Updates that keep the graph structure reuse the reachability index."""
+    reachability = graph_manager.reachability
+    assert reachability.descendants([0]) == [0, 1, 2]
+
+    # same outputs (and consumers), other package.
+    graph_manager.update_vertex(
+        "b", "b2.rpz", "b2-package-checksum", "sha256", "b-command-checksum", {}
+    )
+    assert graph_manager.reachability is reachability
+
+    _add_vertex(graph_manager, "b", ["A"], ["B2"])
+    assert graph_manager.reachability is not reachability
+    assert graph_manager.reachability.descendants([0]) == [0, 1]
+
+
+def test_graph_view_blocks_attribute_writes(graph_manager):
+    """The vertices and edges of the views can not be changed."""
+    graph = graph_manager.graph
+
+    with pytest.raises(TypeError):
+        graph.vs[0]["status"] = VertexStatus.Outdated
+
+    with pytest.raises(TypeError):
+        graph.vs["name"] = ["z", "z", "z"]
+
+    with pytest.raises(TypeError):
+        graph.es[0]["weight"] = 1
+
+    with pytest.raises(AttributeError):
+        graph.vs.select(name="a").set_attribute_values("name", ["z"])
+
+    with pytest.raises(TypeError):
+        graph_manager.vertices[0]["status"] = VertexStatus.Outdated
+
+    with pytest.raises(AttributeError):
+        graph_manager.search_vertex(name="a")[0].update_attributes(name="z")
+
+    # the mutable values are copies.
+    graph_manager.vertices[0]["outputs"].append(0)
+
+    assert not graph_manager.is_outdated
+    assert len(graph_manager.search_vertex(name="a")) == 1
+    assert graph_manager.decode_checksums(graph_manager.vertices[0]["outputs"]) == ["A"]
+
+
+@pytest.mark.parametrize("view", [False, True])
+def test_copy_does_not_share_the_graph(graph_manager, view):
+    """A copy has its own graph, so each manager (and its indexes) is changed independently."""
+    graph_manager_copy = copy.copy(
+        GraphManagerView(graph_manager) if view else graph_manager
+    )
+
+    _add_vertex(graph_manager_copy, "d", ["C"], ["D"])
+    graph_manager.delete_vertex("a", include_neighbors=False)
+
+    assert [v["name"] for v in graph_manager.vertices] == ["b", "c"]
+    assert [v["name"] for v in graph_manager_copy.vertices] == ["a", "b", "c", "d"]
+    assert not graph_manager.search_vertex(name="d")
+    assert _edges(graph_manager_copy) == {("a", "b"), ("b", "c"), ("c", "d")}
+
+    _check_indexes(graph_manager)
+    _check_indexes(graph_manager_copy)
+
+
+def test_graph_view_vertices_can_be_used_as_indices(graph_manager):
+    """The vertices views can be used in the graph operations."""
+    graph = graph_manager.graph
+    vertex = graph_manager.search_vertex(name="b")[0]
+
+    assert graph.predecessors(vertex) == [0]
+    assert [v["name"] for v in graph.vs.select(graph.successors(vertex))] == ["c"]
+    assert [v["name"] for v in vertex.neighbors(mode="all")] == ["a", "c"]
+    assert graph.vs[vertex.index] == vertex
+
+
+def test_path_consumers_index_follows_the_mutations(tmp_path):
+    """The path index is updated with the vertices after its creation."""
+    graph_manager = GraphManager()
+
+    def _add_consumer(name, checksum):
+        graph_manager.add_vertex(
+            name,
+            f"{name}.rpz",
+            f"{name}-package-checksum",
+            "sha256",
+            f"run {name}",
+            f"{name}-command-checksum",
+            {},
+            [checksum],
+            [f"{name}-output"],
+            {"inputs": [{"key": str(tmp_path / "data.csv"), "checksum": checksum}]},
+        )
+
+    _add_consumer("a", "v1")
+    assert graph_manager.path_consumers([tmp_path / "data.csv"]) == {
+        tmp_path / "data.csv": [(0, "v1", None)]
+    }
+
+    _add_consumer("b", "v1")
+    _add_consumer("a", "v2")  # updated
+
+    consumers = graph_manager.path_consumers([tmp_path / "data.csv"])
+    assert sorted(consumers[tmp_path / "data.csv"]) == [
+        (0, "v2", None),
+        (1, "v1", None),
+    ]
+
+    graph_manager.delete_vertex("a")
+    assert graph_manager.path_consumers([tmp_path / "data.csv"]) == {
+        tmp_path / "data.csv": [(0, "v1", None)]
+    }
+
+
+def _check_indexes(graph_manager):
+    """Compare the manager indexes with the ones derived from the graph."""
+    graph = graph_manager._graph
+
+    for attribute, index in graph_manager._attributes_index.items():
+        expected_index = {}
+        for vertex in graph.vs:
+            expected_index.setdefault(vertex[attribute], set()).add(vertex.index)
+
+        assert {
+            value: indices for value, indices in index.items() if indices
+        } == expected_index
+
+    for index, attribute in (
+        (graph_manager._consumers, "inputs"),
+        (graph_manager._producers, "outputs"),
+    ):
+        expected_index = {}
+        for vertex in graph.vs:
+            for checksum in vertex[attribute]:
+                expected_index.setdefault(checksum, set()).add(vertex["name"])
+
+        assert dict(index) == expected_index
+
+    expected_edges = {
+        (producer["name"], consumer["name"])
+        for producer in graph.vs
+        for consumer in graph.vs
+        if producer.index != consumer.index
+        and set(producer["outputs"]).intersection(consumer["inputs"])
+    }
+    assert _edges(graph_manager) == expected_edges
+
+
+def test_add_vertex_links_and_defines_required_inputs(graph_manager):
+    """New vertices are linked to the producers and consumers of its files."""
+    _add_vertex(graph_manager, "d", ["C", "extra"], ["D"])
+    _add_vertex(graph_manager, "e", ["E-input"], ["B"])  # another producer of B
+
+    assert _edges(graph_manager) == {
+        ("a", "b"),
+        ("b", "c"),
+        ("c", "d"),
+        ("e", "c"),
+    }
+
+    vertex = graph_manager.search_vertex(name="d")[0]
+    assert graph_manager.decode_checksums(vertex["external_inputs_required"]) == [
+        "extra"
+    ]
+
+    # the new producer of `B` is more recent than its consumer (and its descendants).
+    assert [vertex["name"] for vertex in graph_manager.outdated_vertices()] == [
+        "c",
+        "d",
+    ]
+    _check_indexes(graph_manager)
+
+
+def test_update_vertex_marks_descendants_outdated(graph_manager):
+    """Updating a vertex outdates all its descendants (only)."""
+    _add_vertex(graph_manager, "a", ["raw"], ["A"])
+
+    assert _status(graph_manager, "a") == VertexStatus.Updated
+    assert _status(graph_manager, "b") == VertexStatus.Outdated
+    assert _status(graph_manager, "c") == VertexStatus.Outdated
+
+    assert [vertex["name"] for vertex in graph_manager.outdated_vertices()] == [
+        "b",
+        "c",
+    ]
+
+    # re-executing the outdated vertices (in topological order).
+    _add_vertex(graph_manager, "b", ["A"], ["B"])
+    assert _status(graph_manager, "c") == VertexStatus.Outdated
+
+    _add_vertex(graph_manager, "c", ["B"], ["C"])
+    assert not graph_manager.is_outdated
+
+    _add_vertex(graph_manager, "c", ["B"], ["C"])  # leaf update
+    assert not graph_manager.is_outdated
+
+    _check_indexes(graph_manager)
+
+
+def test_mark_vertices_updated_keeps_the_update_date(graph_manager):
+    """Confirmed vertices are updated without changing its update date."""
+    _add_vertex(graph_manager, "a", ["raw"], ["A"])
+    updated_in = graph_manager.search_vertex(name="b")[0]["updated_in"]
+
+    graph_manager.mark_vertices_updated(["b"])
+
+    assert _status(graph_manager, "b") == VertexStatus.Updated
+    assert _status(graph_manager, "c") == VertexStatus.Outdated
+    assert graph_manager.search_vertex(name="b")[0]["updated_in"] == updated_in
+
+    _check_indexes(graph_manager)
+
+
+@pytest.mark.parametrize(
+    "include_neighbors,remaining_vertices",
+    [(True, {"a"}), (False, {"a", "c"})],
+)
+def test_delete_vertex(graph_manager, include_neighbors, remaining_vertices):
+    """The vertex (and optionally its descendants) are removed with its edges."""
+    graph_manager.delete_vertex("b", include_neighbors=include_neighbors)
+
+    assert set(graph_manager.graph.vs["name"]) == remaining_vertices
+    assert _edges(graph_manager) == set()
+    assert not graph_manager.search_vertex(name="b")
+
+    if not include_neighbors:
+        # the input of `c` is not produced by the graph vertices anymore.
+        vertex = graph_manager.search_vertex(name="c")[0]
+        assert graph_manager.decode_checksums(vertex["external_inputs_required"]) == [
+            "B"
+        ]
+
+    _check_indexes(graph_manager)
+
+
+def test_batch_defers_the_derived_state(graph_manager):
+    """The derived state is only defined when the outermost batch is committed."""
+    with graph_manager.batch():
+        with graph_manager.batch():
+            _add_vertex(graph_manager, "d", ["C", "extra"], ["D"])
+
+        _add_vertex(graph_manager, "a", ["raw"], ["A"])
+
+        # nested batch: not committed yet.
+        assert not graph_manager.is_outdated
+        assert (
+            list(graph_manager._graph.vs.find(name="d")["external_inputs_required"])
+            == []
+        )
+
+    assert [vertex["name"] for vertex in graph_manager.outdated_vertices()] == [
+        "b",
+        "c",
+        "d",
+    ]
+
+    vertex = graph_manager.search_vertex(name="d")[0]
+    assert graph_manager.decode_checksums(vertex["external_inputs_required"]) == [
+        "extra"
+    ]
+
+    _check_indexes(graph_manager)
+
+
+def test_batch_is_committed_on_errors(graph_manager):
+    """The changes made before an error in a batch are committed."""
+    with pytest.raises(RuntimeError):
+        with graph_manager.batch():
+            _add_vertex(graph_manager, "a", ["raw"], ["A"])
+            raise RuntimeError()
+
+    assert _status(graph_manager, "c") == VertexStatus.Outdated
+    _check_indexes(graph_manager)
+
+
+def test_indexes_are_consistent_after_many_mutations():
+    """Random sequences of mutations keep the indexes consistent with the graph."""
+    generator = random.Random(7)
+    graph_manager = GraphManager()
+
+    for step in range(80):
+        name = f"v{generator.randrange(20)}"
+        inputs = [f"f{file}" for file in generator.sample(range(25), 2)]
+        outputs = [f"f{file}" for file in generator.sample(range(25), 1)]
+
+        operation = generator.random()
+        if operation < 0.7:
+            _add_vertex(graph_manager, name, inputs, outputs)
+        elif operation < 0.85:
+            with graph_manager.batch():
+                for _ in range(3):
+                    _add_vertex(
+                        graph_manager,
+                        f"v{generator.randrange(20)}",
+                        [f"f{file}" for file in generator.sample(range(25), 2)],
+                        [f"f{generator.randrange(25)}"],
+                    )
+        elif graph_manager.search_vertex(name=name):
+            graph_manager.delete_vertex(
+                name, include_neighbors=generator.random() < 0.3
+            )
+
+        _check_indexes(graph_manager)
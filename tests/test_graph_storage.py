@@ -0,0 +1,152 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""SQLite Graph Storage tests."""
+
+import pickle
+
+import pytest
+
+from storm_core.index.graph.manager import GraphManager, VertexStatus
+from storm_core.index.graph.storage.sqlite import (
+    LazyVertexMetadata,
+    SQLiteGraphStorage,
+)
+
+
+def _add_vertex(graph_manager, name, inputs, outputs):
+    """Add a vertex (the name is used in the metadata)."""
+    graph_manager.add_vertex(
+        name,
+        f"{name}.rpz",
+        f"{name}-package-checksum",
+        "sha256",
+        f"run {name}",
+        f"{name}-command-checksum",
+        {"split_fnc": str.split},
+        inputs,
+        outputs,
+        {"description": f"execution {name}", "tags": [name]},
+    )
+
+
+def _snapshot(graph_manager):
+    """Vertices (attributes) and edges (names) of a graph manager."""
+    graph = graph_manager.graph
+
+    vertices = {
+        vertex["name"]: {
+            "status": vertex["status"],
+            "updated_in": vertex["updated_in"],
+            "command_checksum": vertex["command_checksum"],
+            "inputs": graph_manager.decode_checksums(vertex["inputs"]),
+            "outputs": graph_manager.decode_checksums(vertex["outputs"]),
+            "external_inputs_required": graph_manager.decode_checksums(
+                vertex["external_inputs_required"]
+            ),
+            "metadata": dict(vertex["metadata"]),
+        }
+        for vertex in graph.vs
+    }
+    edges = {
+        (graph.vs[source]["name"], graph.vs[target]["name"])
+        for source, target in graph.get_edgelist()
+    }
+    return vertices, edges
+
+
+def _reload(path):
+    return GraphManager(storage=SQLiteGraphStorage(path))
+
+
+@pytest.fixture
+def storage_path(tmp_path):
+    return tmp_path / "graph.sqlite"
+
+
+@pytest.fixture
+def graph_manager(storage_path):
+    """Persisted graph manager with the ``a -> b -> c`` chain."""
+    graph_manager = GraphManager(storage=SQLiteGraphStorage(storage_path))
+
+    _add_vertex(graph_manager, "a", ["raw"], ["A"])
+    _add_vertex(graph_manager, "b", ["A"], ["B"])
+    _add_vertex(graph_manager, "c", ["B"], ["C"])
+
+    return graph_manager
+
+
+def test_vertices_and_edges_are_reloaded(graph_manager, storage_path):
+    """The reloaded graph has the same vertices (and attributes) and edges."""
+    reloaded_graph_manager = _reload(storage_path)
+
+    assert _snapshot(reloaded_graph_manager) == _snapshot(graph_manager)
+    assert _snapshot(reloaded_graph_manager)[1] == {("a", "b"), ("b", "c")}
+
+    # the indexes are built from the loaded graph.
+    assert [
+        vertex["name"] for vertex in reloaded_graph_manager.search_vertex(name="b")
+    ] == ["b"]
+    assert not reloaded_graph_manager.is_outdated
+
+
+def test_status_and_updates_are_reloaded(graph_manager, storage_path):
+    """Status changes (e.g., outdated descendants) and batches are persisted."""
+    _add_vertex(graph_manager, "a", ["raw"], ["A"])
+
+    with graph_manager.batch():
+        _add_vertex(graph_manager, "d", ["C"], ["D"])
+        _add_vertex(graph_manager, "e", ["D"], ["E"])
+
+    reloaded_graph_manager = _reload(storage_path)
+    vertices, edges = _snapshot(reloaded_graph_manager)
+
+    assert _snapshot(graph_manager) == (vertices, edges)
+    assert vertices["b"]["status"] == VertexStatus.Outdated
+    assert vertices["c"]["status"] == VertexStatus.Outdated
+    assert {("c", "d"), ("d", "e")} <= edges
+
+    graph_manager.mark_vertices_updated(["b", "c", "d", "e"])
+    assert not _reload(storage_path).is_outdated
+
+
+@pytest.mark.parametrize("include_neighbors", [False, True])
+def test_deletions_are_reloaded(graph_manager, storage_path, include_neighbors):
+    """Deleted vertices (and their edges) are removed from the storage."""
+    graph_manager.delete_vertex("b", include_neighbors=include_neighbors)
+
+    vertices, edges = _snapshot(_reload(storage_path))
+
+    assert (vertices, edges) == _snapshot(graph_manager)
+    assert set(vertices) == ({"a"} if include_neighbors else {"a", "c"})
+    assert not edges
+
+
+def test_metadata_is_loaded_on_demand(graph_manager, storage_path):
+    """The reloaded metadata is only read when accessed (and copied as a plain dict)."""
+    reloaded_graph_manager = _reload(storage_path)
+    graph = reloaded_graph_manager._graph
+
+    assert all(
+        isinstance(metadata, LazyVertexMetadata) and not metadata.is_loaded
+        for metadata in graph.vs["metadata"]
+    )
+
+    metadata = graph.vs.find(name="b")["metadata"]
+    assert metadata["description"] == "execution b"
+    assert metadata.is_loaded
+    assert not graph.vs.find(name="a")["metadata"].is_loaded
+
+    assert pickle.loads(pickle.dumps(metadata)) == {
+        "description": "execution b",
+        "tags": ["b"],
+    }
+    assert type(pickle.loads(pickle.dumps(metadata))) is dict
+
+    # the unchanged (not loaded) metadata is kept after other updates.
+    _add_vertex(reloaded_graph_manager, "d", ["C"], ["D"])
+    assert _snapshot(_reload(storage_path)) == _snapshot(reloaded_graph_manager)
@@ -0,0 +1,80 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Files hashing tests."""
+
+from unittest import mock
+
+import pytest
+
+import storm_core.helper.hasher
+from storm_core.helper.hasher import hash_file, hash_files, validate_checksum
+
+
+@pytest.fixture
+def files(tmp_path):
+    """Files with different sizes (so they are not hashed in the creation order)."""
+    files = []
+    for idx in range(20):
+        file_path = tmp_path / f"file-{idx}.bin"
+        file_path.write_bytes(bytes([idx]) * ((20 - idx) * 10_000))
+
+        files.append(str(file_path))
+    return files
+
+
+@pytest.mark.parametrize("workers", [None, 1, 4])
+@pytest.mark.parametrize("algorithm", ["md5", "merkle-sha256"])
+def test_hash_files_preserves_the_order(files, workers, algorithm):
+    """The checksums are returned in the order of the files."""
+    checksums = hash_files(files, algorithm, workers=workers)
+
+    assert [checksum["key"] for checksum in checksums] == files
+    assert checksums == [hash_file(file_path, algorithm) for file_path in files]
+    assert len({checksum["checksum"] for checksum in checksums}) == len(files)
+
+
+@pytest.mark.parametrize("workers", [None, 1])
+def test_hash_files_propagates_errors(files, workers):
+    """An error hashing a file (e.g., a missing file) is raised by ``hash_files``."""
+    with pytest.raises(FileNotFoundError):
+        hash_files([*files[:5], "/missing/file.bin", *files[5:]], workers=workers)
+
+    with pytest.raises(ValueError):
+        hash_files(files, "merkle-unknown", workers=workers)
+
+
+def test_hash_files_does_not_nest_thread_pools(files):
+    """When many files are hashed in threads, the chunks of each file are not hashed in other threads."""
+    with mock.patch.object(
+        storm_core.helper.hasher,
+        "hash_file_tree",
+        wraps=storm_core.helper.hasher.hash_file_tree,
+    ) as hash_file_tree:
+        hash_files(files, "merkle-sha256", workers=4)
+        assert {call.kwargs["workers"] for call in hash_file_tree.call_args_list} == {1}
+
+        hash_file_tree.reset_mock()
+
+        # a single file uses the available workers.
+        hash_files(files[:1], "merkle-sha256", workers=4)
+        assert hash_file_tree.call_args.kwargs["workers"] == 4
+
+
+def test_hash_files_of_empty_list():
+    """No files, no checksums."""
+    assert hash_files([]) == []
+
+
+def test_validate_checksum(files):
+    """A file with a different checksum is invalid."""
+    checksum = hash_file(files[0])["checksum"]
+
+    validate_checksum(files[0], checksum)
+
+    with pytest.raises(RuntimeError):
+        validate_checksum(files[1], checksum)
@@ -0,0 +1,253 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Execution Indexer and search tests."""
+
+import copy
+import json
+
+import pytest
+
+from storm_core.execution.command import ExecutableCommand
+from storm_core.helper.cache import InMemoryFileHashCache
+from storm_core.helper.hasher import hash_file
+from storm_core.index.graph import GraphManager
+from storm_core.index.graph.manager import VertexStatus
+from storm_core.index.indexer import ExecutionIndexer
+from storm_core.index.model import ExecutionCompendium
+
+
+def _compendium(name, inputs, outputs, input_paths=None):
+    """Create an execution compendium (the files keys are built from its checksums)."""
+    input_paths = input_paths or {}
+
+    return ExecutionCompendium(
+        name,
+        ExecutableCommand(f"python {name}.py"),
+        {
+            "key": f"/storage/{name}/package.rpz",
+            "checksum": f"{name}-package",
+            "algorithm": "md5",
+        },
+        {
+            "inputs": [
+                {
+                    "key": input_paths.get(checksum, f"/data/{checksum}"),
+                    "checksum": checksum,
+                    "algorithm": "md5",
+                }
+                for checksum in inputs
+            ],
+            "outputs": [
+                {"key": f"/data/{checksum}", "checksum": checksum}
+                for checksum in outputs
+            ],
+        },
+    )
+
+
+@pytest.fixture
+def execution_indexer():
+    """Indexer with the ``a -> b -> c`` chain."""
+    execution_indexer = ExecutionIndexer(GraphManager())
+
+    execution_indexer.index_executions(
+        [
+            _compendium("a", ["raw"], ["A"]),
+            _compendium("b", ["A"], ["B"]),
+            _compendium("c", ["B"], ["C"]),
+        ]
+    )
+    return execution_indexer
+
+
+def _query(execution_indexer, name):
+    return next(execution_indexer.search.query.query(name=name))[0]
+
+
+def test_compendium_metadata_is_not_shared(execution_indexer):
+    """Changes in the metadata of a query result are not visible in other results."""
+    compendium = _query(execution_indexer, "b")
+
+    compendium.metadata["inputs"].append({"key": "/data/x", "checksum": "x"})
+    compendium.metadata["inputs"][0]["checksum"] = "changed"
+    compendium.inputs.clear()
+
+    compendium = _query(execution_indexer, "b")
+    assert [file["checksum"] for file in compendium.metadata["inputs"]] == ["A"]
+    assert [file["checksum"] for file in compendium.inputs] == ["A"]
+
+    vertex = execution_indexer.graph_manager.search_vertex(name="b")[0]
+    assert [file["checksum"] for file in vertex["metadata"]["inputs"]] == ["A"]
+
+    # plain (serializable) structures.
+    assert json.loads(json.dumps(compendium.metadata)) == copy.deepcopy(
+        compendium.metadata
+    )
+    # the vertices views also return copies of the nested values.
+    vertex["metadata"]["inputs"].clear()
+    assert execution_indexer.graph_manager.search_vertex(name="b")[0]["metadata"][
+        "inputs"
+    ]
+
+
+def test_neighborhood_query(execution_indexer):
+    """The neighborhood of each matched compendium is found (in a single query)."""
+    execution_indexer.index_execution(_compendium("d", ["A"], ["D"]))
+
+    results = {
+        compendium.name: [neighbor.name for neighbor in neighborhood]
+        for compendium, neighborhood, _ in execution_indexer.search.neighborhood.query(
+            "out", name_in=["a", "b", "d"]
+        )
+    }
+    assert set(results) == {"a", "b", "d"}
+    assert results["a"][0] == "a" and set(results["a"]) == {"a", "b", "c", "d"}
+    assert results["b"] == ["b", "c"]
+    assert results["d"] == ["d"]
+
+    results = {
+        compendium.name: [neighbor.name for neighbor in neighborhood]
+        for compendium, neighborhood, _ in execution_indexer.search.neighborhood.query(
+            "in", name_in=["c", "d"]
+        )
+    }
+    assert results == {"c": ["c", "b", "a"], "d": ["d", "a"]}
+
+    assert not list(execution_indexer.search.neighborhood.query("out", name="x"))
+
+
+def _names(results):
+    return [compendium.name for compendium, _ in results]
+
+
+def test_producers_and_consumers(execution_indexer):
+    """The compendia that produced and used each file."""
+    execution_indexer.index_execution(_compendium("d", ["A", "raw"], ["D"]))
+    provenance = execution_indexer.search.provenance
+
+    assert _names(provenance.producers("A")) == ["a"]
+    assert sorted(_names(provenance.consumers("A"))) == ["b", "d"]
+    assert sorted(_names(provenance.consumers("raw"))) == ["a", "d"]
+
+    # external inputs have no producers, and final outputs have no consumers.
+    assert provenance.producers("raw") == []
+    assert provenance.consumers("C") == []
+    assert provenance.producers("unknown") == []
+
+    producers = provenance.query(["A", "B", "unknown"], mode="producers")
+    assert {checksum: _names(results) for checksum, results in producers.items()} == {
+        "A": ["a"],
+        "B": ["b"],
+        "unknown": [],
+    }
+    assert all(status == VertexStatus.Updated for _, status in producers["A"])
+
+    with pytest.raises(ValueError):
+        provenance.query(["A"], mode="descendants")
+
+
+def test_provenance_follows_the_index_changes(execution_indexer):
+    """Re-indexed and deindexed compendia are updated in the provenance queries."""
+    provenance = execution_indexer.search.provenance
+
+    # ``b`` now uses ``raw`` (instead of ``A``).
+    execution_indexer.index_execution(_compendium("b", ["raw"], ["B"]))
+
+    assert provenance.consumers("A") == []
+    assert sorted(_names(provenance.consumers("raw"))) == ["a", "b"]
+
+    execution_indexer.deindex_execution("c")
+    assert provenance.producers("C") == []
+    assert provenance.consumers("B") == []
+
+
+@pytest.fixture
+def raw_file(tmp_path):
+    """Input file of the ``a`` compendium (and its checksum)."""
+    raw_file = tmp_path / "raw.csv"
+    raw_file.write_text("1,2,3")
+
+    return raw_file, hash_file(raw_file, "md5")["checksum"]
+
+
+@pytest.fixture
+def files_execution_indexer(raw_file):
+    """Indexer with the ``a -> b -> c`` chain (``a`` uses the ``raw_file``)."""
+    raw_file, raw_checksum = raw_file
+    execution_indexer = ExecutionIndexer(GraphManager())
+
+    execution_indexer.index_executions(
+        [
+            _compendium("a", [raw_checksum], ["A"], {raw_checksum: str(raw_file)}),
+            _compendium("b", ["A"], ["B"]),
+            _compendium("c", ["B"], ["C"]),
+            _compendium("x", ["other"], ["X"]),
+        ]
+    )
+    return execution_indexer
+
+
+def test_impacted_compendia_by_checksum(files_execution_indexer):
+    """The compendia that used the changed files and their descendants (in topological order)."""
+    faceted = files_execution_indexer.search.faceted
+
+    assert _names(faceted.impacted_compendia(checksums=["A"])) == ["b", "c"]
+    assert _names(faceted.impacted_compendia(checksums=["C", "unknown"])) == []
+    assert sorted(_names(faceted.impacted_compendia(checksums=["B", "other"]))) == [
+        "c",
+        "x",
+    ]
+    assert _names(faceted.impacted_compendia()) == []
+
+    # the graph is not changed by the query.
+    assert not files_execution_indexer.graph_manager.is_outdated
+
+
+@pytest.mark.parametrize("hash_cache", [None, InMemoryFileHashCache()])
+def test_impacted_compendia_by_file_path(files_execution_indexer, raw_file, hash_cache):
+    """The files are hashed and compared with the checksums recorded in the inputs."""
+    raw_file, _ = raw_file
+    faceted = files_execution_indexer.search.faceted
+
+    def _impacted(files):
+        return _names(faceted.impacted_compendia(files=files, hash_cache=hash_cache))
+
+    # unchanged files, and files not used as input.
+    assert _impacted([raw_file]) == []
+    assert _impacted([str(raw_file.parent / "unknown.csv")]) == []
+
+    raw_file.write_text("1,2,3,4")
+    assert _impacted([raw_file]) == ["a", "b", "c"]
+
+    # the paths are resolved.
+    assert _impacted([raw_file.parent / "." / "raw.csv"]) == ["a", "b", "c"]
+
+    raw_file.unlink()
+    assert _impacted([str(raw_file)]) == ["a", "b", "c"]
+
+
+def test_path_index_is_updated_after_deindexing(files_execution_indexer, raw_file):
+    """Deindexed (or re-indexed) compendia are no longer found by the input files paths."""
+    raw_file, raw_checksum = raw_file
+    faceted = files_execution_indexer.search.faceted
+
+    raw_file.write_text("changed")
+    assert _names(faceted.impacted_compendia(files=[raw_file])) == ["a", "b", "c"]
+
+    files_execution_indexer.deindex_execution("a")
+    assert _names(faceted.impacted_compendia(files=[raw_file])) == []
+
+    # the new consumer of the file is indexed by path.
+    files_execution_indexer.index_execution(
+        _compendium("d", [raw_checksum], ["D"], {raw_checksum: str(raw_file)})
+    )
+    assert _names(faceted.impacted_compendia(files=[raw_file])) == ["d"]
+
+    # re-indexed with another input file.
+    files_execution_indexer.index_execution(_compendium("d", ["other"], ["D"]))
+    assert _names(faceted.impacted_compendia(files=[raw_file])) == []
@@ -0,0 +1,96 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Pattern matcher tests."""
+
+import fnmatch
+import pickle
+
+import pytest
+
+from storm_core.helper.matcher import PatternMatcher
+
+PATTERNS = [
+    "/data/*.txt",
+    "/data/file?.csv",
+    "/x/[ab]?/*",
+    "/x/[!ab]*",
+    "/brackets/[[]raw[]].txt",
+    "/q/**",
+    "**/*.pyc",
+    "*cache*",
+    "/lit/file",
+    "/special/a+b (1).$dat^",
+    "/special/{x,y}|z.txt",
+    "/dots/.*",
+]
+"""Patterns with wildcards, character sets, ``**`` and regular expression special characters."""
+
+PATHS = [
+    "/data/a.txt",
+    "/data/sub/a.txt",
+    "/data/a.TXT",
+    "/data/file1.csv",
+    "/data/file10.csv",
+    "/x/a1/z",
+    "/x/c1/z",
+    "/x/b",
+    "/x/c",
+    "/brackets/[raw].txt",
+    "/brackets/r.txt",
+    "/q",
+    "/q/a/b",
+    "/project/module/file.pyc",
+    "file.pyc",
+    "/p/__cache__/x",
+    "/lit/file",
+    "/lit/file2",
+    "/special/a+b (1).$dat^",
+    "/special/aab (1).$dat^",
+    "/special/{x,y}|z.txt",
+    "/special/x.txt",
+    "/dots/.hidden",
+    "/dots/visible",
+    "/multi\nline",
+]
+
+
+@pytest.mark.parametrize("pattern", PATTERNS)
+def test_single_pattern_matches_as_fnmatch(pattern):
+    """Each pattern matches the same paths matched by ``fnmatch``."""
+    matcher = PatternMatcher([pattern])
+
+    for path in PATHS:
+        assert matcher.match(path) == fnmatch.fnmatch(path, pattern), path
+
+
+def test_combined_patterns_match_as_fnmatch():
+    """The combined patterns match the paths matched by any pattern with ``fnmatch``."""
+    matcher = PatternMatcher(PATTERNS)
+
+    for path in PATHS:
+        assert matcher.match(path) == any(
+            fnmatch.fnmatch(path, pattern) for pattern in PATTERNS
+        ), path
+
+
+def test_empty_and_duplicated_patterns():
+    """An empty matcher does not match any path, and duplicated patterns are removed."""
+    assert not PatternMatcher([]).match("/data/a.txt")
+    assert not PatternMatcher([])
+
+    matcher = PatternMatcher(["*.txt", "*.csv", "*.txt"])
+    assert matcher.patterns == ("*.txt", "*.csv")
+    assert len(matcher) == 2
+
+
+def test_matcher_can_be_pickled():
+    """The pickled matcher (e.g., sent to a worker) keeps its patterns."""
+    matcher = pickle.loads(pickle.dumps(PatternMatcher(PATTERNS)))
+
+    assert matcher.match("/lit/file")
+    assert not matcher.match("/lit/file2")
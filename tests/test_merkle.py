@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Chunked (Merkle tree) file hashing tests."""
+
+import hashlib
+
+import pytest
+
+from storm_core.helper.merkle import (
+    hash_file_tree,
+    is_merkle_algorithm,
+    merkle_root,
+    verify_file_chunks,
+)
+
+CHUNK_SIZE = 1024
+
+
+def _write(path, content):
+    path.write_bytes(content)
+    return path
+
+
+@pytest.fixture
+def content():
+    """Content with 5 chunks (the last one is partial)."""
+    return bytes(range(256)) * 18
+
+
+@pytest.mark.parametrize(
+    "size,chunks", [(0, 1), (1, 1), (1024, 1), (1025, 2), (4608, 5)]
+)
+def test_leaf_chunking(tmp_path, size, chunks):
+    """The file is split in chunks of ``chunk_size`` bytes (an empty file has one empty leaf)."""
+    content = bytes(idx % 251 for idx in range(size))
+    file_tree = hash_file_tree(
+        _write(tmp_path / "file.bin", content), chunk_size=CHUNK_SIZE
+    )
+
+    assert len(file_tree["chunks"]) == chunks
+    assert file_tree["chunk_size"] == CHUNK_SIZE
+
+    # each leaf is the (prefixed) digest of its chunk.
+    assert file_tree["chunks"] == [
+        hashlib.sha256(b"\x00" + content[offset : offset + CHUNK_SIZE]).hexdigest()
+        for offset in range(0, max(size, 1), CHUNK_SIZE)
+    ]
+
+
+def test_root_of_a_single_chunk_is_the_leaf(tmp_path):
+    """Small files (a single chunk) have the leaf digest as root."""
+    file_tree = hash_file_tree(_write(tmp_path / "file.bin", b"data"))
+
+    assert file_tree["checksum"] == file_tree["chunks"][0]
+
+
+def test_root_combines_the_leaves_in_pairs():
+    """The nodes are hashed in pairs and the odd node of a level is promoted."""
+    leaves = [hashlib.sha256(bytes([idx])).hexdigest() for idx in range(3)]
+
+    def _node(left, right):
+        return hashlib.sha256(b"\x01" + left + right).digest()
+
+    left, middle, right = (bytes.fromhex(leaf) for leaf in leaves)
+    assert (
+        merkle_root(leaves, "merkle-sha256") == _node(_node(left, middle), right).hex()
+    )
+
+
+@pytest.mark.parametrize("workers", [None, 1, 3])
+def test_root_is_the_same_across_repeated_hashes(tmp_path, content, workers):
+    """The root does not depend on the number of workers (or on the file path)."""
+    first_tree = hash_file_tree(
+        _write(tmp_path / "first.bin", content), chunk_size=CHUNK_SIZE
+    )
+    second_tree = hash_file_tree(
+        _write(tmp_path / "second.bin", content),
+        chunk_size=CHUNK_SIZE,
+        workers=workers,
+    )
+
+    assert second_tree["checksum"] == first_tree["checksum"]
+    assert second_tree["chunks"] == first_tree["chunks"]
+    assert merkle_root(first_tree["chunks"], "merkle-sha256") == first_tree["checksum"]
+
+    # other algorithms and chunk sizes are not comparable.
+    assert (
+        hash_file_tree(tmp_path / "first.bin", "merkle-md5", CHUNK_SIZE)["checksum"]
+        != first_tree["checksum"]
+    )
+    assert (
+        hash_file_tree(tmp_path / "first.bin", chunk_size=2 * CHUNK_SIZE)["checksum"]
+        != first_tree["checksum"]
+    )
+
+
+@pytest.mark.parametrize(
+    "change,changed_chunks",
+    [
+        (lambda content: content, []),
+        (lambda content: content[:10] + b"X" + content[11:], [0]),
+        (lambda content: content[:3000] + b"X" + content[3001:], [2]),
+        (lambda content: content[:-1] + b"X", [4]),
+        (lambda content: content + b"X" * CHUNK_SIZE, [4, 5]),
+        (lambda content: content[: 2 * CHUNK_SIZE], [2, 3, 4]),
+    ],
+)
+def test_changed_chunks_are_located(tmp_path, content, change, changed_chunks):
+    """The chunks changed (or added/removed) since the tree hash are found."""
+    file_path = _write(tmp_path / "file.bin", content)
+    file_tree = hash_file_tree(file_path, chunk_size=CHUNK_SIZE)
+
+    _write(file_path, change(content))
+
+    assert verify_file_chunks(file_path, file_tree) == changed_chunks
+    assert (
+        hash_file_tree(file_path, chunk_size=CHUNK_SIZE)["checksum"]
+        == file_tree["checksum"]
+    ) == (not changed_chunks)
+
+
+def test_algorithm_names():
+    """Only the ``merkle-`` algorithms with ``hashlib`` base algorithms are tree hash algorithms."""
+    assert is_merkle_algorithm("merkle-sha256")
+    assert not is_merkle_algorithm("sha256")
+
+    with pytest.raises(ValueError):
+        merkle_root(["00"], "merkle-unknown")
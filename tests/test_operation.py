@@ -0,0 +1,131 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reproducible operations tests."""
+
+from types import SimpleNamespace
+
+import pytest
+
+from storm_core.execution.command import ExecutableCommand
+from storm_core.execution.job.base import JobResult, JobStatus
+from storm_core.index.graph import GraphManager
+from storm_core.index.indexer import ExecutionIndexer
+from storm_core.index.model import ExecutionCompendium
+from storm_core.op.operation import ReproducibleOperations
+
+EXECUTIONS = {
+    # name: (inputs, outputs)
+    "a": (["raw"], ["A"]),
+    "b": (["A"], ["B"]),
+    "y": (["raw-y"], ["Y"]),
+    "w": (["Y"], ["W"]),
+    "c": (["B", "W"], ["C"]),
+}
+"""Executions of the tests (``a -> b -> c`` and ``y -> w -> c``)."""
+
+
+def _compendium(name):
+    inputs, outputs = EXECUTIONS[name]
+
+    return ExecutionCompendium(
+        name,
+        ExecutableCommand(f"python {name}.py"),
+        {"key": f"{name}.rpz", "checksum": f"{name}-package", "algorithm": "md5"},
+        {
+            "inputs": [
+                {"key": f"/data/{checksum}", "checksum": checksum}
+                for checksum in inputs
+            ],
+            "outputs": [
+                {"key": f"/data/{checksum}", "checksum": checksum}
+                for checksum in outputs
+            ],
+        },
+    )
+
+
+class _ExecutionEngine:
+    """Execution engine that "re-executes" the jobs producing the same outputs."""
+
+    def __init__(self, storage_dir):
+        self.files_config = SimpleNamespace(storage_dir=str(storage_dir))
+        self.executed = []
+
+    def execute(self, execution_plan, states=None):
+        results = []
+        for job in execution_plan.jobs():
+            compendium = _compendium(job.execution_id)
+            self.executed.append(compendium.name)
+
+            results.append(
+                JobResult(
+                    compendium.name,
+                    JobStatus.SUCCESSFULLY,
+                    "",
+                    None,
+                    compendium.command,
+                    compendium_package=compendium.compendium_package,
+                    metadata=compendium.metadata,
+                )
+            )
+        return results
+
+
+@pytest.fixture
+def operations(tmp_path):
+    for name in EXECUTIONS:
+        (tmp_path / name).mkdir()
+
+    execution_indexer = ExecutionIndexer(GraphManager())
+    for name in EXECUTIONS:
+        execution_indexer.index_execution(_compendium(name))
+
+    return ReproducibleOperations(_ExecutionEngine(tmp_path), execution_indexer)
+
+
+def _vertex(operations, name):
+    return operations._execution_indexer.graph_manager.search_vertex(name=name)[0]
+
+
+def test_early_cutoff_skips_descendants_of_unchanged_outputs(operations):
+    """In a chain where the middle output is unchanged, the last compendium is not re-executed."""
+    graph_manager = operations._execution_indexer.graph_manager
+
+    # re-executing ``a`` (``b`` and ``c`` are outdated).
+    operations._execution_indexer.index_execution(_compendium("a"))
+
+    assert {vertex["name"] for vertex in graph_manager.outdated_vertices()} == {
+        "b",
+        "c",
+    }
+
+    results = operations.update(early_cutoff=True)
+
+    assert operations._execution_engine.executed == ["b"]
+    assert [compendium.name for compendium in results] == ["b"]
+    assert not graph_manager.is_outdated
+
+    # the skipped compendium is confirmed after the re-execution of its predecessor.
+    assert (
+        _vertex(operations, "c")["updated_in"] >= _vertex(operations, "b")["updated_in"]
+    )
+
+
+def test_skipped_compendia_are_not_stale_in_later_updates(operations):
+    """A compendium skipped by the early cutoff is not re-executed by the next early cutoff update."""
+    operations._execution_indexer.index_execution(_compendium("a"))
+    operations.update(early_cutoff=True)
+
+    # re-executing ``y`` (``w`` and ``c`` are outdated, ``b`` is up-to-date).
+    operations._execution_engine.executed.clear()
+    operations._execution_indexer.index_execution(_compendium("y"))
+
+    operations.update(early_cutoff=True)
+
+    assert operations._execution_engine.executed == ["w"]
+    assert not operations._execution_indexer.graph_manager.is_outdated
@@ -0,0 +1,99 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Execution plan tests."""
+
+from unittest import mock
+
+import pytest
+from igraph import Graph
+
+from storm_core.execution.plan import ExecutionPlan
+
+
+def _plan(edges, names="abcde"):
+    """Execution plan (the job of each vertex is its name)."""
+    names = list(names)
+
+    return ExecutionPlan(
+        Graph(
+            n=len(names),
+            edges=[
+                (names.index(source), names.index(target)) for source, target in edges
+            ],
+            directed=True,
+            vertex_attrs={"name": names, "job": names},
+        )
+    )
+
+
+@pytest.fixture
+def diamond_plan():
+    """Diamond ``a -> (b, c) -> d`` with the ``b -> e -> d`` path and the ``a -> d`` shortcut."""
+    return _plan(
+        [
+            ("a", "b"),
+            ("a", "c"),
+            ("b", "d"),
+            ("c", "d"),
+            ("b", "e"),
+            ("e", "d"),
+            ("a", "d"),
+        ]
+    )
+
+
+def test_wavefronts_use_the_longest_path_levels(diamond_plan):
+    """The wave of a job is the length of the longest path from a job without predecessors."""
+    waves = [sorted(wave) for wave in diamond_plan.wavefronts()]
+
+    assert waves == [["a"], ["b", "c"], ["e"], ["d"]]
+
+
+def test_wavefronts_of_independent_jobs():
+    """Jobs without dependencies are all in the first wave (and an empty plan has no waves)."""
+    assert [sorted(wave) for wave in _plan([]).wavefronts()] == [list("abcde")]
+    assert list(_plan([], names="").wavefronts()) == []
+
+
+def test_jobs_are_in_topological_order(diamond_plan):
+    """The jobs are iterated in topological order."""
+    jobs = list(diamond_plan.jobs())
+
+    assert sorted(jobs) == list("abcde")
+    for source, target in [("a", "b"), ("b", "e"), ("e", "d"), ("c", "d")]:
+        assert jobs.index(source) < jobs.index(target)
+
+
+def test_neighbors(diamond_plan):
+    """The predecessors and successors of the jobs (unknown jobs have no neighbors)."""
+    assert sorted(diamond_plan.job_predecessors("d")) == ["a", "b", "c", "e"]
+    assert sorted(diamond_plan.job_successors("b")) == ["d", "e"]
+    assert list(diamond_plan.job_successors("d")) == []
+    assert list(diamond_plan.job_successors("x")) == []
+    assert diamond_plan.job("c") == "c" and diamond_plan.job("x") is None
+
+
+def test_structure_is_computed_once(diamond_plan):
+    """The topological order (and adjacency) is cached in the first use."""
+    jobs_graph = diamond_plan._jobs
+
+    with mock.patch.object(
+        jobs_graph, "topological_sorting", wraps=jobs_graph.topological_sorting
+    ) as topological_sorting, mock.patch.object(
+        jobs_graph, "get_adjlist", wraps=jobs_graph.get_adjlist
+    ) as get_adjlist:
+        first_order = list(diamond_plan.jobs())
+
+        list(diamond_plan.wavefronts())
+        list(diamond_plan.job_successors("a"))
+        list(diamond_plan.job_predecessors("d"))
+
+        assert list(diamond_plan.jobs()) == first_order
+
+    topological_sorting.assert_called_once()
+    assert get_adjlist.call_count == 2  # predecessors and successors
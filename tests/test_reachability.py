@@ -0,0 +1,83 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reachability index tests."""
+
+import random
+
+import pytest
+from igraph import Graph
+
+from storm_core.index.graph.reachability import ReachabilityIndex
+
+
+def _random_dag(seed, vcount=30):
+    """Random DAG (the edges follow the vertices indices)."""
+    random_generator = random.Random(seed)
+
+    return Graph(
+        n=vcount,
+        edges=[
+            tuple(sorted(random_generator.sample(range(vcount), 2)))
+            for _ in range(random_generator.randrange(2 * vcount))
+        ],
+        directed=True,
+    )
+
+
+@pytest.mark.parametrize("mode", ["out", "in", "all"])
+@pytest.mark.parametrize("seed", range(10))
+def test_reachable_matches_the_neighborhood(seed, mode):
+    """The reachable vertices are the unlimited neighborhood of the vertices."""
+    graph = _random_dag(seed)
+    reachability = ReachabilityIndex(graph)
+
+    for vertex in range(graph.vcount()):
+        expected = set(graph.neighborhood(vertex, order=graph.vcount(), mode=mode))
+
+        assert set(reachability.reachable([vertex], mode)) == expected
+        assert reachability.reachable([vertex], mode)[0] == vertex
+
+
+@pytest.mark.parametrize("mode", ["out", "in", "all"])
+@pytest.mark.parametrize("seed", range(10))
+def test_reachable_sets_match_the_single_vertex_queries(seed, mode):
+    """The batch query returns the same vertices (and order) of the single vertex queries."""
+    graph = _random_dag(seed)
+    reachability = ReachabilityIndex(graph)
+
+    vertices = random.Random(seed).sample(range(graph.vcount()), 8)
+    reachable_sets = reachability.reachable_sets(vertices, mode)
+
+    assert list(reachable_sets) == vertices
+    for vertex in vertices:
+        assert reachable_sets[vertex] == reachability.reachable([vertex], mode)
+
+
+def test_reachable_sets_with_cycles():
+    """In graphs with cycles, the batch query falls back to the single vertex queries."""
+    graph = Graph(n=4, edges=[(0, 1), (1, 2), (2, 0), (2, 3)], directed=True)
+    reachability = ReachabilityIndex(graph)
+
+    reachable_sets = reachability.reachable_sets([0, 3], "out")
+
+    assert set(reachable_sets[0]) == {0, 1, 2, 3}
+    assert reachable_sets[3] == [3]
+
+
+def test_topological_order_and_is_reachable():
+    """Descendants are sorted in topological order and the rank pruning is consistent."""
+    graph = Graph(n=4, edges=[(3, 1), (1, 0), (3, 2), (2, 0)], directed=True)
+    reachability = ReachabilityIndex(graph)
+
+    assert reachability.descendants([3])[0] == 3
+    assert reachability.descendants([3])[-1] == 0
+    assert reachability.ancestors([0])[-1] == 3
+
+    assert reachability.is_reachable(3, 0)
+    assert not reachability.is_reachable(0, 3)
+    assert not reachability.is_reachable(1, 2)
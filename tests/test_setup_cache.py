@@ -0,0 +1,142 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 Storm Project.
+#
+# storm-core is free software; you can redistribute it and/or modify it
+# under the terms of the MIT License; see LICENSE file for more details.
+
+"""Reproduction setup cache tests."""
+
+import os
+from pathlib import Path
+from unittest import mock
+
+import pytest
+
+import storm_core.execution.cache
+from storm_core.execution.cache import ReproductionSetupCache
+
+SETUP_SIZE = 2 * 500
+"""Size of each setup (the reproduction configuration and its original copy)."""
+
+
+@pytest.fixture
+def reprounzip():
+    """Stubbed reprounzip commands (the setup only creates the configuration file)."""
+
+    def _setup(package_path, reproduction_path, unpacker):
+        os.makedirs(reproduction_path)
+        Path(reproduction_path, "config.yml").write_text("x" * 500)
+
+    reprounzip = mock.Mock()
+    reprounzip.setup.side_effect = _setup
+
+    with mock.patch.multiple(
+        storm_core.execution.cache,
+        reprounzip_setup=reprounzip.setup,
+        reprounzip_reset=reprounzip.reset,
+        reprounzip_destroy=reprounzip.destroy,
+    ):
+        yield reprounzip
+
+
+@pytest.fixture
+def setup_cache(tmp_path, reprounzip):
+    """Cache with space for two setups."""
+    return ReproductionSetupCache(tmp_path / "setups", max_size=2 * SETUP_SIZE + 100)
+
+
+def _use(setup_cache, package):
+    with setup_cache.setup(f"/{package}.rpz", package) as reproduction_path:
+        return Path(reproduction_path)
+
+
+def _lock_files(setup_cache):
+    return sorted(path.name for path in setup_cache.path.glob("*.lock"))
+
+
+def test_setup_is_reused_after_reset(setup_cache, reprounzip):
+    """The setup of an unchanged package is reset (and its configuration restored)."""
+    with setup_cache.setup("/a.rpz", "a") as reproduction_path:
+        Path(reproduction_path, "config.yml").write_text("changed")
+
+    assert _use(setup_cache, "a") == Path(reproduction_path)
+    assert Path(reproduction_path, "config.yml").read_text() == "x" * 500
+
+    reprounzip.setup.assert_called_once()
+    reprounzip.reset.assert_called_once_with(reproduction_path, "docker")
+    assert setup_cache.size == SETUP_SIZE
+
+
+def test_least_recently_used_setup_is_evicted(setup_cache, reprounzip):
+    """When the disk budget is exceeded, the least recently used setups are destroyed."""
+    reproduction_a = _use(setup_cache, "a")
+    reproduction_b = _use(setup_cache, "b")
+    _use(setup_cache, "a")  # ``b`` is now the least recently used setup.
+
+    reproduction_c = _use(setup_cache, "c")
+
+    reprounzip.destroy.assert_called_once_with(str(reproduction_b), "docker")
+    assert not reproduction_b.parent.exists()
+    assert reproduction_a.exists() and reproduction_c.exists()
+    assert setup_cache.size == 2 * SETUP_SIZE
+
+    # the lock files of the evicted setups are removed.
+    assert _lock_files(setup_cache) == ["docker-a.lock", "docker-c.lock"]
+
+
+def test_setups_in_use_are_not_evicted(setup_cache, reprounzip):
+    """Locked setups (in use) are kept, even when they are the least recently used."""
+    reproduction_a = _use(setup_cache, "a")
+
+    with setup_cache.setup("/a.rpz", "a"):
+        _use(setup_cache, "b")
+        reproduction_c = _use(setup_cache, "c")
+
+        assert reproduction_a.exists()
+
+    reproduction_b = setup_cache.path / "docker-b" / "reproduction"
+    reprounzip.destroy.assert_called_once_with(str(reproduction_b), "docker")
+    assert reproduction_c.exists()
+
+
+def test_clear_removes_the_setups_and_lock_files(setup_cache, reprounzip):
+    """All setups are destroyed (and its lock files removed)."""
+    _use(setup_cache, "a")
+    _use(setup_cache, "b")
+
+    setup_cache.clear()
+
+    assert reprounzip.destroy.call_count == 2
+    assert setup_cache.size == 0
+    assert _lock_files(setup_cache) == []
+    assert not list(setup_cache.path.glob("docker-*"))
+
+
+def test_setup_in_use_is_set_up_temporarily(setup_cache, reprounzip):
+    """A package whose setup is locked is set up in a temporary directory (destroyed on exit)."""
+    with setup_cache.setup("/a.rpz", "a") as reproduction_path:
+        with setup_cache.setup("/a.rpz", "a") as temporary_reproduction_path:
+            assert temporary_reproduction_path != reproduction_path
+            assert Path(temporary_reproduction_path).exists()
+
+        reprounzip.destroy.assert_called_once_with(
+            temporary_reproduction_path, "docker"
+        )
+        assert not Path(temporary_reproduction_path).parent.exists()
+
+    assert setup_cache.size == SETUP_SIZE
+
+
+@pytest.mark.parametrize("destroy_fails", [False, True])
+def test_temporary_setup_is_destroyed(reprounzip, destroy_fails):
+    """The temporary setup is destroyed (and its directory removed) even after errors."""
+    if destroy_fails:
+        reprounzip.destroy.side_effect = RuntimeError("destroy failed")
+
+    with pytest.raises(ValueError):
+        with ReproductionSetupCache.temporary_setup("/a.rpz") as reproduction_path:
+            raise ValueError("reproduction failed")
+
+    reprounzip.destroy.assert_called_once_with(reproduction_path, "docker")
+    assert not Path(reproduction_path).parent.exists()